@@ -0,0 +1,4 @@
+from .bridge_thread import BridgeThread as BridgeThread
+from .aio_lo import AioLo as AioLo
+
+__all__ = ["AioLo", "BridgeThread"]
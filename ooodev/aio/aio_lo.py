@@ -0,0 +1,409 @@
+from __future__ import annotations
+import threading
+from typing import Any, Callable, Dict, Iterable, List, TypeVar, TYPE_CHECKING
+
+from ooodev.aio.bridge_thread import BridgeThread
+
+if TYPE_CHECKING:
+    from com.sun.star.frame import XComponentLoader
+    from com.sun.star.frame import XFrame
+    from com.sun.star.frame import XStorable
+    from com.sun.star.lang import XComponent
+    from ooo.dyn.beans.property_value import PropertyValue
+    from ooodev.conn import cache as mCache
+    from ooodev.conn import connectors
+    from ooodev.conn.connect import ConnectBase
+    from ooodev.loader.inst.doc_type import DocType as LoDocType, DocTypeStr as LoDocTypeStr
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.loader.inst.options import Options as LoOptions
+    from ooodev.utils.type_var import PathOrStr, TupleArray
+
+_T = TypeVar("_T")
+
+# bridge threads shared by the AioLo instances of a LoInst, entries are [bridge, number of AioLo instances].
+_bridges: Dict[Any, List[Any]] = {}
+_bridges_lock = threading.Lock()
+# key of the bridge of AioLo instances created before the default Lo instance is loaded.
+_DEFAULT_KEY = "default"
+
+
+def _acquire_bridge(key: Any, max_pending: int) -> List[Any]:
+    with _bridges_lock:
+        entry = _bridges.get(key)
+        if entry is None or entry[0].closed:
+            entry = [BridgeThread(name=f"ooodev-bridge-{id(key):x}", max_pending=max_pending), 0]
+            _bridges[key] = entry
+        entry[1] += 1
+        return entry
+
+
+def _share_bridge(key: Any, entry: List[Any]) -> None:
+    # makes a bridge created before office was loaded the bridge of the loaded LoInst.
+    with _bridges_lock:
+        if entry[1] > 0:
+            _bridges.setdefault(key, entry)
+
+
+def _release_bridge(entry: List[Any], wait: bool) -> None:
+    with _bridges_lock:
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        for key in [key for key, value in _bridges.items() if value is entry]:
+            del _bridges[key]
+    entry[0].close(wait=wait)
+
+
+class AioLo:
+    """
+    Asyncio facade over a :py:class:`~ooodev.loader.inst.lo_inst.LoInst`.
+
+    All office calls are run on a dedicated :py:class:`~ooodev.aio.bridge_thread.BridgeThread`,
+    awaiting them never blocks the event loop. All ``AioLo`` instances of the same ``LoInst`` share one bridge thread,
+    which is closed when the last of them is closed.
+
+    Every method has a ``timeout`` keyword argument in seconds. A call that is cancelled or times out
+    before it starts is not run, a call that has started runs to the end.
+    At most ``max_pending`` calls are queued, further calls wait for a free place.
+
+    Example:
+        .. code-block:: python
+
+            import asyncio
+            from ooodev.aio import AioLo
+            from ooodev.loader.inst.doc_type import DocTypeStr
+
+            async def main():
+                async with AioLo() as aio:
+                    await aio.load_office(timeout=60)
+                    doc = await aio.create_doc(DocTypeStr.CALC)
+                    sheet = await aio.run(lambda: doc.getSheets().getByIndex(0))
+                    await aio.set_array([[1, 2], [3, 4]], sheet, "A1:B2")
+                    print(await aio.get_array(sheet, "A1:B2", timeout=5))
+                    await aio.close_doc(doc)
+                    await aio.close_office()
+
+            asyncio.run(main())
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, lo_inst: LoInst | None = None, max_pending: int = 64) -> None:
+        """
+        Constructor
+
+        Args:
+            lo_inst (LoInst, optional): Lo instance. Defaults to the ``Lo`` instance that ``load_office()`` loads.
+            max_pending (int, optional): Maximum number of calls queued or running. Defaults to ``64``.
+                Set by the first ``AioLo`` of a ``LoInst``, later instances share its bridge thread.
+        """
+        self._lo_inst = lo_inst
+        self._closed = False
+        self._bridge_entry = _acquire_bridge(self._get_bridge_key(), max_pending)
+        self._bridge: BridgeThread = self._bridge_entry[0]
+
+    async def __aenter__(self) -> AioLo:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close(wait=False)
+
+    def _get_bridge_key(self) -> Any:
+        if self._lo_inst is not None:
+            return self._lo_inst
+        # pylint: disable=import-outside-toplevel
+        from ooodev.loader import lo as mLo
+
+        return mLo.Lo.current_lo if mLo.Lo.is_loaded else _DEFAULT_KEY
+
+    def _get_lo_inst(self) -> LoInst:
+        if self._lo_inst is None:
+            # pylint: disable=import-outside-toplevel
+            from ooodev.loader import lo as mLo
+
+            return mLo.Lo.current_lo
+        return self._lo_inst
+
+    async def run(self, fn: Callable[..., _T], *args: Any, timeout: float | None = None, **kwargs: Any) -> _T:
+        """
+        Runs any call on the bridge thread.
+
+        Args:
+            fn (Callable[..., T]): Function to call.
+            args (Any): Positional arguments for ``fn``.
+            timeout (float, optional): Seconds to wait for the result. Defaults to ``None``.
+            kwargs (Any): Keyword arguments for ``fn``.
+
+        Raises:
+            asyncio.TimeoutError: If the result is not available in ``timeout`` seconds.
+
+        Returns:
+            T: Result of ``fn``.
+        """
+        return await self._bridge.run(fn, *args, timeout=timeout, **kwargs)
+
+    # region office
+    async def load_office(
+        self,
+        connector: connectors.ConnectPipe | connectors.ConnectSocket | ConnectBase | None = None,
+        cache_obj: mCache.Cache | None = None,
+        opt: LoOptions | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> XComponentLoader:
+        """
+        Loads Office, see :py:meth:`Lo.load_office() <ooodev.loader.Lo.load_office>`.
+
+        If no ``lo_inst`` was passed to the constructor the default ``Lo`` instance is loaded.
+
+        Args:
+            connector (ConnectPipe, ConnectSocket, ConnectBase, optional): Connection information.
+            cache_obj (Cache, optional): Cache instance that determines if LibreOffice profile is to be copied.
+            opt (Options, optional): Extra Load options.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            XComponentLoader: component loader
+        """
+
+        def load() -> XComponentLoader:
+            if self._lo_inst is not None:
+                return self._lo_inst.load_office(connector=connector, cache_obj=cache_obj, opt=opt)
+            # pylint: disable=import-outside-toplevel
+            from ooodev.loader import lo as mLo
+
+            loader = mLo.Lo.load_office(connector=connector, cache_obj=cache_obj, opt=opt)
+            self._lo_inst = mLo.Lo.current_lo
+            _share_bridge(self._lo_inst, self._bridge_entry)
+            return loader
+
+        return await self._bridge.run(load, timeout=timeout)
+
+    async def close_office(self, *, timeout: float | None = None) -> bool:
+        """
+        Closes Office.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            bool: ``True`` if office was closed; Otherwise, ``False``.
+        """
+        return await self._bridge.run(lambda: self._get_lo_inst().close_office(), timeout=timeout)
+
+    # endregion office
+
+    # region documents
+    async def open_doc(
+        self, fnm: PathOrStr, props: Iterable[PropertyValue] | None = None, *, timeout: float | None = None
+    ) -> XComponent:
+        """
+        Opens a document, see :py:meth:`LoInst.open_doc() <ooodev.loader.inst.lo_inst.LoInst.open_doc>`.
+
+        Args:
+            fnm (PathOrStr): Path of document to open.
+            props (Iterable[PropertyValue], optional): Properties passed to component loader.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            XComponent: Document.
+        """
+        return await self._bridge.run(lambda: self._get_lo_inst().open_doc(fnm=fnm, props=props), timeout=timeout)
+
+    async def create_doc(
+        self, doc_type: LoDocTypeStr, props: Iterable[PropertyValue] | None = None, *, timeout: float | None = None
+    ) -> XComponent:
+        """
+        Creates a document, see :py:meth:`LoInst.create_doc() <ooodev.loader.inst.lo_inst.LoInst.create_doc>`.
+
+        Args:
+            doc_type (DocTypeStr): Document type.
+            props (Iterable[PropertyValue], optional): Properties passed to component loader.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            XComponent: Document.
+        """
+        return await self._bridge.run(
+            lambda: self._get_lo_inst().create_doc(doc_type=doc_type, props=props), timeout=timeout
+        )
+
+    async def store_doc(
+        self,
+        store: XStorable,
+        doc_type: LoDocType,
+        fnm: PathOrStr,
+        password: str | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Stores a document, see :py:meth:`LoInst.store_doc() <ooodev.loader.inst.lo_inst.LoInst.store_doc>`.
+
+        Args:
+            store (XStorable): instance that implements XStorable.
+            doc_type (DocType): Document type.
+            fnm (PathOrStr): Path to save document as.
+            password (str, optional): Password for document.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            bool: ``True`` if document is stored; Otherwise, ``False``.
+        """
+        return await self._bridge.run(
+            lambda: self._get_lo_inst().store_doc(store=store, doc_type=doc_type, fnm=fnm, password=password),
+            timeout=timeout,
+        )
+
+    async def save_doc(
+        self,
+        doc: object,
+        fnm: PathOrStr,
+        password: str | None = None,
+        format: str | None = None,  # pylint: disable=W0622
+        *,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Saves a document, the format is taken from the extension of ``fnm`` unless ``format`` is set.
+        See :py:meth:`LoInst.save_doc() <ooodev.loader.inst.lo_inst.LoInst.save_doc>`.
+
+        Args:
+            doc (object): Office document.
+            fnm (PathOrStr): Path to save document as.
+            password (str, optional): Password for document.
+            format (str, optional): Document format such as ``odt`` or ``xml``.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            bool: ``True`` if document is saved; Otherwise, ``False``.
+        """
+        return await self._bridge.run(
+            lambda: self._get_lo_inst().save_doc(doc=doc, fnm=fnm, password=password, format=format),
+            timeout=timeout,
+        )
+
+    async def close_doc(self, doc: Any, deliver_ownership: bool = False, *, timeout: float | None = None) -> None:
+        """
+        Closes a document, see :py:meth:`LoInst.close_doc() <ooodev.loader.inst.lo_inst.LoInst.close_doc>`.
+
+        Args:
+            doc (XCloseable): Document to close.
+            deliver_ownership (bool, optional): Passed to ``XCloseable.close()``. Defaults to ``False``.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            None:
+        """
+        await self._bridge.run(
+            lambda: self._get_lo_inst().close_doc(doc=doc, deliver_ownership=deliver_ownership), timeout=timeout
+        )
+
+    # endregion documents
+
+    # region Calc
+    async def get_array(self, *args: Any, timeout: float | None = None, **kwargs: Any) -> TupleArray:
+        """
+        Gets Array of data from a spreadsheet.
+
+        Takes the same arguments as :py:meth:`Calc.get_array() <ooodev.office.calc.Calc.get_array>`.
+
+        Args:
+            args (Any): Arguments of ``Calc.get_array()``.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+            kwargs (Any): Keyword arguments of ``Calc.get_array()``.
+
+        Returns:
+            TupleArray: Array of cell values.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ooodev.office.calc import Calc
+        from ooodev.utils.context.lo_context import LoContext
+
+        def get_array() -> TupleArray:
+            # Calc methods use the Lo instance of the context
+            with LoContext(self._get_lo_inst()):
+                return Calc.get_array(*args, **kwargs)
+
+        return await self._bridge.run(get_array, timeout=timeout)
+
+    async def set_array(self, *args: Any, timeout: float | None = None, **kwargs: Any) -> None:
+        """
+        Inserts array of data into a spreadsheet.
+
+        Takes the same arguments as :py:meth:`Calc.set_array() <ooodev.office.calc.Calc.set_array>`.
+
+        Args:
+            args (Any): Arguments of ``Calc.set_array()``.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+            kwargs (Any): Keyword arguments of ``Calc.set_array()``.
+
+        Returns:
+            None:
+        """
+        # pylint: disable=import-outside-toplevel
+        from ooodev.office.calc import Calc
+        from ooodev.utils.context.lo_context import LoContext
+
+        def set_array() -> None:
+            with LoContext(self._get_lo_inst()):
+                Calc.set_array(*args, **kwargs)
+
+        await self._bridge.run(set_array, timeout=timeout)
+
+    # endregion Calc
+
+    async def dispatch_cmd(
+        self,
+        cmd: str,
+        props: Iterable[PropertyValue] | None = None,
+        frame: XFrame | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Dispatches a LibreOffice command, see
+        :py:meth:`LoInst.dispatch_cmd() <ooodev.loader.inst.lo_inst.LoInst.dispatch_cmd>`.
+
+        Args:
+            cmd (str): Command to dispatch such as ``GoToCell``.
+            props (PropertyValue, optional): properties for dispatch.
+            frame (XFrame, optional): Frame to dispatch to.
+            timeout (float, optional): Seconds to wait. Defaults to ``None``.
+
+        Returns:
+            Any: Result of the dispatch.
+        """
+        return await self._bridge.run(
+            lambda: self._get_lo_inst().dispatch_cmd(cmd=cmd, props=props, frame=frame), timeout=timeout
+        )
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Releases the bridge thread, office is not closed.
+
+        When no other ``AioLo`` shares the bridge thread it is stopped after the calls that are already queued.
+
+        Args:
+            wait (bool, optional): Wait until the thread has stopped. Defaults to ``True``.
+
+        Returns:
+            None:
+        """
+        if self._closed:
+            return
+        self._closed = True
+        _release_bridge(self._bridge_entry, wait=wait)
+
+    # region Properties
+    @property
+    def lo_inst(self) -> LoInst:
+        """Gets the Lo instance. Use its methods only inside of ``run()``."""
+        return self._get_lo_inst()
+
+    @property
+    def bridge(self) -> BridgeThread:
+        """Gets the bridge thread."""
+        return self._bridge
+
+    # endregion Properties
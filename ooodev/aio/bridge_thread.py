@@ -0,0 +1,167 @@
+from __future__ import annotations
+import asyncio
+import contextlib
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+# put on the queue to stop the thread.
+_STOP = object()
+
+
+class BridgeThread:
+    """
+    Thread that runs all calls for one office instance so an asyncio event loop is never blocked.
+
+    Calls are run one at a time in the order they are submitted.
+    At most ``max_pending`` calls are queued or running, ``run()`` waits for a free place without
+    blocking the event loop.
+
+    A call that is cancelled or times out before it starts is not run.
+    A call that has started cannot be interrupted, it runs to the end and its result is discarded.
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, name: str = "ooodev-bridge", max_pending: int = 64) -> None:
+        """
+        Constructor
+
+        Args:
+            name (str, optional): Thread name. Defaults to ``ooodev-bridge``.
+            max_pending (int, optional): Maximum number of calls queued or running. Defaults to ``64``.
+
+        Raises:
+            ValueError: If ``max_pending`` is less than ``1``.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._max_pending = max_pending
+        self._calls: queue.Queue = queue.Queue()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            call = self._calls.get()
+            if call is _STOP:
+                break
+            future, fn, args, kwargs, on_done = call
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                on_done()
+
+    def _get_slots(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # created in the running event loop, a semaphore cannot be shared between loops.
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> Future[_T]:
+        """
+        Submits a call without waiting for a free place, for use outside of an event loop.
+
+        Args:
+            fn (Callable[..., T]): Function to call on the bridge thread.
+            args (Any): Positional arguments for ``fn``.
+            kwargs (Any): Keyword arguments for ``fn``.
+
+        Raises:
+            RuntimeError: If the bridge thread is closed.
+
+        Returns:
+            Future[T]: Future of the result.
+        """
+        if self._closed:
+            raise RuntimeError("Bridge thread is closed")
+        future: Future = Future()
+        self._calls.put((future, fn, args, kwargs, lambda: None))
+        return future
+
+    async def run(self, fn: Callable[..., _T], *args: Any, timeout: float | None = None, **kwargs: Any) -> _T:
+        """
+        Runs a call on the bridge thread and waits for the result.
+
+        Args:
+            fn (Callable[..., T]): Function to call on the bridge thread.
+            args (Any): Positional arguments for ``fn``.
+            timeout (float, optional): Seconds to wait for the result, including time spent in the queue.
+                Defaults to ``None``.
+            kwargs (Any): Keyword arguments for ``fn``.
+
+        Raises:
+            asyncio.TimeoutError: If the result is not available in ``timeout`` seconds.
+            RuntimeError: If the bridge thread is closed.
+
+        Returns:
+            T: Result of ``fn``.
+        """
+        if self._closed:
+            raise RuntimeError("Bridge thread is closed")
+        loop = asyncio.get_running_loop()
+        slots = self._get_slots(loop)
+        if timeout is None:
+            await slots.acquire()
+        else:
+            # waiting for a free place counts toward the timeout.
+            start = loop.time()
+            await asyncio.wait_for(slots.acquire(), timeout)
+            timeout = max(0.0, timeout - (loop.time() - start))
+
+        def on_done() -> None:
+            # the place is freed when the call has run or was skipped, not when the caller stopped waiting.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(slots.release)
+
+        future: Future = Future()
+        try:
+            self._calls.put((future, fn, args, kwargs, on_done))
+        except BaseException:
+            slots.release()
+            raise
+        # cancelling the wrapper cancels the call if it has not started.
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Closes the bridge thread after the calls that are already queued.
+
+        Args:
+            wait (bool, optional): Wait until the thread has stopped. Defaults to ``True``.
+
+        Returns:
+            None:
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._calls.put(_STOP)
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+    @property
+    def is_bridge_thread(self) -> bool:
+        """Gets if the current thread is the bridge thread."""
+        return threading.current_thread() is self._thread
+
+    @property
+    def closed(self) -> bool:
+        """Gets if the bridge thread is closed."""
+        return self._closed
+
+    @property
+    def max_pending(self) -> int:
+        """Gets the maximum number of calls queued or running."""
+        return self._max_pending
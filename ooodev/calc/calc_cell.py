@@ -12,7 +12,12 @@ except ImportError:
 from com.sun.star.uno import RuntimeException
 
 from ooodev.mock import mock_g
+from ooodev.adapter.beans.property_change_implement import PropertyChangeImplement
+from ooodev.adapter.beans.vetoable_change_implement import VetoableChangeImplement
+from ooodev.adapter.component_base import ComponentBase
 from ooodev.adapter.sheet.sheet_cell_comp import SheetCellComp
+from ooodev.adapter.text.text_partial import TextPartial
+from ooodev.adapter.util.modify_events import ModifyEvents
 from ooodev.events.partial.events_partial import EventsPartial
 from ooodev.exceptions import ex as mEx
 from ooodev.format.inner.partial.area.fill_color_partial import FillColorPartial
@@ -103,7 +108,9 @@ class CalcCell(
         self._cell_obj = mCellObj.CellObj.from_cell(cell)
         # don't use owner.get_cell() here because it will be recursive.
         sheet_cell = mCalc.Calc.get_cell(sheet=owner.component, cell_obj=self._cell_obj)
-        SheetCellComp.__init__(self, sheet_cell)  # type: ignore
+        # the rest of SheetCellComp.__init__() creates listeners, they are created by _init_partials().
+        ComponentBase.__init__(self, sheet_cell)
+        TextPartial.__init__(self, component=sheet_cell, interface=None)
         EventsPartial.__init__(self)
         CellProperties2PartialProps.__init__(self, component=sheet_cell)  # type: ignore
         QiPartial.__init__(self, component=sheet_cell, lo_inst=self.lo_inst)
@@ -114,18 +121,46 @@ class CalcCell(
         CalcCellPropPartial.__init__(self, obj=self)
         CalcSheetPropPartial.__init__(self, obj=owner)
         CalcDocPropPartial.__init__(self, obj=owner.calc_doc)
-        FontOnlyPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=self.lo_inst)
-        FontEffectsPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=self.lo_inst)
-        FontPartial.__init__(
-            self, factory_name="ooodev.general_style.text", component=sheet_cell, lo_inst=self.lo_inst
-        )
-        TextAlignPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=self.lo_inst)
-        TextOrientationPartial.__init__(
-            self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=self.lo_inst
-        )
-        AlignPropertiesPartial.__init__(
-            self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=self.lo_inst
-        )
+        self._control = None
+        self._custom_properties = None
+        self._unique_id = None
+        # read by __getattr__, set last so a missing attribute in __init__ is not hidden.
+        self._partials_initialized = False
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when normal lookup fails, such as for an attribute that is set by a partial's __init__().
+        if name.startswith("__") or self.__dict__.get("_partials_initialized", True):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self._init_partials()
+        return object.__getattribute__(self, name)
+
+    def _init_partials(self) -> None:
+        # Style partials and listeners are only needed by cells that are styled or have events,
+        # they are created on the first access of an attribute that does not exist yet.
+        # set first so a lookup made by a constructor below is not sent back here.
+        self._partials_initialized = True
+        try:
+            self._init_partials_components()
+        except BaseException:
+            # the next lookup tries again and raises the error of the constructor.
+            self._partials_initialized = False
+            raise
+
+    def _init_partials_components(self) -> None:
+        sheet_cell = self.component
+        lo_inst = self.lo_inst
+        # listeners of SheetCellComp.__init__(), ComponentBase and TextPartial are created by __init__().
+        # pylint: disable=no-member
+        generic_args = self._ComponentBase__get_generic_args()  # type: ignore
+        ModifyEvents.__init__(self, trigger_args=generic_args, cb=self._on_modify_events_add_remove)
+        PropertyChangeImplement.__init__(self, component=sheet_cell, trigger_args=generic_args)
+        VetoableChangeImplement.__init__(self, component=sheet_cell, trigger_args=generic_args)
+        FontOnlyPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
+        FontEffectsPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
+        FontPartial.__init__(self, factory_name="ooodev.general_style.text", component=sheet_cell, lo_inst=lo_inst)
+        TextAlignPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
+        TextOrientationPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
+        AlignPropertiesPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
         FillColorPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
         CalcBordersPartial.__init__(self, factory_name="ooodev.calc.cell", component=sheet_cell, lo_inst=lo_inst)
         CellProtectionPartial.__init__(self, component=sheet_cell)
@@ -133,9 +168,6 @@ class CalcCell(
             self, factory_name="ooodev.number.numbers", component=sheet_cell, lo_inst=lo_inst
         )
         StylePropertyPartial.__init__(self, component=sheet_cell, property_name="CellStyle")
-        self._control = None
-        self._custom_properties = None
-        self._unique_id = None
         self._init_events()
 
     def _init_events(self) -> None:
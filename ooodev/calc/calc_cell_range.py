@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, cast, List, overload, Sequence, TYPE_CHECKING
+import csv
+from typing import Any, cast, Generator, Iterable, List, overload, Sequence, Tuple, TYPE_CHECKING
 
 try:
     # python 3.12+
@@ -13,6 +14,8 @@ from ooo.dyn.sheet.cell_flags import CellFlagsEnum as CellFlagsEnum
 
 from ooodev.mock import mock_g
 from ooodev.adapter.sheet.sheet_cell_range_comp import SheetCellRangeComp
+from ooodev.events.args.cancel_event_args import CancelEventArgs
+from ooodev.events.args.event_args import EventArgs
 from ooodev.events.calc_named_event import CalcNamedEvent
 from ooodev.events.partial.events_partial import EventsPartial
 from ooodev.exceptions import ex as mEx
@@ -38,6 +41,9 @@ from ooodev.utils.data_type.generic_unit_size import GenericUnitSize
 from ooodev.utils.data_type.cell_obj import CellObj
 from ooodev.utils.data_type.range_obj import RangeObj
 from ooodev.utils.data_type.range_values import RangeValues
+from ooodev.utils.helper.csv_helper import CsvHelper
+from ooodev.utils.helper.dataframe_helper import DataFrameHelper
+from ooodev.utils.helper.parquet_helper import ParquetHelper
 from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
 from ooodev.utils.partial.prop_partial import PropPartial
 from ooodev.utils.partial.qi_partial import QiPartial
@@ -48,6 +54,8 @@ from ooodev.format.inner.partial.style.style_property_partial import StyleProper
 from ooodev.calc.partial.calc_doc_prop_partial import CalcDocPropPartial
 from ooodev.calc.partial.calc_sheet_prop_partial import CalcSheetPropPartial
 from ooodev.calc import calc_cell as mCalcCell
+from ooodev.calc.sheet.cell_handle import CellHandleBlock, CellHandle
+from ooodev.calc.sheet.range_snapshot import RangeSnapshot
 from ooodev.adapter.table.cell_properties2_partial_props import CellProperties2PartialProps
 
 
@@ -56,14 +64,16 @@ if TYPE_CHECKING:
     from com.sun.star.sheet import SheetCellRange
     from com.sun.star.table import CellAddress
     from ooo.dyn.table.cell_range_address import CellRangeAddress
-    from ooodev.events.args.cancel_event_args import CancelEventArgs
     from ooodev.proto.style_obj import StyleT
+    from ooodev.calc.sheet.range_snapshot import RangePatch
     from ooodev.utils.color import Color
     from ooodev.utils.data_type.cell_values import CellValues
     from ooodev.utils.data_type.size import Size
     from ooodev.utils.kind.chart2_types import ChartTemplateBase, ChartTypes as ChartTypes
     from ooodev.utils.type_var import Table, TupleArray, FloatTable, Row, PathOrStr
     from ooodev.format.calc.style import StyleCellKind
+    from numpy import ndarray  # type: ignore
+    from pandas import DataFrame  # type: ignore
     from ooodev.events.args.key_val_cancel_args import KeyValCancelArgs
     from ooodev.calc import calc_cell_cursor as mCalcCellCursor
     from ooodev.calc.calc_sheet import CalcSheet
@@ -542,13 +552,15 @@ class CalcCellRange(
         """
         return mCalc.Calc.is_single_row_range(self.get_cell_range_address())
 
-    def set_array(self, values: Table, styles: Sequence[StyleT] | None = None) -> None:
+    def set_array(self, values: Table, styles: Sequence[StyleT] | None = None, chunk_cells: int = 0) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): When greater than ``0`` values are written in blocks of rows
+                holding at most ``chunk_cells`` cells each. Default ``0``.
 
         Returns:
             None:
@@ -556,11 +568,69 @@ class CalcCellRange(
         See Also:
             - :ref:`help_calc_format_style_cell`
             - :ref:`help_calc_format_direct_cell`
+            - :py:meth:`CalcSheet.set_array() <ooodev.calc.CalcSheet.set_array>`
+
+        .. versionchanged:: 0.54.0
+            Added ``chunk_cells`` argument.
         """
         if styles:
-            self.calc_sheet.set_array(values=values, range_obj=self._range_obj, styles=styles)
+            self.calc_sheet.set_array(values=values, range_obj=self._range_obj, styles=styles, chunk_cells=chunk_cells)
         else:
-            self.calc_sheet.set_array(values=values, range_obj=self._range_obj)
+            self.calc_sheet.set_array(values=values, range_obj=self._range_obj, chunk_cells=chunk_cells)
+
+    def get_snapshot(self) -> RangeSnapshot:
+        """
+        Gets a snapshot of the current values of the range.
+
+        Returns:
+            RangeSnapshot: Snapshot that can be compared with new values to get the changed blocks.
+
+        See Also:
+            :py:meth:`~.CalcCellRange.apply_patch`
+
+        .. versionadded:: 0.54.0
+        """
+        return RangeSnapshot.from_range(self)
+
+    def apply_patch(self, patches: Iterable[RangePatch]) -> int:
+        """
+        Writes patches into the sheet of the range.
+
+        Each patch is written with a single ``setDataArray()`` call while controllers are locked.
+        Cells that are not covered by a patch are not written.
+
+        Args:
+            patches (Iterable[RangePatch]): Patches such as the result of
+                :py:meth:`RangeSnapshot.diff() <ooodev.calc.sheet.range_snapshot.RangeSnapshot.diff>`.
+                Patch positions are absolute positions on the sheet.
+
+        Returns:
+            int: Number of cells written.
+
+        Example:
+            .. code-block:: python
+
+                snapshot = rng.get_snapshot()
+                # ... later
+                patches = snapshot.diff(new_values)
+                rng.apply_patch(patches)
+
+        .. versionadded:: 0.54.0
+        """
+        sheet = self.calc_sheet.component
+        cells = 0
+        self.calc_doc.lock_controllers()
+        try:
+            for p in patches:
+                ro = p.range_obj
+                cell_range = sheet.getCellRangeByPosition(
+                    ro.start_col_index, ro.start_row_index, ro.end_col_index, ro.end_row_index
+                )
+                mCalc.Calc.set_array(p.values, cell_range)
+                cells += ro.cell_count
+        finally:
+            self.calc_doc.unlock_controllers()
+        return cells
 
     def set_array_range(self, values: Table, styles: Sequence[StyleT] | None = None) -> None:
         """
@@ -686,6 +756,87 @@ class CalcCellRange(
         """
         return self.calc_sheet.get_array(range_obj=self._range_obj)
 
+    def iter_array(self, chunk_rows: int = 1000) -> Generator[Tuple[RangeObj, TupleArray], None, None]:
+        """
+        Gets the values of the range in blocks of rows.
+
+        Args:
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+
+        .. versionadded:: 0.54.0
+        """
+        return self.calc_sheet.iter_array(range_obj=self._range_obj, chunk_rows=chunk_rows)
+
+    def iter_rows(self, chunk_rows: int = 1000) -> Generator[Tuple[Any, ...], None, None]:
+        """
+        Iterates over the rows of values in the range.
+
+        Rows are read from the sheet in blocks of ``chunk_rows`` so large ranges can be processed
+        without reading the entire range into memory.
+
+        Args:
+            chunk_rows (int, optional): Number of rows read from the sheet at a time. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            Tuple[Any, ...]: Row of values.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.get_range(range_name="A1:F500000")
+                total = sum(row[5] for row in rng.iter_rows(chunk_rows=10000))
+
+        .. versionadded:: 0.54.0
+        """
+        for _, block in self.iter_array(chunk_rows=chunk_rows):
+            yield from block
+
+    def iter_cells(self, chunk_rows: int = 1000) -> Generator[CellHandle, None, None]:
+        """
+        Iterates over the cells of the range row by row.
+
+        Each cell is yielded as a lightweight :py:class:`~ooodev.calc.sheet.cell_handle.CellHandle`.
+        Values are read in blocks of ``chunk_rows`` with a single ``getDataArray()`` call that is shared by
+        every handle of the block, so no call is made to the office for each cell.
+        Call ``CellHandle.get_cell()`` to get the full ``CalcCell`` of a handle.
+
+        Args:
+            chunk_rows (int, optional): Number of rows read from the sheet at a time. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            CellHandle: Handle of each cell.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.get_range(range_name="A1:F5000")
+                for handle in rng.iter_cells():
+                    if handle.value == "":
+                        continue
+                    if handle.formula.startswith("="):
+                        handle.get_cell().style_font(font_style="Bold")
+
+        .. versionadded:: 0.54.0
+        """
+        sheet = self.calc_sheet
+        for rng, values in self.iter_array(chunk_rows=chunk_rows):
+            block = CellHandleBlock(owner=sheet, range_obj=rng, values=values)
+            for row, row_values in enumerate(values):
+                for col in range(len(row_values)):
+                    yield CellHandle(block, col, row)
+
     def get_float_array(self) -> FloatTable:
         """
         Gets a 2-Dimensional List of floats.
@@ -695,6 +846,296 @@ class CalcCellRange(
         """
         return self.calc_sheet.get_float_array(range_obj=self._range_obj)
 
+    def get_ndarray(self, dtype: Any = None, with_mask: bool = False) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats for the range.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+                When ``dtype`` is not a floating point type then non-numeric cells are set to ``0``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned
+                where ``mask`` is ``True`` for each non-numeric cell. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask.
+
+        Note:
+            NumPy is an optional dependency and must be installed separately.
+
+        .. versionadded:: 0.54.0
+        """
+        return self.calc_sheet.get_ndarray(range_obj=self._range_obj, dtype=dtype, with_mask=with_mask)
+
+    def set_ndarray(self, arr: ndarray, chunk_cells: int = 0) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into the range.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            chunk_cells (int, optional): Maximum number of cells to write per block. Default ``0``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+
+        Note:
+            NumPy is an optional dependency and must be installed separately.
+
+        .. versionadded:: 0.54.0
+        """
+        self.calc_sheet.set_ndarray(arr=arr, range_obj=self._range_obj, chunk_cells=chunk_cells)
+
+    def to_dataframe(self, header: bool = True, parse_dates: bool = True) -> DataFrame:
+        """
+        Gets the values of the range as a pandas ``DataFrame``.
+
+        Values are read with a single ``getDataArray()`` call.
+        Columns that contain only numbers and empty cells become ``float64`` columns where empty cells are ``NaN``.
+
+        Args:
+            header (bool, optional): If ``True`` the first row of the range is used as column names. Defaults to ``True``.
+            parse_dates (bool, optional): If ``True`` columns where the first data cell has a date format
+                are converted into ``datetime64`` columns. Defaults to ``True``.
+
+        Raises:
+            ImportError: If ``pandas`` is not installed.
+
+        Returns:
+            DataFrame: Data frame.
+
+        Note:
+            pandas is an optional dependency and must be installed separately.
+
+        .. versionadded:: 0.54.0
+        """
+        DataFrameHelper.import_pandas()
+        values = self.get_array()
+        date_columns: List[int] = []
+        null_date = None
+        if parse_dates:
+            null_date = mCalc.Calc.get_null_date(self.calc_doc.component)
+            date_columns = self._get_data_date_columns(header)
+        return DataFrameHelper.table_to_dataframe(
+            values, header=header, date_columns=date_columns, null_date=null_date
+        )
+
+    def _get_data_date_columns(self, header: bool) -> List[int]:
+        """Gets the zero based columns of the range that have a date format in the first data row of the range."""
+        data_row = 1 if header else 0
+        if self._range_obj.row_count <= data_row:
+            return []
+        return self._get_date_columns(data_row)
+
+    def _get_date_columns(self, row: int) -> List[int]:
+        """Gets the zero based columns of the range that have a date format in the given zero based row of the range."""
+        doc = self.calc_doc.component
+        date_columns: List[int] = []
+        is_date_key = {}
+        for col in range(self._range_obj.col_count):
+            key = int(self.component.getCellByPosition(col, row).getPropertyValue("NumberFormat"))
+            if key not in is_date_key:
+                is_date_key[key] = mCalc.Calc.is_date_format(doc, key)
+            if is_date_key[key]:
+                date_columns.append(col)
+        return date_columns
+
+    def export_csv(
+        self,
+        fnm: PathOrStr,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        quotechar: str = '"',
+        quoting: int = csv.QUOTE_MINIMAL,
+        line_terminator: str = "\r\n",
+        chunk_rows: int = 10_000,
+        dates_as_iso: bool = True,
+        header: bool = True,
+    ) -> None:
+        """
+        Exports the values of the range to a CSV file.
+
+        The range is read in blocks of ``chunk_rows`` rows and each block is written to the file before
+        the next block is read, so memory use does not grow with the size of the range.
+        The document is not stored and no filter is used.
+
+        Args:
+            fnm (PathOrStr): CSV file name.
+            delimiter (str, optional): Field delimiter. Defaults to ``,``.
+            encoding (str, optional): File encoding. Defaults to ``utf-8``.
+            quotechar (str, optional): Character used to quote fields. Defaults to ``"``.
+            quoting (int, optional): One of the ``csv.QUOTE_*`` constants. Defaults to ``csv.QUOTE_MINIMAL``.
+            line_terminator (str, optional): Line terminator. Defaults to ``\\r\\n``.
+            chunk_rows (int, optional): Number of rows read from the sheet at a time. Defaults to ``10_000``.
+            dates_as_iso (bool, optional): If ``True`` columns where the first data cell has a date format
+                are written as ISO 8601 dates such as ``2024-01-31``; Otherwise, serial numbers are written.
+                Defaults to ``True``.
+            header (bool, optional): If ``True`` the first row of the range is a header row and date formats
+                are read from the row below it. All rows are written. Defaults to ``True``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            CancelEventError: If ``EXPORTING_RANGE_CSV`` event is canceled.
+
+        Returns:
+            None:
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.EXPORTING_RANGE_CSV` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.EXPORTED_RANGE_CSV` :eventref:`src-docs-event`
+
+        Note:
+            Values are written as they are stored in the cells; number formats other than dates are not applied.
+            Whole numbers are written without a fraction.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.get_range(range_name="A1:F500000")
+                rng.export_csv("data.tsv", delimiter="\\t")
+
+        .. versionadded:: 0.54.0
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be greater than 0, got {chunk_rows}")
+        cargs = CancelEventArgs(self.export_csv.__qualname__)
+        cargs.event_data = {"fnm": fnm, "delimiter": delimiter, "encoding": encoding}
+        self.trigger_event(CalcNamedEvent.EXPORTING_RANGE_CSV, cargs)
+        if cargs.cancel:
+            raise mEx.CancelEventError(cargs)
+
+        date_columns: List[int] = []
+        null_date = None
+        if dates_as_iso:
+            null_date = mCalc.Calc.get_null_date(self.calc_doc.component)
+            date_columns = self._get_data_date_columns(header)
+        rows = 0
+        with open(fnm, "w", encoding=encoding, newline="") as file:
+            writer = csv.writer(
+                file, delimiter=delimiter, quotechar=quotechar, quoting=quoting, lineterminator=line_terminator
+            )
+            for _, block in self.iter_array(chunk_rows=chunk_rows):
+                writer.writerows(CsvHelper.format_row(row, date_columns, null_date) for row in block)
+                rows += len(block)
+
+        eargs = EventArgs.from_args(cargs)
+        eargs.event_data["rows"] = rows
+        self.trigger_event(CalcNamedEvent.EXPORTED_RANGE_CSV, eargs)
+
+    def export_parquet(
+        self,
+        fnm: PathOrStr,
+        header: bool = True,
+        compression: str = "snappy",
+        chunk_rows: int = 10_000,
+        parse_dates: bool = True,
+    ) -> None:
+        """
+        Exports the values of the range to an Apache Parquet file.
+
+        The range is read in blocks of ``chunk_rows`` rows and each block is written as a row group
+        before the next block is read, so memory use does not grow with the size of the range.
+
+        Columns that hold only numbers and empty cells are written as ``float64``, other columns are written as ``string``.
+        Column types are taken from the first block and checked against the other blocks in a read only pass
+        before the file is written, a numeric column that has text in a later block is written as ``string``.
+        Empty cells are written as ``null``.
+
+        Args:
+            fnm (PathOrStr): Parquet file name.
+            header (bool, optional): If ``True`` the first row of the range is used as column names. Defaults to ``True``.
+            compression (str, optional): Parquet compression such as ``snappy``, ``gzip``, ``zstd`` or ``none``.
+                Defaults to ``snappy``.
+            chunk_rows (int, optional): Number of rows read from the sheet at a time. Defaults to ``10_000``.
+            parse_dates (bool, optional): If ``True`` numeric columns where the first data cell has a date format
+                are written as ``timestamp[ms]``. Defaults to ``True``.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            CancelEventError: If ``EXPORTING_RANGE_PARQUET`` event is canceled.
+
+        Returns:
+            None:
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.EXPORTING_RANGE_PARQUET` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.EXPORTED_RANGE_PARQUET` :eventref:`src-docs-event`
+
+        Note:
+            pyarrow is an optional dependency and must be installed separately.
+
+        .. versionadded:: 0.54.0
+        """
+        ParquetHelper.import_pyarrow()
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be greater than 0, got {chunk_rows}")
+        cargs = CancelEventArgs(self.export_parquet.__qualname__)
+        cargs.event_data = {"fnm": fnm, "compression": compression}
+        self.trigger_event(CalcNamedEvent.EXPORTING_RANGE_PARQUET, cargs)
+        if cargs.cancel:
+            raise mEx.CancelEventError(cargs)
+
+        import pyarrow.parquet as pq  # type: ignore
+
+        date_columns: List[int] = []
+        null_date = None
+        if parse_dates:
+            null_date = mCalc.Calc.get_null_date(self.calc_doc.component)
+            date_columns = self._get_data_date_columns(header)
+        # row groups of a parquet file cannot change type, column kinds are settled before writing.
+        kinds = self._get_parquet_kinds(header, chunk_rows, date_columns)
+        rows = 0
+        writer = None
+        try:
+            for _, block in self.iter_array(chunk_rows=chunk_rows):
+                if writer is None:
+                    if header:
+                        names = ParquetHelper.get_column_names(block[0])
+                        block = block[1:]
+                    else:
+                        names = [f"column_{i}" for i in range(self._range_obj.col_count)]
+                    schema = ParquetHelper.get_schema(names, kinds)
+                    writer = pq.ParquetWriter(str(fnm), schema, compression=compression)
+                if block:
+                    writer.write_table(ParquetHelper.table_to_arrow(block, writer.schema, kinds, null_date))
+                    rows += len(block)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        eargs = EventArgs.from_args(cargs)
+        eargs.event_data["rows"] = rows
+        self.trigger_event(CalcNamedEvent.EXPORTED_RANGE_PARQUET, eargs)
+
+    def _get_parquet_kinds(self, header: bool, chunk_rows: int, date_columns: List[int]) -> List[str]:
+        # kinds of the first block, numeric columns that have text in a later block become text.
+        kinds: List[str] | None = None
+        for _, block in self.iter_array(chunk_rows=chunk_rows):
+            if kinds is None:
+                if header:
+                    block = block[1:]
+                kinds = ParquetHelper.get_column_kinds(block, date_columns) or ["text"] * self._range_obj.col_count
+            else:
+                for i in ParquetHelper.get_text_columns(block, kinds):
+                    kinds[i] = "text"
+            if "number" not in kinds and "date" not in kinds:
+                break
+        return kinds or ["text"] * self._range_obj.col_count
+
     def get_val(self) -> Any:
         """
         Get the value of the very first cell in the range.
@@ -1104,6 +1545,29 @@ class CalcCellRange(
         """Range object."""
         return self._range_obj
 
+    @property
+    def formulas(self) -> TupleArray:
+        """
+        Gets/Sets the formulas of the range.
+
+        Formulas are read and written in a single call using ``XCellRangeFormula``.
+        When setting, the formulas must have the same size as the range.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.get_range(range_name="C1:C3")
+                rng.formulas = [["=A1*B1"], ["=A2*B2"], ["=A3*B3"]]
+                print(rng.formulas)
+
+        .. versionadded:: 0.54.0
+        """
+        return self.calc_sheet.get_formula_array(range_obj=self._range_obj)
+
+    @formulas.setter
+    def formulas(self, value: Table) -> None:
+        self.calc_sheet.set_formula_array(formulas=value, range_obj=self._range_obj)
+
     @property
     def size(self) -> GenericUnitSize[UnitMM, float]:
         """Gets the size of the cell range in ``UnitMM`` Values."""
@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import Any, cast, List, Tuple, overload, Sequence, TYPE_CHECKING
+import contextlib
+import time
+from typing import Any, cast, Generator, Iterable, List, Tuple, overload, Sequence, TYPE_CHECKING
 
 # pylint: wrong-import-position
 
 from com.sun.star.drawing import XDrawPagesSupplier
 from com.sun.star.frame import XModel
+from com.sun.star.sheet import XCalculatable
 from com.sun.star.sheet import XSpreadsheet
 from com.sun.star.sheet import XSpreadsheets
 from com.sun.star.sheet import XSpreadsheetDocument
@@ -144,6 +147,7 @@ class CalcDoc(
         self._named_ranges = None
         self._database_ranges = None
         self._theme_comp = None
+        self._calc_suspend_depth = 0
 
     # region context manage
     def __enter__(self) -> CalcDoc:
@@ -155,6 +159,130 @@ class CalcDoc(
 
     # endregion context manage
 
+    # region calculation_suspended()
+    @contextlib.contextmanager
+    def calculation_suspended(self, recalc: bool = True, full: bool = False) -> Generator[CalcDoc, None, None]:
+        """
+        Context manager that turns off automatic calculation and locks controllers of the document.
+
+        On exit automatic calculation and controllers are restored and, if automatic calculation was on,
+        the document is calculated once. Use when writing many values into a document with many formulas,
+        so formulas are not recalculated after every write.
+
+        The context manager is re-entrant, nested contexts have no effect and only the outer context calculates.
+
+        Args:
+            recalc (bool, optional): If ``True`` the document is calculated on exit. Defaults to ``True``.
+            full (bool, optional): If ``True`` all formula cells are calculated (``calculateAll()``);
+                Otherwise, only cells that need calculating are calculated (``calculate()``). Defaults to ``False``.
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.CALCULATION_SUSPENDED` :eventref:`src-docs-event`
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.RECALCULATING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.RECALCULATED` :eventref:`src-docs-event`
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.CONTROLLERS_LOCKING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.CONTROLLERS_LOCKED` :eventref:`src-docs-event`
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.CONTROLLERS_UNLOCKING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~.events.lo_named_event.LoNamedEvent.CONTROLLERS_UNLOCKED` :eventref:`src-docs-event`
+
+        Yields:
+            CalcDoc: This document.
+
+        Note:
+            Event data of all calc events is a dictionary containing ``doc``, ``auto_calc`` (``True`` if automatic
+            calculation was on) and ``full``. ``RECALCULATING`` and ``RECALCULATED`` event data also contain
+            ``suspended_elapsed`` (seconds spent in the context). ``RECALCULATED`` event data also contains
+            ``elapsed`` (seconds spent calculating).
+
+            If ``RECALCULATING`` is canceled the document is not calculated.
+
+        Example:
+            .. code-block:: python
+
+                with doc.calculation_suspended():
+                    for i, block in enumerate(blocks):
+                        sheet.set_array(values=block, name=f"A{i * 1000 + 1}")
+
+        .. versionadded:: 0.54.0
+        """
+        self._calc_suspend_depth += 1
+        if self._calc_suspend_depth > 1:
+            try:
+                yield self
+            finally:
+                self._calc_suspend_depth -= 1
+            return
+
+        try:
+            calculatable = self.qi(XCalculatable, True)
+            auto_calc = calculatable.isAutomaticCalculationEnabled()
+            event_data = {"doc": self, "auto_calc": auto_calc, "full": full}
+            locked = self._lock_controllers_with_events()
+        except BaseException:
+            # a later context must not be taken as nested.
+            self._calc_suspend_depth -= 1
+            raise
+        start = time.perf_counter()
+        try:
+            if auto_calc:
+                calculatable.enableAutomaticCalculation(False)
+            eargs = EventArgs(self.calculation_suspended.__qualname__)
+            eargs.event_data = event_data.copy()
+            _Events().trigger(CalcNamedEvent.CALCULATION_SUSPENDED, eargs)
+            yield self
+        finally:
+            self._calc_suspend_depth -= 1
+            suspended_elapsed = time.perf_counter() - start
+            try:
+                if auto_calc:
+                    calculatable.enableAutomaticCalculation(True)
+                    if recalc:
+                        # cells written before an error also need calculating.
+                        self._recalculate(calculatable, event_data, suspended_elapsed)
+            finally:
+                if locked:
+                    self._unlock_controllers_with_events()
+
+    def _recalculate(self, calculatable: XCalculatable, event_data: dict, suspended_elapsed: float) -> None:
+        cargs = CancelEventArgs(self.calculation_suspended.__qualname__)
+        cargs.event_data = {**event_data, "suspended_elapsed": suspended_elapsed}
+        _Events().trigger(CalcNamedEvent.RECALCULATING, cargs)
+        if cargs.cancel:
+            return
+        start = time.perf_counter()
+        if cargs.event_data["full"]:
+            calculatable.calculateAll()
+        else:
+            calculatable.calculate()
+        eargs = EventArgs.from_args(cargs)
+        eargs.event_data = {**cargs.event_data, "elapsed": time.perf_counter() - start}
+        _Events().trigger(CalcNamedEvent.RECALCULATED, eargs)
+
+    def _lock_controllers_with_events(self) -> bool:
+        # same events as Lo.lock_controllers() but for this document rather than the current document.
+        cargs = CancelEventArgs(self._lock_controllers_with_events.__qualname__)
+        self.lo_inst.on_controllers_locking(cargs)
+        if cargs.cancel:
+            return False
+        self.component.lockControllers()
+        self.lo_inst.on_controllers_locked(EventArgs(self))
+        return True
+
+    def _unlock_controllers_with_events(self) -> bool:
+        cargs = CancelEventArgs(self._unlock_controllers_with_events.__qualname__)
+        self.lo_inst.on_controllers_unlocking(cargs)
+        if cargs.cancel:
+            return False
+        if self.component.hasControllersLocked():
+            self.component.unlockControllers()
+            self.lo_inst.on_controllers_unlocked(EventArgs(self))
+            return True
+        return False
+
+    # endregion calculation_suspended()
+
     def create_cell_style(self, style_name: str) -> XStyle:
         """
         Creates a style
@@ -191,6 +319,35 @@ class CalcDoc(
             result = mCalc.Calc.call_fun(func_name, *args)
         return result
 
+    def call_fun_many(
+        self, func_name: str, arg_rows: Iterable[Sequence[Any]], min_batch: int = 200, chunk_rows: int = 50_000
+    ) -> List[Any]:
+        """
+        Execute a Calc function by its (English) name once for each row of arguments.
+
+        Large batches of numeric or text arguments are evaluated on a hidden scratch spreadsheet
+        with a few calls to the office rather than one call per row.
+
+        Args:
+            func_name (str): the English name of the function to execute
+            arg_rows (Iterable[Sequence[Any]]): Arguments of each call of the function.
+            min_batch (int, optional): Minimum number of rows evaluated on the scratch spreadsheet.
+                Smaller batches are evaluated one call at a time. Defaults to ``200``.
+            chunk_rows (int, optional): Maximum number of rows evaluated on the scratch spreadsheet at once.
+                Defaults to ``50_000``.
+
+        Returns:
+            List[Any]: Result of each row in the order of ``arg_rows``. ``None`` for rows where the function failed.
+
+        See Also:
+            :py:meth:`Calc.call_fun_many() <ooodev.office.calc.Calc.call_fun_many>`
+
+        .. versionadded:: 0.54.0
+        """
+        with LoContext(self.lo_inst):
+            result = mCalc.Calc.call_fun_many(func_name, arg_rows, min_batch=min_batch, chunk_rows=chunk_rows)
+        return result
+
     def compute_function(self, fn: GeneralFunction | str, cell_range: XCellRange) -> float:
         """
         Computes a Calc Function
@@ -1,7 +1,13 @@
 from __future__ import annotations
-from typing import Any, List, Tuple, cast, overload, Sequence, TYPE_CHECKING
+import contextlib
+import math
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Generator, Iterable, List, Tuple, cast, overload, Sequence, TYPE_CHECKING
 
 from com.sun.star.drawing import XDrawPageSupplier
+from com.sun.star.sheet import XGoalSeek
 from com.sun.star.sheet import XSheetCellRange
 from com.sun.star.sheet import XSpreadsheet
 from com.sun.star.table import XCell
@@ -13,6 +19,8 @@ from ooodev.mock import mock_g
 from ooodev.adapter.sheet.named_ranges_comp import NamedRangesComp
 from ooodev.adapter.sheet.spreadsheet_comp import SpreadsheetComp
 from ooodev.events.args.cancel_event_args import CancelEventArgs
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.calc_named_event import CalcNamedEvent
 from ooodev.events.lo_events import event_ctx
 from ooodev.events.gbl_named_event import GblNamedEvent
 from ooodev.events.lo_events import observe_events
@@ -26,6 +34,9 @@ from ooodev.utils import props as mProps
 from ooodev.utils.context.lo_context import LoContext
 from ooodev.utils.data_type import cell_obj as mCellObj
 from ooodev.utils.data_type import range_obj as mRngObj
+from ooodev.utils.data_type.range_set import RangeSet
+from ooodev.utils.helper.csv_helper import CsvHelper, CsvOptions
+from ooodev.utils.helper.dataframe_helper import DataFrameHelper
 from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
 from ooodev.utils.partial.prop_partial import PropPartial
 from ooodev.utils.partial.qi_partial import QiPartial
@@ -46,7 +57,6 @@ from ooodev.exceptions import ex as mEx
 if TYPE_CHECKING:
     from com.sun.star.sheet import SolverConstraint  # struct
     from com.sun.star.sheet import XDataPilotTables
-    from com.sun.star.sheet import XGoalSeek
     from com.sun.star.sheet import XScenario
     from com.sun.star.sheet import XSheetCellCursor
     from com.sun.star.table import CellAddress
@@ -60,11 +70,18 @@ if TYPE_CHECKING:
 
     from ooodev.proto.style_obj import StyleT
     from ooodev.units.unit_obj import UnitT
-    from ooodev.utils.type_var import Row, Column, Table, TupleArray, FloatTable
+    from ooodev.utils.type_var import Row, Column, Table, TupleArray, FloatTable, PathOrStr
     from ooodev.calc.calc_doc import CalcDoc
+    from numpy import ndarray  # type: ignore
+    from pandas import DataFrame  # type: ignore
     from ooodev.calc.calc_charts import CalcCharts
     from ooodev.calc.spreadsheet_draw_page import SpreadsheetDrawPage
     from ooodev.calc.cell.sheet_cell_custom_properties import SheetCellCustomProperties
+    from ooodev.calc.sheet.used_area_cache import UsedAreaCache
+    from ooodev.calc.sheet.cell_write_buffer import CellWriteBuffer
+    from ooodev.calc.sheet.cell_handle import CellHandle
+    from ooodev.calc.sheet.goal_seek_results import GoalSeekResults, GoalSeekSpec
+    from ooodev.conn.office_pool import OfficePool
 
 
 class CalcSheet(
@@ -111,6 +128,8 @@ class CalcSheet(
         self._unique_id = None
         self._named_ranges = None
         self._custom_cell_properties = None
+        self._used_area_cache = None
+        self._write_batch = None
         forms = self.calc_sheet.draw_page.forms.component
         CustomPropertiesPartial.__init__(
             self, forms=forms, form_name="Form_SheetCustomProperties", ctl_name="Sheet_CustomProperties"
@@ -515,6 +534,322 @@ class CalcSheet(
 
     # endregion get_array()
 
+    # region iter_array()
+    @overload
+    def iter_array(
+        self, *, cell_range: XCellRange, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    @overload
+    def iter_array(
+        self, *, range_name: str, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        Args:
+            range_name (str): Range of data to get such as ``A1:E16``.
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    @overload
+    def iter_array(
+        self, *, range_obj: mRngObj.RangeObj, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        Args:
+            range_obj (RangeObj): Range object.
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    def iter_array(self, **kwargs) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        Only one block is held at a time, so memory use is bounded by ``chunk_rows`` rather than the size of the range.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            range_name (str): Range of data to get such as ``A1:E16``.
+            range_obj (RangeObj): Range object.
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+
+        See Also:
+            :py:meth:`~.calc.Calc.iter_array`
+
+        .. versionadded:: 0.54.0
+        """
+        sheet_names = {"range_name", "range_obj"}
+        if kwargs.keys() & sheet_names:
+            kwargs["sheet"] = self.component
+        return mCalc.Calc.iter_array(**kwargs)
+
+    # endregion iter_array()
+
+    def iter_cells(
+        self, range_obj: mRngObj.RangeObj | None = None, chunk_rows: int = 1000
+    ) -> Generator[CellHandle, None, None]:
+        """
+        Iterates over the cells of a range row by row.
+
+        Each cell is yielded as a lightweight :py:class:`~ooodev.calc.sheet.cell_handle.CellHandle`
+        whose value is read from a block of values that is shared by many cells.
+
+        Args:
+            range_obj (RangeObj, optional): Range to iterate. Defaults to the used area of the sheet.
+            chunk_rows (int, optional): Number of rows read from the sheet at a time. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            CellHandle: Handle of each cell.
+
+        See Also:
+            :py:meth:`CalcCellRange.iter_cells() <ooodev.calc.CalcCellRange.iter_cells>`
+
+        .. versionadded:: 0.54.0
+        """
+        if range_obj is None:
+            range_obj = self.used_area_cache.get_range_obj()
+        return self.get_range(range_obj=range_obj).iter_cells(chunk_rows=chunk_rows)
+
+    # region get_formula_array()
+    @overload
+    def get_formula_array(self, *, cell_range: XCellRange) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            cell_range (XCellRange): Cell range to get formulas from.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    def get_formula_array(self, *, range_name: str) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            range_name (str): Range of formulas to get such as 'A1:E16'.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    def get_formula_array(self, *, range_obj: mRngObj.RangeObj) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            range_obj (RangeObj): Range object.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    def get_formula_array(self, *, cell_obj: mCellObj.CellObj) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            cell_obj (CellObj): Cell Object.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    def get_formula_array(self, *, col_start: int, row_start: int, col_end: int, row_end: int) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    def get_formula_array(self, **kwargs) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        Args:
+            cell_range (XCellRange): Cell range to get formulas from.
+            range_name (str): Range of formulas to get such as 'A1:E16'.
+            range_obj (RangeObj): Range object.
+            cell_obj (CellObj): Cell Object.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+
+        See Also:
+            :py:meth:`Calc.get_formula_array() <ooodev.office.calc.Calc.get_formula_array>`
+
+        .. versionadded:: 0.54.0
+        """
+        sheet_names = {"range_name", "range_obj", "cell_obj", "col_start"}
+        if kwargs.keys() & sheet_names:
+            kwargs["sheet"] = self.component
+        return mCalc.Calc.get_formula_array(**kwargs)
+
+    # endregion get_formula_array()
+
+    # region set_formula_array()
+    @overload
+    def set_formula_array(self, *, formulas: Table, cell_range: XCellRange) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            cell_range (XCellRange): Range in spreadsheet to insert formulas.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_formula_array(self, *, formulas: Table, name: str) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_formula_array(self, *, formulas: Table, range_obj: mRngObj.RangeObj) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            range_obj (RangeObj): Range Object.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_formula_array(self, *, formulas: Table, cell_obj: mCellObj.CellObj) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            cell_obj (CellObj): Cell Object to start writing at.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_formula_array(
+        self, *, formulas: Table, col_start: int, row_start: int, col_end: int, row_end: int
+    ) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Returns:
+            None:
+        """
+        ...
+
+    def set_formula_array(self, **kwargs) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            cell_range (XCellRange): Range in spreadsheet to insert formulas.
+            name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
+            range_obj (RangeObj): Range Object.
+            cell_obj (CellObj): Cell Object to start writing at.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Returns:
+            None:
+
+        Example:
+            .. code-block:: python
+
+                sheet.set_formula_array(formulas=[["=A1*2", "=B1*2"], ["=A2*2", "=B2*2"]], name="D1")
+
+        See Also:
+            :py:meth:`Calc.set_formula_array() <ooodev.office.calc.Calc.set_formula_array>`
+
+        .. versionadded:: 0.54.0
+        """
+        sheet_names = {"name", "range_obj", "cell_obj", "col_start"}
+        if kwargs.keys() & sheet_names:
+            kwargs["sheet"] = self.component
+        mCalc.Calc.set_formula_array(**kwargs)
+
+    # endregion set_formula_array()
+
     # region get_float_array()
     @overload
     def get_float_array(self, *, cell_range: XCellRange) -> FloatTable:
@@ -588,6 +923,133 @@ class CalcSheet(
 
     # endregion get_float_array()
 
+    # region get_ndarray()
+    @overload
+    def get_ndarray(
+        self, *, cell_range: XCellRange, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    def get_ndarray(
+        self, *, range_name: str, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            range_name (str): Range to get values from such as 'A1:E18'.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    def get_ndarray(
+        self, *, range_obj: mRngObj.RangeObj, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            range_obj (RangeObj): Range object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    def get_ndarray(
+        self, *, cell_obj: mCellObj.CellObj, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            cell_obj (CellObj): Cell Object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    def get_ndarray(self, **kwargs) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            range_name (str): Range to get values from such as 'A1:E18'.
+            range_obj (RangeObj): Range object.
+            cell_obj (CellObj): Cell Object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+
+        Note:
+            NumPy is an optional dependency and must be installed separately.
+
+        Example:
+            .. code-block:: python
+
+                arr = sheet.get_ndarray(range_name="A1:D1000")
+                print(arr.sum(axis=0))
+
+        .. versionadded:: 0.54.0
+        """
+        sheet_names = {"range_name", "range_obj", "cell_obj"}
+        if kwargs.keys() & sheet_names:
+            kwargs["sheet"] = self.component
+        return mCalc.Calc.get_ndarray(**kwargs)
+
+    # endregion get_ndarray()
+
     def get_pilot_tables(self) -> XDataPilotTables:
         """
         Gets pivot tables (formerly known as DataPilot) for a sheet.
@@ -1345,15 +1807,87 @@ class CalcSheet(
         """
         return mCalc.Calc.set_sheet_name(self.component, name)
 
+    # region batch()
+    @contextlib.contextmanager
+    def batch(self) -> Generator[CellWriteBuffer, None, None]:
+        """
+        Context Manager. Records cell writes and writes them in blocks when the context ends.
+
+        While the context is active ``set_val()``, ``set_row()`` and ``set_col()`` of this sheet instance
+        are recorded in memory instead of being written.
+        The yielded buffer has the same methods and can be used directly.
+        When the context ends the recorded cells are merged into rectangular blocks,
+        grouped by styles, and each block is written with a single call while controllers are locked.
+
+        Yields:
+            CellWriteBuffer: Buffer that records cell writes.
+
+        Note:
+            If an exception is raised inside of the context nothing is written.
+
+            Nested calls on the same sheet instance yield the active buffer,
+            recorded cells are written when the outermost context ends.
+
+        Example:
+            .. code-block:: python
+
+                with sheet.batch():
+                    for row, item in enumerate(items):
+                        sheet.set_val(value=item.name, col=0, row=row)
+                        sheet.set_val(value=item.price, col=1, row=row)
+                        sheet.set_val(value=f"=B{row + 1}*1.2", col=2, row=row)
+
+        .. versionadded:: 0.54.0
+        """
+        if self._write_batch is not None:
+            yield self._write_batch
+            return
+
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=redefined-outer-name
+        from ooodev.calc.sheet.cell_write_buffer import CellWriteBuffer
+
+        buffer = CellWriteBuffer(sheet_idx=self.get_sheet_index())
+        self._write_batch = buffer
+        try:
+            yield buffer
+        except Exception:
+            self._write_batch = None
+            buffer.clear()
+            raise
+        self._write_batch = None
+        self._flush_write_buffer(buffer)
+
+    def _flush_write_buffer(self, buffer: CellWriteBuffer) -> None:
+        blocks = buffer.get_blocks()
+        buffer.clear()
+        if not blocks:
+            return
+        self.calc_doc.lock_controllers()
+        try:
+            for block in blocks:
+                # values is None for blocks that only apply styles
+                if block.values is not None and block.formula:
+                    mCalc.Calc.set_formula_array(block.values, self.component, block.range_obj)
+                elif block.values is not None:
+                    mCalc.Calc.set_array(block.values, self.component, block.range_obj)
+                if block.styles:
+                    self.get_range(range_obj=block.range_obj).apply_styles(*block.styles)
+        finally:
+            self.calc_doc.unlock_controllers()
+
+    # endregion batch()
+
     # region set_array()
     @overload
-    def set_array(self, *, values: Table, cell_range: XCellRange) -> None:
+    def set_array(self, *, values: Table, cell_range: XCellRange, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_range (XCellRange): Range in spreadsheet to insert data.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1361,7 +1895,9 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, cell_range: XCellRange, styles: Sequence[StyleT]) -> None:
+    def set_array(
+        self, *, values: Table, cell_range: XCellRange, styles: Sequence[StyleT], chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1369,6 +1905,7 @@ class CalcSheet(
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_range (XCellRange): Range in spreadsheet to insert data.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1376,13 +1913,14 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, name: str) -> None:
+    def set_array(self, *, values: Table, name: str, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1390,7 +1928,7 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, name: str, styles: Sequence[StyleT]) -> None:
+    def set_array(self, *, values: Table, name: str, styles: Sequence[StyleT], chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1398,6 +1936,7 @@ class CalcSheet(
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1405,13 +1944,14 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, range_obj: mRngObj.RangeObj) -> None:
+    def set_array(self, *, values: Table, range_obj: mRngObj.RangeObj, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             range_obj (RangeObj): Range Object.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1419,7 +1959,9 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, range_obj: mRngObj.RangeObj, styles: Sequence[StyleT]) -> None:
+    def set_array(
+        self, *, values: Table, range_obj: mRngObj.RangeObj, styles: Sequence[StyleT], chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1427,6 +1969,7 @@ class CalcSheet(
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             range_obj (RangeObj): Range Object.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1438,13 +1981,14 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, cell_obj: mCellObj.CellObj) -> None:
+    def set_array(self, *, values: Table, cell_obj: mCellObj.CellObj, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_obj (CellObj): Cell Object
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1452,7 +1996,9 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, cell_obj: mCellObj.CellObj, styles: Sequence[StyleT]) -> None:
+    def set_array(
+        self, *, values: Table, cell_obj: mCellObj.CellObj, styles: Sequence[StyleT], chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1460,6 +2006,7 @@ class CalcSheet(
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_obj (CellObj): Cell Object
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1467,13 +2014,14 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, addr: CellAddress) -> None:
+    def set_array(self, *, values: Table, addr: CellAddress, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1481,7 +2029,7 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, addr: CellAddress, styles: Sequence[StyleT]) -> None:
+    def set_array(self, *, values: Table, addr: CellAddress, styles: Sequence[StyleT], chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1489,6 +2037,7 @@ class CalcSheet(
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             addr (CellAddress): Address to insert data.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1496,7 +2045,9 @@ class CalcSheet(
         ...
 
     @overload
-    def set_array(self, *, values: Table, col_start: int, row_start: int, col_end: int, row_end: int) -> None:
+    def set_array(
+        self, *, values: Table, col_start: int, row_start: int, col_end: int, row_end: int, chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet
 
@@ -1506,6 +2057,7 @@ class CalcSheet(
             row_start (int): Zero-base Start Row.
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1514,7 +2066,15 @@ class CalcSheet(
 
     @overload
     def set_array(
-        self, *, values: Table, col_start: int, row_start: int, col_end: int, row_end: int, styles: Sequence[StyleT]
+        self,
+        *,
+        values: Table,
+        col_start: int,
+        row_start: int,
+        col_end: int,
+        row_end: int,
+        styles: Sequence[StyleT],
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet
@@ -1526,6 +2086,7 @@ class CalcSheet(
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -1548,13 +2109,41 @@ class CalcSheet(
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): When greater than ``0`` values are written in blocks of rows
+                holding at most ``chunk_cells`` cells each. While writing blocks controllers are locked and
+                automatic calculation is turned off. Default ``0`` writes all values in a single call.
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.ARRAY_CHUNK_WRITTEN` :eventref:`src-docs-event`
 
         Returns:
             None:
 
+        Note:
+            ``ARRAY_CHUNK_WRITTEN`` is a global event that is only triggered when ``chunk_cells`` is greater than ``0``.
+            Event arg ``event_data`` is a dictionary containing ``range_obj``, ``chunk_index``, ``rows``,
+            ``cells`` and ``elapsed`` (seconds spent writing the block).
+
+        Example:
+            .. code-block:: python
+
+                from ooodev.events.lo_events import LoEvents
+                from ooodev.events.calc_named_event import CalcNamedEvent
+
+                def on_chunk(source, args):
+                    print(args.event_data["range_obj"], args.event_data["elapsed"])
+
+                LoEvents().on(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, on_chunk)
+                sheet.set_array(values=big_table, name="A1", chunk_cells=50_000)
+
         See Also:
             - :ref:`help_calc_format_style_cell`
             - :ref:`help_calc_format_direct_cell`
+
+        .. versionchanged:: 0.54.0
+            Added ``chunk_cells`` keyword argument.
         """
         kargs = kwargs.copy()
         sheet_names = {"name", "range_obj", "cell_obj"}
@@ -1569,6 +2158,384 @@ class CalcSheet(
 
     # endregion set_array()
 
+    # region set_ndarray()
+    @overload
+    def set_ndarray(self, *, arr: ndarray, cell_range: XCellRange, chunk_cells: int = ...) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            cell_range (XCellRange): Range in spreadsheet to insert data.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_ndarray(self, *, arr: ndarray, name: str, chunk_cells: int = ...) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_ndarray(self, *, arr: ndarray, range_obj: mRngObj.RangeObj, chunk_cells: int = ...) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            range_obj (RangeObj): Range Object.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_ndarray(self, *, arr: ndarray, cell_obj: mCellObj.CellObj, chunk_cells: int = ...) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            cell_obj (CellObj): Cell Object.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    def set_ndarray(self, *, arr: ndarray, addr: CellAddress, chunk_cells: int = ...) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+        """
+        ...
+
+    def set_ndarray(self, **kwargs) -> None:
+        """
+        Inserts a 2-Dimensional ``numpy.ndarray`` into spreadsheet.
+
+        ``NaN`` values are written as empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array of values.
+            cell_range (XCellRange): Range in spreadsheet to insert data.
+            name (str): Range name such as 'A1:D4' or cell name such as 'B4'.
+            range_obj (RangeObj): Range Object.
+            cell_obj (CellObj): Cell Object.
+            addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells to write per block. See :py:meth:`~.CalcSheet.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            None:
+
+        Note:
+            NumPy is an optional dependency and must be installed separately.
+
+        .. versionadded:: 0.54.0
+        """
+        kargs = kwargs.copy()
+        sheet_names = {"name", "range_obj", "cell_obj"}
+
+        if kargs.keys() & sheet_names:
+            kargs["sheet"] = self.component
+
+        if "addr" in kargs:
+            kargs["doc"] = self.calc_doc.component
+
+        mCalc.Calc.set_ndarray(**kargs)
+
+    # endregion set_ndarray()
+
+    def write_dataframe(
+        self,
+        df: DataFrame,
+        cell_obj: mCellObj.CellObj | str,
+        header: bool = True,
+        index: bool = False,
+        format_dates: bool = True,
+    ) -> mCalcCellRange.CalcCellRange:
+        """
+        Writes a pandas ``DataFrame`` into the sheet.
+
+        Adjacent columns of the same kind (numbers, dates or text) are converted together and written with a single
+        ``setDataArray()`` call per block. Missing values are written as empty cells and datetime columns are written
+        as Calc serial dates.
+
+        Args:
+            df (DataFrame): Data frame to write.
+            cell_obj (CellObj | str): Top left cell to start writing at such as ``A1``.
+            header (bool, optional): If ``True`` column names are written as the first row. Defaults to ``True``.
+            index (bool, optional): If ``True`` the index of the data frame is written as the first column(s). Defaults to ``False``.
+            format_dates (bool, optional): If ``True`` the standard date format is applied to datetime columns. Defaults to ``True``.
+
+        Raises:
+            ImportError: If ``pandas`` is not installed.
+            ValueError: If ``df`` has no columns.
+
+        Returns:
+            CalcCellRange: Range that was written including the header row.
+
+        Note:
+            pandas is an optional dependency and must be installed separately.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.write_dataframe(df, "A1")
+                df2 = rng.to_dataframe()
+
+        .. versionadded:: 0.54.0
+        """
+        DataFrameHelper.import_pandas()
+        if index:
+            df = df.reset_index()
+        col_count = len(df.columns)
+        if col_count == 0:
+            raise ValueError("DataFrame has no columns to write")
+        if isinstance(cell_obj, str):
+            cell_obj = mCellObj.CellObj.from_cell(cell_obj)
+
+        doc = self.calc_doc.component
+        col_start = cell_obj.col_obj.index
+        row_start = cell_obj.row - 1
+        data_row = row_start + 1 if header else row_start
+        row_end = data_row + len(df) - 1
+        blocks = DataFrameHelper.dataframe_to_blocks(df, mCalc.Calc.get_null_date(doc))
+
+        self.calc_doc.lock_controllers()
+        try:
+            if header:
+                cell_range = self.component.getCellRangeByPosition(
+                    col_start, row_start, col_start + col_count - 1, row_start
+                )
+                mCalc.Calc.set_array(DataFrameHelper.get_header_row(df), cell_range)
+            for block in blocks:
+                block_col = col_start + block.col
+                cell_range = self.component.getCellRangeByPosition(
+                    block_col, data_row, block_col + block.col_count - 1, row_end
+                )
+                mCalc.Calc.set_array(block.values, cell_range)
+                if format_dates and block.kind == "date":
+                    key = mCalc.Calc.get_date_format_key(doc, with_time=block.has_time)
+                    mProps.Props.set(cell_range, NumberFormat=key)
+        finally:
+            self.calc_doc.unlock_controllers()
+
+        return self.get_range(
+            col_start=col_start,
+            row_start=row_start,
+            col_end=col_start + col_count - 1,
+            row_end=max(row_end, row_start),
+        )
+
+    def import_csv(
+        self,
+        path: PathOrStr,
+        cell_obj: mCellObj.CellObj | str,
+        chunk_rows: int = 10_000,
+        delimiter: str | None = None,
+        quotechar: str = '"',
+        encoding: str = "utf-8",
+        decimal: str = ".",
+        convert_numbers: bool = True,
+        convert_dates: bool = True,
+        format_dates: bool = True,
+        skip_rows: int = 0,
+        max_workers: int | None = None,
+    ) -> mCalcCellRange.CalcCellRange | None:
+        """
+        Imports a CSV or TSV file into the sheet.
+
+        The file is read in blocks of ``chunk_rows`` records that are parsed in a process pool.
+        Each block is written with a single ``setDataArray()`` call as soon as it is parsed,
+        so memory use depends on ``chunk_rows`` and not on the size of the file.
+        Controllers are locked and automatic calculation is turned off while importing,
+        the document is calculated once when the import is done.
+
+        Numeric fields are written as numbers and ISO 8601 dates such as ``2024-01-31`` or ``2024-01-31 13:45:00``
+        are written as serial dates. All other fields are written as text.
+
+        Args:
+            path (PathOrStr): Path of the file to import.
+            cell_obj (CellObj | str): Top left cell to start importing at such as ``A1``.
+            chunk_rows (int, optional): Maximum number of records in a block. Defaults to ``10_000``.
+            delimiter (str, optional): Field delimiter. Defaults to tab for ``.tsv`` and ``.tab`` files; Otherwise, comma.
+            quotechar (str, optional): Character used to quote fields. Defaults to ``"``.
+            encoding (str, optional): Encoding of the file, must be ASCII compatible. Defaults to ``utf-8``.
+            decimal (str, optional): Decimal separator of numbers. Defaults to ``.``.
+            convert_numbers (bool, optional): If ``True`` numeric fields are written as numbers. Defaults to ``True``.
+            convert_dates (bool, optional): If ``True`` date fields are written as serial dates. Defaults to ``True``.
+            format_dates (bool, optional): If ``True`` the standard date format is applied to imported dates. Defaults to ``True``.
+            skip_rows (int, optional): Number of records to skip at the start of the file. Defaults to ``0``.
+            max_workers (int, optional): Number of worker processes used to parse blocks.
+                Defaults to the number of processors. When ``0`` blocks are parsed in the current process.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            CancelEventError: If ``CSV_IMPORTING`` event is canceled.
+
+        Returns:
+            CalcCellRange | None: Range that was imported or ``None`` if the file has no data.
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.CSV_IMPORTING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.CSV_IMPORT_PROGRESS` :eventref:`src-docs-event`
+                - :py:attr:`~ooodev.events.calc_named_event.CalcNamedEvent.CSV_IMPORTED` :eventref:`src-docs-event`
+
+        Note:
+            ``CSV_IMPORT_PROGRESS`` is triggered after each block is written. Event arg ``event_data`` is a dictionary
+            containing ``path``, ``chunk_index``, ``rows`` (rows imported so far), ``bytes_read`` and ``total_bytes``.
+
+            Use ``max_workers=0`` when running inside of the office, such as from a macro,
+            where new Python processes cannot be started.
+            Worker processes are started with ``spawn`` and import the main module again,
+            so scripts must start importing from an ``if __name__ == "__main__":`` block.
+
+        Example:
+            .. code-block:: python
+
+                def on_progress(source: Any, args: EventArgs) -> None:
+                    data = args.event_data
+                    print(f"{data['bytes_read'] / data['total_bytes']:.0%}")
+
+                sheet.subscribe_event(CalcNamedEvent.CSV_IMPORT_PROGRESS, on_progress)
+                rng = sheet.import_csv("data.csv", "A1", chunk_rows=50_000)
+
+        .. versionadded:: 0.54.0
+        """
+        if isinstance(cell_obj, str):
+            cell_obj = mCellObj.CellObj.from_cell(cell_obj)
+        cargs = CancelEventArgs(self.import_csv.__qualname__)
+        cargs.event_data = {"path": path, "cell_obj": cell_obj, "chunk_rows": chunk_rows}
+        self.trigger_event(CalcNamedEvent.CSV_IMPORTING, cargs)
+        if cargs.cancel:
+            raise mEx.CancelEventError(cargs)
+
+        doc = self.calc_doc.component
+        options = CsvOptions(
+            delimiter=delimiter or CsvHelper.get_delimiter(path),
+            quotechar=quotechar,
+            encoding=encoding,
+            decimal=decimal,
+            convert_numbers=convert_numbers,
+            convert_dates=convert_dates,
+            null_date=mCalc.Calc.get_null_date(doc),
+        )
+        total_bytes = Path(path).stat().st_size
+        col_start = cell_obj.col_obj.index
+        row_start = cell_obj.row - 1
+        col_count = 0
+        row_count = 0
+        bytes_read = 0
+        date_keys = {}
+
+        with self.calc_doc.calculation_suspended():
+            for block in CsvHelper.iter_blocks(
+                path=path, chunk_rows=chunk_rows, options=options, skip_rows=skip_rows, max_workers=max_workers
+            ):
+                bytes_read += block.byte_count
+                if block.col_count > 0:
+                    row = row_start + block.row_offset
+                    row_end = row + block.row_count - 1
+                    cell_range = self.component.getCellRangeByPosition(
+                        col_start, row, col_start + block.col_count - 1, row_end
+                    )
+                    mCalc.Calc.set_array(block.values, cell_range)
+                    if format_dates:
+                        for col in block.date_columns:
+                            with_time = col in block.time_columns
+                            if with_time not in date_keys:
+                                date_keys[with_time] = mCalc.Calc.get_date_format_key(doc, with_time=with_time)
+                            date_range = self.component.getCellRangeByPosition(
+                                col_start + col, row, col_start + col, row_end
+                            )
+                            mProps.Props.set(date_range, NumberFormat=date_keys[with_time])
+                    col_count = max(col_count, block.col_count)
+                    row_count = block.row_offset + block.row_count
+
+                eargs = EventArgs(self.import_csv.__qualname__)
+                eargs.event_data = {
+                    "path": path,
+                    "chunk_index": block.index,
+                    "rows": row_count,
+                    "bytes_read": bytes_read,
+                    "total_bytes": total_bytes,
+                }
+                self.trigger_event(CalcNamedEvent.CSV_IMPORT_PROGRESS, eargs)
+
+        eargs = EventArgs.from_args(cargs)
+        eargs.event_data["rows"] = row_count
+        eargs.event_data["cols"] = col_count
+        self.trigger_event(CalcNamedEvent.CSV_IMPORTED, eargs)
+        if col_count == 0:
+            return None
+        return self.get_range(
+            col_start=col_start,
+            row_start=row_start,
+            col_end=col_start + col_count - 1,
+            row_end=row_start + row_count - 1,
+        )
+
     # region set_array_range()
     @overload
     def set_array_range(self, *, range_name: str, values: Table) -> None:
@@ -1810,7 +2777,16 @@ class CalcSheet(
             cell_obj (CellObj): Cell Object.
             col_start (int): Zero-base column index.
             row_start (int): Zero-base row index.
+
+        Note:
+            When called inside of :py:meth:`~.CalcSheet.batch` the values are recorded and written when the batch ends.
+
+        .. versionchanged:: 0.54.0
+            Values are recorded when called inside of :py:meth:`~.CalcSheet.batch`.
         """
+        if self._write_batch is not None:
+            self._write_batch.set_col(*args, **kwargs)
+            return
         mCalc.Calc.set_col(self.component, *args, **kwargs)
 
     # endregion set_col()
@@ -1984,7 +2960,16 @@ class CalcSheet(
             cell_name (str): Name of Cell to begin the insert such as 'A1'.
             col_start (int): Zero-base column index.
             row_start (int): Zero-base row index.
+
+        Note:
+            When called inside of :py:meth:`~.CalcSheet.batch` the values are recorded and written when the batch ends.
+
+        .. versionchanged:: 0.54.0
+            Values are recorded when called inside of :py:meth:`~.CalcSheet.batch`.
         """
+        if self._write_batch is not None:
+            self._write_batch.set_row(*args, **kwargs)
+            return
         mCalc.Calc.set_row(self.component, *args, **kwargs)
 
     # endregion set_row()
@@ -2157,10 +3142,20 @@ class CalcSheet(
         Returns:
             None:
 
+        Note:
+            When called inside of :py:meth:`~.CalcSheet.batch` the value is recorded and written when the batch ends.
+            Values set using ``cell`` are always written immediately.
+
         See Also:
             - :ref:`help_calc_format_style_cell`
             - :ref:`help_calc_format_direct_cell`
+
+        .. versionchanged:: 0.54.0
+            Values are recorded when called inside of :py:meth:`~.CalcSheet.batch`.
         """
+        if self._write_batch is not None and "cell" not in kwargs:
+            self._write_batch.set_val(**kwargs)
+            return
         sheet_names = {"cell_name", "cell_obj", "col"}
         if kwargs.keys() & sheet_names:
             kwargs["sheet"] = self.component
@@ -2383,6 +3378,154 @@ class CalcSheet(
             gs=gs, sheet=self.component, cell_name=cell_name, formula_cell_name=formula_cell_name, result=result
         )
 
+    def goal_seek_many(
+        self,
+        specs: Iterable[GoalSeekSpec | Tuple[str | mCellObj.CellObj, str | mCellObj.CellObj, int | float]],
+        apply: bool = False,
+        max_divergence: float = 0.1,
+        pool: OfficePool | None = None,
+    ) -> GoalSeekResults:
+        """
+        Runs many goal seeks on this sheet.
+
+        Controllers are locked while the goal seeks run. Automatic calculation stays on,
+        so goal seeks through chains of formula cells see up to date values.
+        Cell addresses are computed without calling the spreadsheet, leaving one ``seekGoal()`` call per goal seek.
+        A goal seek that does not converge or raises an error does not stop the others.
+
+        Args:
+            specs (Iterable[GoalSeekSpec | Tuple[str | CellObj, str | CellObj, int | float]]): Goal seeks as
+                ``(formula_cell, variable_cell, target)``, such as ``("C1", "A1", 42)``.
+            apply (bool, optional): If ``True`` the result of each goal seek that converged is written to its
+                variable cell with automatic calculation turned off and the document is calculated once at the end.
+                Defaults to ``False``.
+            max_divergence (float, optional): Goal seeks with a divergence less than this value have converged.
+                Defaults to ``0.1``, the same as ``goal_seek()``.
+            pool (OfficePool, optional): When given, the document is stored to a temporary file and
+                the goal seeks are split into one chunk per instance of the pool. Each instance opens the file and
+                runs its chunk. Defaults to ``None`` (goal seeks run in the office of this document).
+
+        Returns:
+            GoalSeekResults: Results and divergences in the order of ``specs``.
+
+        Note:
+            Each goal seek runs against the current values of the sheet, results are written after all goal seeks
+            have run. Goal seeks are independent, so with ``pool`` they give the same results
+            as without it. Storing and opening the document takes time, so a pool only pays off when
+            the goal seeks take longer than that.
+
+        Example:
+            .. code-block:: python
+
+                results = sheet.goal_seek_many([("C1", "A1", 10), ("C2", "A2", 20)], apply=True)
+                if results.get_failed():
+                    print(results.divergences)
+
+            Goal seeks can be spread across the instances of an office pool.
+
+            .. code-block:: python
+
+                from ooodev.conn.office_pool import OfficePool
+
+                with OfficePool(size=4) as pool:
+                    results = sheet.goal_seek_many(specs, apply=True, pool=pool)
+
+        .. versionadded:: 0.54.0
+        """
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=redefined-outer-name
+        from ooodev.calc.sheet.goal_seek_results import GoalSeekResults, GoalSeekSpec
+
+        start = time.perf_counter()
+        seeks = [GoalSeekSpec(*spec) for spec in specs]
+        if pool is None:
+            results, divergences = CalcSheet._goal_seek_specs(self.calc_doc, self.sheet_index, seeks)
+        else:
+            results, divergences = self._goal_seek_pool(pool, seeks)
+
+        if apply:
+            with self.calc_doc.calculation_suspended():
+                with self.batch() as buffer:
+                    for spec, result, divergence in zip(seeks, results, divergences):
+                        if divergence < max_divergence:
+                            _, _, col, row = spec.get_positions()
+                            buffer.add(col, row, result)
+
+        return GoalSeekResults(
+            results=results,
+            divergences=divergences,
+            max_divergence=max_divergence,
+            elapsed=time.perf_counter() - start,
+        )
+
+    @staticmethod
+    def _goal_seek_specs(calc_doc: CalcDoc, idx: int, seeks: List[GoalSeekSpec]) -> Tuple[List[float], List[float]]:
+        # pylint: disable=import-outside-toplevel
+        from ooo.dyn.table.cell_address import CellAddress
+
+        gs = calc_doc.qi(XGoalSeek, True)
+        results: List[float] = []
+        divergences: List[float] = []
+        # automatic calculation must stay on, with it off Calc does not update formula cells between
+        # the formula cell and the variable cell while seeking.
+        calc_doc.lock_controllers()
+        try:
+            for spec in seeks:
+                f_col, f_row, v_col, v_row = spec.get_positions()
+                try:
+                    goal_result = gs.seekGoal(
+                        CellAddress(idx, f_col, f_row), CellAddress(idx, v_col, v_row), f"{float(spec.target)}"
+                    )
+                    results.append(goal_result.Result)
+                    divergences.append(goal_result.Divergence)
+                except Exception as e:
+                    mLo.Lo.print(f"Goal seek of {spec} failed: {e}")
+                    results.append(math.nan)
+                    divergences.append(math.inf)
+        finally:
+            calc_doc.unlock_controllers()
+        return results, divergences
+
+    @staticmethod
+    def _goal_seek_job(
+        lo_inst: LoInst, fnm: Path, idx: int, seeks: List[GoalSeekSpec]
+    ) -> Tuple[List[float], List[float]]:
+        # runs in an instance of an office pool.
+        # pylint: disable=import-outside-toplevel
+        from ooodev.calc.calc_doc import CalcDoc
+
+        doc = CalcDoc.open_doc(fnm, lo_inst=lo_inst)
+        try:
+            return CalcSheet._goal_seek_specs(doc, idx, seeks)
+        finally:
+            doc.close()
+
+    def _goal_seek_pool(self, pool: OfficePool, seeks: List[GoalSeekSpec]) -> Tuple[List[float], List[float]]:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import wait
+
+        results: List[float] = []
+        divergences: List[float] = []
+        if not seeks:
+            return results, divergences
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fnm = Path(tmp_dir, "goal_seek.ods")
+            if not self.calc_doc.save_doc(fnm):
+                mLo.Lo.print("Document could not be stored for the office pool, goal seeks run in this office")
+                return CalcSheet._goal_seek_specs(self.calc_doc, self.sheet_index, seeks)
+            size = math.ceil(len(seeks) / pool.size)
+            futures = [
+                pool.submit(CalcSheet._goal_seek_job, fnm, self.sheet_index, seeks[i : i + size])
+                for i in range(0, len(seeks), size)
+            ]
+            # the file is removed when all jobs are done with it, even when one of them fails.
+            wait(futures)
+            for future in futures:
+                chunk_results, chunk_divergences = future.result()
+                results.extend(chunk_results)
+                divergences.extend(chunk_divergences)
+        return results, divergences
+
     def delete_column(self, idx: int, count: int = 1) -> bool:
         """
         Delete a column from a spreadsheet.
@@ -2939,6 +4082,59 @@ class CalcSheet(
             return None
         return [mCalcCellRange.CalcCellRange(owner=self, rng=x, lo_inst=self.lo_inst) for x in found]
 
+    def search_values(
+        self,
+        pattern: str,
+        regex: bool = True,
+        range_obj: mRngObj.RangeObj | None = None,
+        match_case: bool = False,
+        whole_cell: bool = False,
+        use_cache: bool = True,
+    ) -> List[mCellObj.CellObj]:
+        """
+        Searches the values of the sheet in memory.
+
+        The values are read once with a single ``getDataArray()`` call and kept in the
+        :py:attr:`~.CalcSheet.used_area_cache` until the sheet is modified.
+        Matches are returned as cell objects, no call is made to the office for each match.
+        This is much faster than :py:meth:`~.CalcSheet.find_all` when there are many matches or many searches.
+
+        Args:
+            pattern (str): Text or regular expression to search for.
+            regex (bool, optional): If ``True`` ``pattern`` is a Python regular expression;
+                Otherwise, it is plain text. Defaults to ``True``.
+            range_obj (RangeObj, optional): Range to search. Defaults to the used area of the sheet.
+            match_case (bool, optional): If ``True`` the search is case sensitive. Defaults to ``False``.
+            whole_cell (bool, optional): If ``True`` the pattern must match the whole cell text. Defaults to ``False``.
+            use_cache (bool, optional): If ``False`` the values are read from the sheet again. Defaults to ``True``.
+
+        Raises:
+            re.error: If ``pattern`` is not a valid regular expression.
+
+        Returns:
+            List[CellObj]: Cells that match in row order.
+
+        Note:
+            Cell values are searched, not the text that is displayed.
+            Numbers are searched without their number format, such as ``1234.5``.
+            Formula cells are searched by their result.
+
+        Example:
+            .. code-block:: python
+
+                cells = sheet.search_values(r"^INV-\\d{6}$")
+                for cell_obj in cells:
+                    print(cell_obj)
+
+        .. versionadded:: 0.54.0
+        """
+        snapshot = self.used_area_cache.get_snapshot(range_obj=range_obj, use_cache=use_cache)
+        sheet_idx = self.sheet_index
+        return [
+            mCellObj.CellObj.from_idx(col_idx=col, row_idx=row, sheet_idx=sheet_idx)
+            for col, row in snapshot.search(pattern, regex=regex, match_case=match_case, whole_cell=whole_cell)
+        ]
+
     # region find_function()
     @overload
     def find_function(self, func_nm: str) -> Tuple[PropertyValue] | None:
@@ -3001,12 +4197,13 @@ class CalcSheet(
 
     # region find_used()
     @overload
-    def find_used(
-        self,
-    ) -> mCalcCellRange.CalcCellRange:
+    def find_used(self, *, use_cache: bool = ...) -> mCalcCellRange.CalcCellRange:
         """
         Find used range
 
+        Args:
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+
         Returns:
             CalcCellRange: Cell range
         """
@@ -3059,13 +4256,23 @@ class CalcSheet(
             range_name (str): Range Name such as 'A1:D5'
             range_obj (RangeObj): Range Object
             cr_addr (CellRangeAddress): Cell range Address
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+                Only applies when no range is passed in.
 
         Returns:
             CalcCellRange: Cell range
 
         See Also:
             - :ref:`ch20_finding_with_cursors`
+            - :py:attr:`~.CalcSheet.used_area_cache`
+
+        .. versionchanged:: 0.54.0
+            When no range is passed in the used area is returned from the sheet :py:attr:`~.CalcSheet.used_area_cache`.
         """
+        use_cache = bool(kwargs.pop("use_cache", True))
+        if not args and not kwargs:
+            rng = self.used_area_cache.get_range_obj(use_cache=use_cache)
+            return mCalcCellRange.CalcCellRange(owner=self, rng=rng, lo_inst=self.lo_inst)
         found = mCalc.Calc.find_used_range(self.component, *args, **kwargs)
         return mCalcCellRange.CalcCellRange(owner=self, rng=found, lo_inst=self.lo_inst)
 
@@ -3073,10 +4280,13 @@ class CalcSheet(
 
     # region find_used_range_obj()
     @overload
-    def find_used_range_obj(self) -> mRngObj.RangeObj:
+    def find_used_range_obj(self, *, use_cache: bool = ...) -> mRngObj.RangeObj:
         """
         Find used range
 
+        Args:
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+
         Returns:
             RangeObj: Range object
         """
@@ -3129,20 +4339,34 @@ class CalcSheet(
             range_name (str): Range Name such as 'A1:D5'
             range_obj (RangeObj): Range Object
             cr_addr (CellRangeAddress): Cell range Address
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+                Only applies when no range is passed in.
 
         Returns:
             RangeObj: Range object
+
+        See Also:
+            :py:attr:`~.CalcSheet.used_area_cache`
+
+        .. versionchanged:: 0.54.0
+            When no range is passed in the used area is returned from the sheet :py:attr:`~.CalcSheet.used_area_cache`.
         """
+        use_cache = bool(kwargs.pop("use_cache", True))
+        if not args and not kwargs:
+            return self.used_area_cache.get_range_obj(use_cache=use_cache)
         return mCalc.Calc.find_used_range_obj(self.component, *args, **kwargs)
 
     # endregion find_used_range_obj()
 
     # region find_used_range()
     @overload
-    def find_used_range(self) -> mCalcCellRange.CalcCellRange:
+    def find_used_range(self, *, use_cache: bool = ...) -> mCalcCellRange.CalcCellRange:
         """
         Find used range
 
+        Args:
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+
         Returns:
             CalcCellRange: Cell Range.
         """
@@ -3195,9 +4419,14 @@ class CalcSheet(
             range_name (str): Range Name such as 'A1:D5'
             range_obj (RangeObj): Range Object
             cr_addr (CellRangeAddress): Cell range Address
+            use_cache (bool, optional): If ``False`` the cached used area is refreshed. Defaults to ``True``.
+                Only applies when no range is passed in.
 
         Returns:
             CalcCellRange: Cell Range.
+
+        .. versionchanged:: 0.54.0
+            When no range is passed in the used area is returned from the sheet :py:attr:`~.CalcSheet.used_area_cache`.
         """
         rng = self.find_used_range_obj(*args, **kwargs)
         return mCalcCellRange.CalcCellRange(self, rng)
@@ -3810,6 +5039,56 @@ class CalcSheet(
             kwargs["sheet"] = self.component
         mCalc.Calc.set_style_range(**kwargs)
 
+    def set_style_ranges(
+        self,
+        ranges: RangeSet | Iterable[mRngObj.RangeObj | mCellObj.CellObj | str],
+        styles: Sequence[StyleT],
+    ) -> None:
+        """
+        Set style/formatting on many ranges at once.
+
+        Ranges are merged into a single ``com.sun.star.sheet.SheetCellRanges`` container and each style is applied
+        to the container once, rather than once for each range.
+
+        Args:
+            ranges (RangeSet | Iterable[RangeObj | CellObj | str]): Ranges or cells to style, such as search results.
+                Overlapping ranges are merged. Ranges are applied to this sheet whatever their sheet index.
+            styles (Sequence[StyleT]): One or more styles to apply to the ranges.
+
+        Returns:
+            None:
+
+        Example:
+            .. code-block:: python
+
+                from ooodev.format.calc.direct.cell.background import Color as BgColor
+                from ooodev.utils.color import StandardColor
+
+                cells = [f"{'AC'[row % 2]}{row + 1}" for row in range(100)]
+                sheet.set_style_ranges(cells, [BgColor(StandardColor.GREEN_LIGHT2)])
+
+        See Also:
+            - :py:class:`~ooodev.utils.data_type.range_set.RangeSet`
+            - :py:meth:`~.CalcSheet.set_style_range`
+
+        .. versionadded:: 0.54.0
+        """
+        rs = ranges if isinstance(ranges, RangeSet) else RangeSet(ranges)
+        if not rs or not styles:
+            return
+        rs = RangeSet.from_indexes((rect[1:] for rect in rs.get_indexes()), sheet_idx=self.sheet_index)
+        cell_ranges = rs.get_sheet_cell_ranges(doc=self.calc_doc)
+        supported_styles = (
+            "com.sun.star.style.CharacterProperties",
+            "com.sun.star.style.ParagraphProperties",
+            "com.sun.star.table.CellProperties",
+            "com.sun.star.sheet.SheetCellRange",
+            "com.sun.star.sheet.SheetCell",
+        )
+        for style in styles:
+            if style.support_service(*supported_styles):
+                style.apply(cell_ranges.component)
+
     # region make_constraint()
     @overload
     def make_constraint(self, *, num: int | float, op: str, addr: CellAddress) -> SolverConstraint:
@@ -4032,6 +5311,38 @@ class CalcSheet(
             self._unique_id = sheet_id.id
         return self._unique_id
 
+    @property
+    def used_area_cache(self) -> UsedAreaCache:
+        """
+        Gets the used area cache of the sheet.
+
+        The cache is shared by all ``CalcSheet`` instances of the same sheet and is invalidated
+        by a modify listener when the sheet content changes.
+        ``find_used()``, ``find_used_range()`` and ``find_used_range_obj()`` use this cache when called without a range.
+
+        Returns:
+            UsedAreaCache: Used area cache.
+
+        Example:
+            .. code-block:: python
+
+                rng = sheet.find_used_range_obj()
+                rng = sheet.find_used_range_obj()
+                print(sheet.used_area_cache.hits, sheet.used_area_cache.misses)  # 1 1
+
+                # force a fresh lookup
+                rng = sheet.find_used_range_obj(use_cache=False)
+
+        .. versionadded:: 0.54.0
+        """
+        if self._used_area_cache is None:
+            # pylint: disable=import-outside-toplevel
+            # pylint: disable=redefined-outer-name
+            from ooodev.calc.sheet.used_area_cache import UsedAreaCache
+
+            self._used_area_cache = UsedAreaCache.get_cache(self.component, self.calc_doc.runtime_uid)
+        return self._used_area_cache
+
     @property
     def named_ranges(self) -> NamedRangesComp:
         """
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+from ooodev.utils.data_type import cell_obj as mCellObj
+
+if TYPE_CHECKING:
+    from ooodev.calc.calc_cell import CalcCell
+    from ooodev.calc.calc_sheet import CalcSheet
+    from ooodev.utils.data_type.range_obj import RangeObj
+    from ooodev.utils.type_var import TupleArray
+
+
+class CellHandleBlock:
+    """
+    Values of a block of cells that are shared by every :py:class:`CellHandle` of the block.
+
+    Values are read with a single ``getDataArray()`` call.
+    Formulas are read with a single ``getFormulaArray()`` call the first time a formula of the block is requested.
+
+    .. versionadded:: 0.54.0
+    """
+
+    __slots__ = ("_owner", "_range_obj", "_values", "_formulas")
+
+    def __init__(self, owner: CalcSheet, range_obj: RangeObj, values: TupleArray | None = None) -> None:
+        """
+        Constructor
+
+        Args:
+            owner (CalcSheet): Sheet that contains the block.
+            range_obj (RangeObj): Range of the block.
+            values (TupleArray, optional): Values of the block if already read. Defaults to reading them on first use.
+        """
+        self._owner = owner
+        self._range_obj = range_obj
+        self._values = values
+        self._formulas: TupleArray | None = None
+
+    def get_value(self, col: int, row: int) -> Any:
+        """
+        Gets a value of the block.
+
+        Args:
+            col (int): Zero-based column index relative to the start of the block.
+            row (int): Zero-based row index relative to the start of the block.
+
+        Returns:
+            Any: Cell value.
+        """
+        if self._values is None:
+            self._values = self._owner.get_array(range_obj=self._range_obj)
+        return self._values[row][col]
+
+    def get_formula(self, col: int, row: int) -> str:
+        """
+        Gets a formula of the block.
+
+        Args:
+            col (int): Zero-based column index relative to the start of the block.
+            row (int): Zero-based row index relative to the start of the block.
+
+        Returns:
+            str: Cell formula. For cells without a formula the content of the cell as a string.
+        """
+        if self._formulas is None:
+            self._formulas = self._owner.get_formula_array(range_obj=self._range_obj)
+        return self._formulas[row][col]
+
+    # region Properties
+    @property
+    def owner(self) -> CalcSheet:
+        """Gets the sheet that contains the block."""
+        return self._owner
+
+    @property
+    def range_obj(self) -> RangeObj:
+        """Gets the range of the block."""
+        return self._range_obj
+
+    # endregion Properties
+
+
+class CellHandle:
+    """
+    Lightweight reference to a cell of a :py:class:`CellHandleBlock`.
+
+    A handle only stores its position and the block it belongs to.
+    Reading :py:attr:`~.CellHandle.value` or :py:attr:`~.CellHandle.formula` does not call the office
+    for each cell, use :py:meth:`~.CellHandle.get_cell` when the full :py:class:`~ooodev.calc.CalcCell` is needed.
+
+    Values are those of the block when it was read and are not updated when the sheet changes.
+
+    See Also:
+        :py:meth:`CalcCellRange.iter_cells() <ooodev.calc.CalcCellRange.iter_cells>`
+
+    .. versionadded:: 0.54.0
+    """
+
+    __slots__ = ("_block", "_col", "_row")
+
+    def __init__(self, block: CellHandleBlock, col: int, row: int) -> None:
+        """
+        Constructor
+
+        Args:
+            block (CellHandleBlock): Block the cell belongs to.
+            col (int): Zero-based column index relative to the start of the block.
+            row (int): Zero-based row index relative to the start of the block.
+        """
+        self._block = block
+        self._col = col
+        self._row = row
+
+    def __repr__(self) -> str:
+        return f"<CellHandle {self.cell_obj}>"
+
+    def get_cell(self) -> CalcCell:
+        """
+        Gets the full cell.
+
+        Returns:
+            CalcCell: Cell.
+        """
+        return self._block.owner.get_cell(cell_obj=self.cell_obj)
+
+    # region Properties
+    @property
+    def col(self) -> int:
+        """Gets the zero-based column index of the cell on the sheet."""
+        return self._block.range_obj.start_col_index + self._col
+
+    @property
+    def row(self) -> int:
+        """Gets the zero-based row index of the cell on the sheet."""
+        return self._block.range_obj.start_row_index + self._row
+
+    @property
+    def sheet_idx(self) -> int:
+        """Gets the index of the sheet that contains the cell."""
+        return self._block.range_obj.sheet_idx
+
+    @property
+    def cell_obj(self) -> mCellObj.CellObj:
+        """Gets the cell object of the cell."""
+        return mCellObj.CellObj.from_idx(col_idx=self.col, row_idx=self.row, sheet_idx=self.sheet_idx)
+
+    @property
+    def value(self) -> Any:
+        """Gets the value of the cell from the shared values of its block."""
+        return self._block.get_value(self._col, self._row)
+
+    @property
+    def formula(self) -> str:
+        """Gets the formula of the cell from the shared formulas of its block."""
+        return self._block.get_formula(self._col, self._row)
+
+    # endregion Properties
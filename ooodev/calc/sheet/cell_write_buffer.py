@@ -0,0 +1,326 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+from ooodev.utils.data_type import cell_obj as mCellObj
+from ooodev.utils.data_type import range_obj as mRngObj
+from ooodev.utils.data_type import range_values as mRngValues
+
+if TYPE_CHECKING:
+    from ooodev.proto.style_obj import StyleT
+    from ooodev.utils.type_var import Column, Row
+
+
+class CellBlock(NamedTuple):
+    """Rectangular block of recorded cells that can be written with a single call."""
+
+    range_obj: mRngObj.RangeObj
+    """Range of the block"""
+    values: Tuple[Tuple[Any, ...], ...] | None
+    """2-Dimensional values of the block, ``None`` if the block only applies styles"""
+    styles: Tuple[StyleT, ...] | None
+    """Styles to apply to the block, if any"""
+    formula: bool
+    """If ``True`` values are strings that must be written as formulas; Otherwise, values are written as data"""
+
+
+class _CellEntry(NamedTuple):
+    value: Any
+    group: Tuple[Tuple[int, ...], bool]
+
+
+class CellWriteBuffer:
+    """
+    Records cell writes in memory and merges them into rectangular blocks.
+
+    Recorded cells are grouped by their styles and by how they are written,
+    each group is then merged into as few rectangular blocks as possible.
+    Every block only contains recorded cells, so writing a block never overwrites a cell that was not recorded.
+    When a cell is recorded more than once the last value wins.
+
+    This class does not access a spreadsheet and can be used without a running office.
+
+    Note:
+        Values recorded with :py:meth:`~.CellWriteBuffer.set_val` follow the rules of ``Calc.set_val()``:
+        numbers are written as values and strings are written as formulas, so ``=SUM(A1:A3)`` becomes a formula.
+        Values recorded with :py:meth:`~.CellWriteBuffer.set_row` are written as data like ``Calc.set_row()``.
+
+    See Also:
+        :py:meth:`CalcSheet.batch() <ooodev.calc.CalcSheet.batch>`
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, sheet_idx: int = -2) -> None:
+        """
+        Constructor
+
+        Args:
+            sheet_idx (int, optional): Sheet index that is assigned to the range of each block. Defaults to ``-2`` (no sheet index).
+        """
+        self._sheet_idx = sheet_idx
+        self._cells: Dict[Tuple[int, int], _CellEntry] = {}
+        self._styles: Dict[Tuple[int, ...], Tuple[StyleT, ...]] = {}
+        # cells that only get styles, such as from set_val() with a value that is not written.
+        self._style_cells: Dict[Tuple[int, int], Tuple[StyleT, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cells.keys() | self._style_cells.keys())
+
+    # region Static Methods
+    @staticmethod
+    def merge_cells(cells: Iterable[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+        """
+        Merges cell positions into rectangles that cover exactly those cells.
+
+        Cells of each row are first joined into horizontal runs,
+        runs that span the same columns in consecutive rows are then joined into rectangles.
+
+        Args:
+            cells (Iterable[Tuple[int, int]]): Zero-based ``(col, row)`` positions.
+
+        Returns:
+            List[Tuple[int, int, int, int]]: Rectangles as zero-based ``(col_start, row_start, col_end, row_end)``.
+
+        Example:
+            .. code-block:: python
+
+                >>> CellWriteBuffer.merge_cells([(0, 0), (1, 0), (0, 1), (1, 1), (3, 1)])
+                [(0, 0, 1, 1), (3, 1, 3, 1)]
+        """
+        rows: Dict[int, List[int]] = {}
+        for col, row in cells:
+            rows.setdefault(row, []).append(col)
+
+        result: List[Tuple[int, int, int, int]] = []
+        # open rectangles keyed by (col_start, col_end) as [row_start, row_end]
+        open_rects: Dict[Tuple[int, int], List[int]] = {}
+        for row in sorted(rows):
+            cols = sorted(set(rows[row]))
+            runs: List[Tuple[int, int]] = []
+            start = prev = cols[0]
+            for col in cols[1:]:
+                if col != prev + 1:
+                    runs.append((start, prev))
+                    start = col
+                prev = col
+            runs.append((start, prev))
+
+            next_open: Dict[Tuple[int, int], List[int]] = {}
+            for run in runs:
+                rect = open_rects.pop(run, None)
+                if rect is not None and rect[1] == row - 1:
+                    rect[1] = row
+                    next_open[run] = rect
+                    continue
+                if rect is not None:
+                    result.append((run[0], rect[0], run[1], rect[1]))
+                next_open[run] = [row, row]
+            for run, rect in open_rects.items():
+                result.append((run[0], rect[0], run[1], rect[1]))
+            open_rects = next_open
+        for run, rect in open_rects.items():
+            result.append((run[0], rect[0], run[1], rect[1]))
+        result.sort(key=lambda r: (r[1], r[0]))
+        return result
+
+    # endregion Static Methods
+
+    # region Record Methods
+    def _get_group(self, styles: Sequence[StyleT] | None, formula: bool) -> Tuple[Tuple[int, ...], bool]:
+        if not styles:
+            return ((), formula)
+        key = tuple(id(style) for style in styles)
+        if key not in self._styles:
+            self._styles[key] = tuple(styles)
+        return (key, formula)
+
+    @staticmethod
+    def _get_col_row(cell_name: str | mCellObj.CellObj | None, col: Any, row: Any) -> Tuple[int, int]:
+        if cell_name is None:
+            if col is None or row is None:
+                raise TypeError("Expected a cell name, cell object or col and row")
+            return int(col), int(row)
+        co = mCellObj.CellObj.from_cell(cell_name)
+        return co.col_obj.index, co.row - 1
+
+    def add(
+        self, col: int, row: int, value: Any, styles: Sequence[StyleT] | None = None, formula: bool = False
+    ) -> None:
+        """
+        Records a single cell.
+
+        Args:
+            col (int): Zero-based column index.
+            row (int): Zero-based row index.
+            value (Any): Cell value.
+            styles (Sequence[StyleT], optional): Styles to apply to the cell.
+            formula (bool, optional): If ``True`` value is written as a formula. Defaults to ``False``.
+        """
+        key = (col, row)
+        # remove first so a rewritten cell takes its new group and position
+        self._cells.pop(key, None)
+        self._cells[key] = _CellEntry(value, self._get_group(styles, formula))
+
+    def set_val(self, **kwargs: Any) -> None:
+        """
+        Records the value of a cell.
+
+        Args:
+            value (object): Value for cell.
+            cell_name (str): Name of cell to set value of such as 'B4'.
+            cell_obj (CellObj): Cell Object.
+            col (int): Cell column as zero-based integer.
+            row (int): Cell row as zero-based integer.
+            styles (Sequence[StyleT], optional): One or more styles to apply to cell.
+
+        Returns:
+            None:
+
+        Note:
+            Numbers are written as values and strings as formulas, other values are ignored.
+            Styles are applied even when the value is ignored, like ``Calc.set_val()``.
+        """
+        value = kwargs.get("value", None)
+        styles = kwargs.get("styles", None)
+        cell_name = kwargs.get("cell_name", kwargs.get("cell_obj", None))
+        col, row = self._get_col_row(cell_name, kwargs.get("col", None), kwargs.get("row", None))
+        if isinstance(value, (float, int)):
+            self.add(col, row, float(value), styles=styles, formula=False)
+        elif isinstance(value, str):
+            self.add(col, row, value, styles=styles, formula=True)
+        elif styles:
+            key = (col, row)
+            self._style_cells[key] = self._style_cells.get(key, ()) + tuple(styles)
+
+    def _get_values_start(self, fn_name: str, args: tuple, kwargs: dict) -> Tuple[Sequence[Any], int, int]:
+        ordered = list(args)
+        if "values" in kwargs:
+            values = kwargs["values"]
+        else:
+            values = ordered.pop(0) if ordered else None
+        if values is None:
+            raise TypeError(f"{fn_name}() missing values")
+        if "cell_name" in kwargs or "cell_obj" in kwargs:
+            col, row = self._get_col_row(kwargs.get("cell_name", kwargs.get("cell_obj")), None, None)
+        elif "col_start" in kwargs:
+            col, row = self._get_col_row(None, kwargs.get("col_start"), kwargs.get("row_start"))
+        elif len(ordered) == 1:
+            col, row = self._get_col_row(ordered[0], None, None)
+        elif len(ordered) == 2:
+            col, row = self._get_col_row(None, ordered[0], ordered[1])
+        else:
+            raise TypeError(f"{fn_name}() got an invalid number of arguments")
+        return values, col, row
+
+    def set_row(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Records a row of data.
+
+        Args:
+            values (Row): Row Data.
+            cell_name (str): Name of Cell to begin the insert such as 'A1'.
+            cell_obj (CellObj): Cell Object.
+            col_start (int): Zero-base column index.
+            row_start (int): Zero-base row index.
+
+        Returns:
+            None:
+        """
+        values, col, row = self._get_values_start("set_row", args, kwargs)
+        row_values: Row = values
+        for i, value in enumerate(row_values):
+            self.add(col + i, row, value)
+
+    def set_col(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Records a column of data.
+
+        Args:
+            values (Column): Column Data.
+            cell_name (str): Name of Cell to begin the insert such as 'A1'.
+            cell_obj (CellObj): Cell Object.
+            col_start (int): Zero-base column index.
+            row_start (int): Zero-base row index.
+
+        Returns:
+            None:
+
+        Note:
+            Like ``Calc.set_col()`` each value is recorded as if :py:meth:`~.CellWriteBuffer.set_val` was called.
+        """
+        values, col, row = self._get_values_start("set_col", args, kwargs)
+        col_values: Column = values
+        for i, value in enumerate(col_values):
+            self.set_val(value=value, col=col, row=row + i)
+
+    def clear(self) -> None:
+        """
+        Removes all recorded cells.
+        """
+        self._cells.clear()
+        self._styles.clear()
+        self._style_cells.clear()
+
+    # endregion Record Methods
+
+    def get_blocks(self) -> List[CellBlock]:
+        """
+        Gets the recorded cells merged into rectangular blocks.
+
+        Returns:
+            List[CellBlock]: Blocks ordered by group and then by position, blocks that only apply styles come last.
+        """
+        groups: Dict[Tuple[Tuple[int, ...], bool], List[Tuple[int, int]]] = {}
+        for pos, entry in self._cells.items():
+            groups.setdefault(entry.group, []).append(pos)
+
+        blocks: List[CellBlock] = []
+        for group, positions in groups.items():
+            style_key, formula = group
+            styles = self._styles.get(style_key, None) if style_key else None
+            for col_start, row_start, col_end, row_end in self.merge_cells(positions):
+                values = tuple(
+                    tuple(self._cells[(col, row)].value for col in range(col_start, col_end + 1))
+                    for row in range(row_start, row_end + 1)
+                )
+                rv = mRngValues.RangeValues(
+                    col_start=col_start,
+                    col_end=col_end,
+                    row_start=row_start,
+                    row_end=row_end,
+                    sheet_idx=self._sheet_idx,
+                )
+                blocks.append(
+                    CellBlock(range_obj=mRngObj.RangeObj.from_range(rv), values=values, styles=styles, formula=formula)
+                )
+
+        style_groups: Dict[Tuple[int, ...], List[Tuple[int, int]]] = {}
+        for pos, cell_styles in self._style_cells.items():
+            style_key, _ = self._get_group(cell_styles, False)
+            style_groups.setdefault(style_key, []).append(pos)
+        for style_key, positions in style_groups.items():
+            for col_start, row_start, col_end, row_end in self.merge_cells(positions):
+                rv = mRngValues.RangeValues(
+                    col_start=col_start,
+                    col_end=col_end,
+                    row_start=row_start,
+                    row_end=row_end,
+                    sheet_idx=self._sheet_idx,
+                )
+                blocks.append(
+                    CellBlock(
+                        range_obj=mRngObj.RangeObj.from_range(rv),
+                        values=None,
+                        styles=self._styles[style_key],
+                        formula=False,
+                    )
+                )
+        return blocks
+
+    # region Properties
+    @property
+    def sheet_idx(self) -> int:
+        """Gets the sheet index assigned to the range of each block."""
+        return self._sheet_idx
+
+    # endregion Properties
@@ -0,0 +1,137 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from ooodev.utils import table_helper as mTb
+from ooodev.utils.data_type import cell_obj as mCellObj
+
+
+class GoalSeekSpec(NamedTuple):
+    """A single goal seek of :py:meth:`CalcSheet.goal_seek_many() <ooodev.calc.CalcSheet.goal_seek_many>`."""
+
+    formula_cell: Union[str, mCellObj.CellObj]
+    """Cell that contains the formula, such as ``C1``"""
+    variable_cell: Union[str, mCellObj.CellObj]
+    """Cell whose value is changed to reach the target, such as ``A1``"""
+    target: float
+    """Result the formula must reach"""
+
+    def get_positions(self) -> Tuple[int, int, int, int]:
+        """
+        Gets the positions of the cells of the goal seek.
+
+        Returns:
+            Tuple[int, int, int, int]: Zero-based ``(formula_col, formula_row, variable_col, variable_row)``.
+        """
+        return (*_get_col_row(self.formula_cell), *_get_col_row(self.variable_cell))
+
+
+def _get_col_row(cell: str | mCellObj.CellObj) -> Tuple[int, int]:
+    if isinstance(cell, mCellObj.CellObj):
+        return (cell.col_obj.index, cell.row - 1)
+    # parsed names are cached by TableHelper, no CellObj is created.
+    parts = mTb.TableHelper.get_cell_parts(cell)
+    return (mTb.TableHelper.col_name_to_int(parts.col) - 1, parts.row - 1)
+
+
+class GoalSeekResults:
+    """
+    Results of :py:meth:`CalcSheet.goal_seek_many() <ooodev.calc.CalcSheet.goal_seek_many>`.
+
+    Results and divergences are stored in compact arrays of floats in the order of the goal seeks.
+    A goal seek that raised an error has a result of ``nan`` and a divergence of ``inf``.
+
+    This class does not access a spreadsheet.
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(
+        self, results: Iterable[float], divergences: Iterable[float], max_divergence: float = 0.1, elapsed: float = 0.0
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            results (Iterable[float]): Result of each goal seek.
+            divergences (Iterable[float]): Divergence of each goal seek.
+            max_divergence (float, optional): Goal seeks with a divergence less than this value have converged.
+                Defaults to ``0.1``.
+            elapsed (float, optional): Seconds spent on the goal seeks. Defaults to ``0.0``.
+
+        Raises:
+            ValueError: If ``results`` and ``divergences`` do not have the same length.
+        """
+        self._results = array("d", results)
+        self._divergences = array("d", divergences)
+        if len(self._results) != len(self._divergences):
+            raise ValueError("results and divergences must have the same length")
+        self._max_divergence = max_divergence
+        self._elapsed = elapsed
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[Tuple[float, float, bool]]:
+        """Iterates ``(result, divergence, converged)`` of each goal seek."""
+        max_div = self._max_divergence
+        for result, divergence in zip(self._results, self._divergences):
+            yield (result, divergence, divergence < max_div)
+
+    def __repr__(self) -> str:
+        return f"<GoalSeekResults count={len(self)} converged={self.converged_count} elapsed={self._elapsed:.3f}s>"
+
+    def is_converged(self, index: int) -> bool:
+        """
+        Gets if a goal seek converged.
+
+        Args:
+            index (int): Index of the goal seek.
+
+        Returns:
+            bool: ``True`` if the divergence of the goal seek is less than ``max_divergence``; Otherwise, ``False``.
+        """
+        return self._divergences[index] < self._max_divergence
+
+    def get_failed(self) -> List[int]:
+        """
+        Gets the indexes of the goal seeks that did not converge.
+
+        Returns:
+            List[int]: Indexes in ascending order.
+        """
+        max_div = self._max_divergence
+        return [i for i, divergence in enumerate(self._divergences) if not divergence < max_div]
+
+    # region Properties
+    @property
+    def results(self) -> array:
+        """Gets the result of each goal seek as an array of floats."""
+        return self._results
+
+    @property
+    def divergences(self) -> array:
+        """Gets the divergence of each goal seek as an array of floats."""
+        return self._divergences
+
+    @property
+    def max_divergence(self) -> float:
+        """Gets the divergence below which a goal seek has converged."""
+        return self._max_divergence
+
+    @property
+    def converged_count(self) -> int:
+        """Gets the number of goal seeks that converged."""
+        return len(self) - len(self.get_failed())
+
+    @property
+    def max_found_divergence(self) -> float:
+        """Gets the largest divergence of the goal seeks, ``0.0`` if there are none."""
+        return max(self._divergences, default=0.0)
+
+    @property
+    def elapsed(self) -> float:
+        """Gets the seconds spent on the goal seeks."""
+        return self._elapsed
+
+    # endregion Properties
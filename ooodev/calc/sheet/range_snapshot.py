@@ -0,0 +1,260 @@
+from __future__ import annotations
+import re
+from typing import Any, Iterable, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+from ooodev.calc.sheet.cell_write_buffer import CellWriteBuffer
+from ooodev.utils.data_type import range_obj as mRngObj
+from ooodev.utils.data_type import range_values as mRngValues
+
+if TYPE_CHECKING:
+    from ooodev.calc.calc_cell_range import CalcCellRange
+
+
+class RangePatch(NamedTuple):
+    """Rectangular block of changed cells."""
+
+    range_obj: mRngObj.RangeObj
+    """Range of the block on the sheet"""
+    values: Tuple[Tuple[Any, ...], ...]
+    """2-Dimensional new values of the block"""
+
+
+class RangeSnapshot:
+    """
+    Immutable copy of the values of a range that can be compared with new values.
+
+    :py:meth:`~.RangeSnapshot.diff` finds the cells that differ from a new table and merges them into as few
+    rectangular patches as possible. Writing the patches with
+    :py:meth:`CalcCellRange.apply_patch() <ooodev.calc.CalcCellRange.apply_patch>` writes only the changed cells.
+
+    Rows that are equal are skipped with a single tuple comparison, so the cost of a diff is mostly
+    proportional to the number of changed rows.
+
+    This class does not access a spreadsheet and can be used without a running office.
+
+    Example:
+        .. code-block:: python
+
+            rng = sheet.get_range(range_name="A1:J100000")
+            snapshot = rng.get_snapshot()
+            # ... later
+            new_values = get_values_from_source()
+            patches = snapshot.diff(new_values)
+            rng.apply_patch(patches)
+            snapshot = snapshot.patch(patches)
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, values: Sequence[Sequence[Any]], range_obj: mRngObj.RangeObj | None = None) -> None:
+        """
+        Constructor
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values such as the result of ``get_array()``.
+            range_obj (RangeObj, optional): Range the values were read from. Its start cell is used as the
+                position of the first value. Defaults to a range starting at ``A1``.
+        """
+        self._values = tuple(tuple(row) for row in values)
+        self._texts: Tuple[Tuple[str, ...], ...] | None = None
+        self._col_start = 0
+        self._row_start = 0
+        self._sheet_idx = -2
+        if range_obj is not None:
+            self._col_start = range_obj.start_col_index
+            self._row_start = range_obj.start_row_index
+            self._sheet_idx = range_obj.sheet_idx
+        self._range_obj = range_obj
+
+    # region Class Methods
+    @classmethod
+    def from_range(cls, cell_range: CalcCellRange) -> RangeSnapshot:
+        """
+        Creates a snapshot of the current values of a range.
+
+        Args:
+            cell_range (CalcCellRange): Range to read with a single ``getDataArray()`` call.
+
+        Returns:
+            RangeSnapshot: Snapshot.
+        """
+        return cls(cell_range.get_array(), cell_range.range_obj)
+
+    # endregion Class Methods
+
+    def _get_range_obj(self, col_start: int, row_start: int, col_end: int, row_end: int) -> mRngObj.RangeObj:
+        rv = mRngValues.RangeValues(
+            col_start=self._col_start + col_start,
+            col_end=self._col_start + col_end,
+            row_start=self._row_start + row_start,
+            row_end=self._row_start + row_end,
+            sheet_idx=self._sheet_idx,
+        )
+        return mRngObj.RangeObj.from_range(rv)
+
+    def diff_cells(self, values: Sequence[Sequence[Any]]) -> List[Tuple[int, int]]:
+        """
+        Gets the positions of the cells that differ from new values.
+
+        When ``values`` is larger than the snapshot the extra cells are reported as changed.
+        When it is smaller the cells that are missing and are not empty in the snapshot are reported as changed.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of new values.
+
+        Returns:
+            List[Tuple[int, int]]: Zero-based ``(col, row)`` positions relative to the start of the snapshot.
+        """
+        old = self._values
+        changed: List[Tuple[int, int]] = []
+        new_len = len(values)
+        for row in range(max(len(old), new_len)):
+            old_row = old[row] if row < len(old) else ()
+            new_row = tuple(values[row]) if row < new_len else ()
+            if old_row == new_row:
+                continue
+            old_len = len(old_row)
+            row_len = len(new_row)
+            for col in range(max(old_len, row_len)):
+                old_val = old_row[col] if col < old_len else ""
+                new_val = new_row[col] if col < row_len else ""
+                if old_val != new_val:
+                    changed.append((col, row))
+        return changed
+
+    def diff(self, values: Sequence[Sequence[Any]]) -> List[RangePatch]:
+        """
+        Gets the changes from the snapshot to new values as rectangular patches.
+
+        Each patch covers only changed cells. Cells that are in the snapshot but not in ``values`` are patched with
+        an empty string, which clears them.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of new values.
+
+        Returns:
+            List[RangePatch]: Patches ordered by position. Empty if nothing changed.
+        """
+        changed = self.diff_cells(values)
+        if not changed:
+            return []
+        new_len = len(values)
+
+        def get_val(col: int, row: int) -> Any:
+            if row < new_len:
+                new_row = values[row]
+                if col < len(new_row):
+                    return new_row[col]
+            return ""
+
+        patches: List[RangePatch] = []
+        for col_start, row_start, col_end, row_end in CellWriteBuffer.merge_cells(changed):
+            block = tuple(
+                tuple(get_val(col, row) for col in range(col_start, col_end + 1))
+                for row in range(row_start, row_end + 1)
+            )
+            patches.append(RangePatch(self._get_range_obj(col_start, row_start, col_end, row_end), block))
+        return patches
+
+    def patch(self, patches: Iterable[RangePatch]) -> RangeSnapshot:
+        """
+        Gets a new snapshot with patches applied.
+
+        Args:
+            patches (Iterable[RangePatch]): Patches such as the result of :py:meth:`~.RangeSnapshot.diff`.
+
+        Returns:
+            RangeSnapshot: New snapshot. The size of the snapshot grows to include every patch.
+        """
+        rows = [list(row) for row in self._values]
+        for p in patches:
+            col_start = p.range_obj.start_col_index - self._col_start
+            row_start = p.range_obj.start_row_index - self._row_start
+            for r, row_values in enumerate(p.values):
+                row = row_start + r
+                while len(rows) <= row:
+                    rows.append([])
+                target = rows[row]
+                end = col_start + len(row_values)
+                if len(target) < end:
+                    target.extend([""] * (end - len(target)))
+                target[col_start:end] = row_values
+        width = max(map(len, rows), default=0)
+        for row in rows:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+        snapshot = RangeSnapshot(rows)
+        snapshot._col_start = self._col_start
+        snapshot._row_start = self._row_start
+        snapshot._sheet_idx = self._sheet_idx
+        if rows:
+            snapshot._range_obj = self._get_range_obj(0, 0, width - 1, len(rows) - 1)
+        return snapshot
+
+    def search(
+        self, pattern: str, regex: bool = True, match_case: bool = False, whole_cell: bool = False
+    ) -> List[Tuple[int, int]]:
+        """
+        Searches the values of the snapshot.
+
+        Numbers are searched as text, whole numbers without a fraction such as ``3`` rather than ``3.0``.
+        Empty cells are never matched.
+
+        Args:
+            pattern (str): Text or regular expression to search for.
+            regex (bool, optional): If ``True`` ``pattern`` is a regular expression; Otherwise, it is plain text.
+                Defaults to ``True``.
+            match_case (bool, optional): If ``True`` the search is case sensitive. Defaults to ``False``.
+            whole_cell (bool, optional): If ``True`` the pattern must match the whole cell text;
+                Otherwise, it may match part of it. Defaults to ``False``.
+
+        Raises:
+            re.error: If ``pattern`` is not a valid regular expression.
+
+        Returns:
+            List[Tuple[int, int]]: Zero-based ``(col, row)`` sheet positions of matching cells in row order.
+        """
+        rx = re.compile(pattern if regex else re.escape(pattern), 0 if match_case else re.IGNORECASE)
+        match = rx.fullmatch if whole_cell else rx.search
+        col_start = self._col_start
+        hits: List[Tuple[int, int]] = []
+        for r, row in enumerate(self._get_texts(), self._row_start):
+            for c, text in enumerate(row, col_start):
+                if text and match(text):
+                    hits.append((c, r))
+        return hits
+
+    def _get_texts(self) -> Tuple[Tuple[str, ...], ...]:
+        # text of each cell is built on the first search and reused by later searches.
+        if self._texts is None:
+            self._texts = tuple(
+                tuple(
+                    (str(int(val)) if val.is_integer() else repr(val)) if type(val) is float else str(val)
+                    for val in row
+                )
+                for row in self._values
+            )
+        return self._texts
+
+    # region Properties
+    @property
+    def values(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Gets the values of the snapshot."""
+        return self._values
+
+    @property
+    def range_obj(self) -> mRngObj.RangeObj | None:
+        """Gets the range the snapshot was taken from, if any."""
+        return self._range_obj
+
+    @property
+    def row_count(self) -> int:
+        """Gets the number of rows of the snapshot."""
+        return len(self._values)
+
+    @property
+    def col_count(self) -> int:
+        """Gets the number of columns of the snapshot."""
+        return len(self._values[0]) if self._values else 0
+
+    # endregion Properties
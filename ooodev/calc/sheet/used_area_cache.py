@@ -0,0 +1,229 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, List, TYPE_CHECKING
+
+try:
+    # python 3.12+
+    from typing import override  # noqa # type: ignore
+except ImportError:
+    from typing_extensions import override  # noqa # type: ignore
+
+from com.sun.star.util import XModifyBroadcaster
+
+from ooodev.calc.sheet.range_snapshot import RangeSnapshot
+from ooodev.listeners.x_modify_adapter import XModifyAdapter
+from ooodev.loader import lo as mLo
+from ooodev.office import calc as mCalc
+
+if TYPE_CHECKING:
+    from com.sun.star.lang import EventObject
+    from com.sun.star.sheet import XSpreadsheet
+    from ooodev.utils.data_type.range_obj import RangeObj
+
+
+class _UsedAreaModifyListener(XModifyAdapter):
+    """Invalidates a :py:class:`UsedAreaCache` when the sheet it belongs to is modified."""
+
+    def __init__(self, cache: UsedAreaCache) -> None:
+        super().__init__()
+        self._cache = cache
+
+    @override
+    def modified(self, aEvent: EventObject) -> None:
+        self._cache.invalidate()
+
+    @override
+    def disposing(self, Source: EventObject) -> None:
+        self._cache._on_disposing()
+
+
+class UsedAreaCache:
+    """
+    Per sheet cache of the used area of a spreadsheet and of snapshots of its values.
+
+    The used area is found once with a sheet cursor and then returned from the cache until the sheet is modified.
+    Value snapshots of the most recently used ranges are cached the same way.
+    A modify listener is added to the sheet that invalidates the cache on any change to the sheet content.
+
+    There is only one cache per sheet, :py:meth:`~.UsedAreaCache.get_cache` returns the same instance
+    for every wrapper of the same sheet.
+
+    Note:
+        Changes that do not modify the sheet content, such as formatting only changes, may not invalidate the cache.
+        Call :py:meth:`~.UsedAreaCache.invalidate` or pass ``use_cache=False`` to
+        :py:meth:`CalcSheet.find_used_range_obj() <ooodev.calc.CalcSheet.find_used_range_obj>` when a fresh value is required.
+
+    .. versionadded:: 0.54.0
+    """
+
+    _caches: Dict[str, List[UsedAreaCache]] = {}
+    _max_snapshots = 8
+
+    def __init__(self, sheet: XSpreadsheet, doc_uid: str = "") -> None:
+        """
+        Constructor
+
+        Args:
+            sheet (XSpreadsheet): Sheet to cache the used area of.
+            doc_uid (str, optional): Runtime id of the document that the sheet belongs to.
+
+        Note:
+            Use :py:meth:`~.UsedAreaCache.get_cache` to get the shared cache of a sheet.
+        """
+        self._sheet = sheet
+        self._doc_uid = doc_uid
+        self._range_obj: RangeObj | None = None
+        self._snapshots: OrderedDict[str, RangeSnapshot] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._listener: _UsedAreaModifyListener | None = _UsedAreaModifyListener(self)
+        broadcaster = mLo.Lo.qi(XModifyBroadcaster, sheet, True)
+        broadcaster.addModifyListener(self._listener)
+
+    # region Class Methods
+    @classmethod
+    def get_cache(cls, sheet: XSpreadsheet, doc_uid: str = "") -> UsedAreaCache:
+        """
+        Gets the shared used area cache of a sheet, creating it if needed.
+
+        Args:
+            sheet (XSpreadsheet): Sheet.
+            doc_uid (str, optional): Runtime id of the document that the sheet belongs to.
+                Used to group caches by document.
+
+        Returns:
+            UsedAreaCache: Used area cache.
+        """
+        caches = cls._caches.setdefault(doc_uid, [])
+        for cache in caches:
+            if cache._sheet == sheet:
+                return cache
+        cache = cls(sheet=sheet, doc_uid=doc_uid)
+        caches.append(cache)
+        return cache
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """
+        Disposes all shared used area caches and removes their listeners.
+        """
+        for caches in list(cls._caches.values()):
+            for cache in list(caches):
+                cache.dispose()
+        cls._caches.clear()
+
+    # endregion Class Methods
+
+    def _on_disposing(self) -> None:
+        # the sheet is being disposed; do not call back into it.
+        self._listener = None
+        self._remove_from_registry()
+
+    def _remove_from_registry(self) -> None:
+        caches = UsedAreaCache._caches.get(self._doc_uid)
+        if caches is None:
+            return
+        if self in caches:
+            caches.remove(self)
+        if not caches:
+            del UsedAreaCache._caches[self._doc_uid]
+
+    def get_range_obj(self, use_cache: bool = True) -> RangeObj:
+        """
+        Gets the used area of the sheet.
+
+        Args:
+            use_cache (bool, optional): If ``False`` the used area is found again and the cache is refreshed.
+                Defaults to ``True``.
+
+        Returns:
+            RangeObj: Used area.
+        """
+        if use_cache and self._range_obj is not None:
+            self._hits += 1
+            return self._range_obj
+        self._misses += 1
+        self._range_obj = mCalc.Calc.find_used_range_obj(self._sheet)
+        return self._range_obj
+
+    def get_snapshot(self, range_obj: RangeObj | None = None, use_cache: bool = True) -> RangeSnapshot:
+        """
+        Gets a snapshot of the values of a range of the sheet.
+
+        Args:
+            range_obj (RangeObj, optional): Range to get values of. Defaults to the used area of the sheet.
+            use_cache (bool, optional): If ``False`` the values are read again and the cache is refreshed.
+                Defaults to ``True``.
+
+        Returns:
+            RangeSnapshot: Snapshot of values read with a single ``getDataArray()`` call.
+
+        Note:
+            Only the most recently used snapshots are kept.
+        """
+        if range_obj is None:
+            range_obj = self.get_range_obj(use_cache=use_cache)
+        key = str(range_obj)
+        if use_cache:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self._snapshots.move_to_end(key)
+                return snapshot
+        snapshot = RangeSnapshot(mCalc.Calc.get_array(sheet=self._sheet, range_obj=range_obj), range_obj)
+        self._snapshots[key] = snapshot
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > UsedAreaCache._max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Invalidates the cached used area and value snapshots.
+        """
+        self._range_obj = None
+        self._snapshots.clear()
+
+    def reset_stats(self) -> None:
+        """
+        Resets hit and miss counters.
+        """
+        self._hits = 0
+        self._misses = 0
+
+    def dispose(self) -> None:
+        """
+        Removes the modify listener from the sheet and removes this cache from the shared caches.
+        """
+        if self._listener is not None:
+            try:
+                broadcaster = mLo.Lo.qi(XModifyBroadcaster, self._sheet, True)
+                broadcaster.removeModifyListener(self._listener)
+            except Exception:
+                mLo.Lo.print("UsedAreaCache.dispose(): Unable to remove modify listener")
+            self._listener = None
+        self._range_obj = None
+        self._snapshots.clear()
+        self._remove_from_registry()
+
+    # region Properties
+    @property
+    def hits(self) -> int:
+        """Gets the number of times the used area was returned from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of times the used area had to be found on the sheet."""
+        return self._misses
+
+    @property
+    def is_valid(self) -> bool:
+        """Gets if the cache currently holds a used area."""
+        return self._range_obj is not None
+
+    @property
+    def sheet(self) -> XSpreadsheet:
+        """Gets the sheet of this cache."""
+        return self._sheet
+
+    # endregion Properties
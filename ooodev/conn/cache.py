@@ -5,13 +5,25 @@ from pathlib import Path
 from shutil import copytree
 import shutil
 import tempfile
-from typing import Tuple
+import time
+import uuid
+from typing import Set, Tuple
 import contextlib
+import hashlib
 from ooodev.utils.type_var import PathOrStr
 from ooodev.utils import sys_info
 from ooodev.cfg import config
 from ooodev.io.log.named_logger import NamedLogger
 
+# Linux ioctl that clones a file as a copy on write reflink (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+# names that are never part of a template profile.
+_TEMPLATE_SKIP = frozenset((".lock", "crash", "backup", "temp"))
+
+# files that office rewrites in place are copied even when hard links are used.
+_MUTABLE_SUFFIXES = frozenset((".xcu", ".xml", ".dat", ".db", ".xlb", ".xlc", ".xba", ".xdl", ".odb"))
+
 
 class Cache:
     """Office Profile Cache Manager"""
@@ -32,6 +44,24 @@ class Cache:
             no_shared_ext (bool, optional): Determines if shared extensions are used.
                 If set to True then no shared extensions are disabled for the session.
                 Default is False.
+            template (bool, optional): Determines if ``profile_path`` is a template profile.
+                The first session starts with a new profile which is saved as template once office is connected,
+                leaving out extensions and lock, backup and crash data.
+                Later sessions clone the template instead of copying a user profile.
+                If ``profile_path`` is not set it defaults to a dir in the ``ooodev`` cache dir of the current user
+                that is named after the path and version of ``soffice``.
+                A template profile that is not owned by the current user or that others can write to is not used.
+                Default is False.
+            keep_extensions (bool, optional): Determines if user extensions are kept in a template profile.
+                Default is False.
+            link_mode (str, optional): How a template profile is cloned. ``auto`` uses copy on write reflinks where
+                the filesystem supports them and copies otherwise. ``hardlink`` also hard links files that office does
+                not rewrite, registry and library files are always copied. ``copy`` always copies.
+                Default is ``auto``.
+            soffice (PathOrStr, optional): Path to soffice the template profile is for. Default is auto discovered.
+
+        .. versionchanged:: 0.54.0
+            Added ``template``, ``keep_extensions``, ``link_mode`` and ``soffice`` keyword args.
         """
         self._log = NamedLogger(self.__class__.__name__)
         self._log.debug("Cache.__init__")
@@ -40,6 +70,14 @@ class Cache:
         self._profile_dir_name = "profile"
         self._no_share_dir_name = "no_share"
         self._profile_cached = False
+        self._template = bool(kwargs.get("template", False))
+        self._keep_extensions = bool(kwargs.get("keep_extensions", False))
+        self._link_mode = str(kwargs.get("link_mode", "auto"))
+        if self._link_mode not in ("auto", "hardlink", "copy"):
+            raise ValueError(f"link_mode must be auto, hardlink or copy, not {self._link_mode!r}")
+        self._soffice = kwargs.get("soffice", None)
+        self._provision_time = 0.0
+        self._reflink_supported: bool | None = None
         profile_path = kwargs.get("profile_path", None)
         if profile_path is None:
             # cache_path is now obsolete but kept for backwards compatibility
@@ -56,6 +94,8 @@ class Cache:
         # this method is only ever called the user does not provide a cache_path
         # see: https://www.howtogeek.com/289587/how-to-find-your-libreoffice-profile-folder-in-windows-macos-and-linux/
         self._log.debug("Cache._get_profile_path()")
+        if self._template:
+            return Path(self._get_user_cache_dir(), "profile_templates", self._get_soffice_key())
         cache_path = None
         platform = sys_info.SysInfo.get_platform()
 
@@ -86,6 +126,9 @@ class Cache:
         Copies user profile into cache path if it has not already been cached.
 
         Ignored if :py:attr:`~Cache.use_cache` is ``False``
+
+        .. versionchanged:: 0.54.0
+            When :py:attr:`~Cache.template` is ``True`` the profile is saved as template profile.
         """
         # copy_cache_to_profile is called before this method
         if not self.use_cache:
@@ -98,7 +141,10 @@ class Cache:
             self._log.debug(
                 f"Cache.cache_profile(): copying profile to cache. From: {self.user_profile} To: {self.profile_path}"
             )
-            copytree(self.user_profile, self.profile_path)
+            if self._template:
+                self._save_template()
+            else:
+                copytree(self.user_profile, self.profile_path)
         return
 
     def copy_cache_to_profile(self) -> None:
@@ -107,6 +153,10 @@ class Cache:
         :py:attr:`~.Cache.user_profile`
 
         Ignored if :py:attr:`~Cache.use_cache` is ``False``
+
+        .. versionchanged:: 0.54.0
+            When :py:attr:`~Cache.template` is ``True`` the template profile is cloned.
+            The time taken is available from :py:attr:`~Cache.provision_time`.
         """
         # this method is called before cache_profile.
         if not self.use_cache:
@@ -115,11 +165,22 @@ class Cache:
         if not self.profile_path:
             self._log.debug("Cache.copy_cache_to_profile(): cache_path is None")
             return
+        start = time.perf_counter()
         if self.profile_path.exists() and self.profile_path.is_dir():
             self._log.debug(
                 f"Cache.copy_cache_to_profile(): copying cache to profile. From: {self.profile_path} To: {self.user_profile}"
             )
-            copytree(self.profile_path, self.user_profile)
+            if not self._template:
+                copytree(self.profile_path, self.user_profile)
+            elif self._is_template_trusted(self.profile_path):
+                self._clone_tree(self.profile_path, self.user_profile)
+            else:
+                self._log.warning(
+                    f"Cache.copy_cache_to_profile(): template profile {self.profile_path} is not owned by the current "
+                    "user or can be written by others, starting with a new profile"
+                )
+                os.mkdir(self.user_profile)
+            # when the template is not trusted it is not replaced either.
             self._profile_cached = True
         else:
             # create the dir.
@@ -127,6 +188,115 @@ class Cache:
             # the profile into this dir.
             os.mkdir(self.user_profile)
             self._profile_cached = False
+        self._provision_time = time.perf_counter() - start
+        self._log.debug(f"Cache.copy_cache_to_profile(): profile provisioned in {self._provision_time:.3f}s")
+
+    # region template profile
+    @staticmethod
+    def _get_user_cache_dir() -> Path:
+        platform = sys_info.SysInfo.get_platform()
+        if platform == sys_info.SysInfo.PlatformEnum.WINDOWS:
+            base = os.getenv("LOCALAPPDATA") or str(Path("~/AppData/Local").expanduser())
+        elif platform == sys_info.SysInfo.PlatformEnum.MAC:
+            base = str(Path("~/Library/Caches").expanduser())
+        else:
+            base = os.getenv("XDG_CACHE_HOME") or str(Path("~/.cache").expanduser())
+        return Path(base, "ooodev")
+
+    def _get_soffice_key(self) -> str:
+        # a template is only valid for the office it was made with, the key changes when office is updated.
+        soffice = self._soffice
+        if soffice is None:
+            try:
+                from ooodev.utils import paths  # pylint: disable=import-outside-toplevel
+
+                soffice = paths.get_soffice_path()
+            except Exception:
+                self._log.debug("Cache._get_soffice_key(): soffice not found", exc_info=True)
+                soffice = ""
+        sha = hashlib.sha256()
+        if soffice:
+            soffice_path = Path(soffice).resolve()
+            sha.update(str(soffice_path).encode("utf-8"))
+            version_files = (soffice_path, soffice_path.with_name("versionrc"), soffice_path.with_name("version.ini"))
+            for version_file in version_files:
+                with contextlib.suppress(OSError):
+                    st = version_file.stat()
+                    sha.update(f"{version_file.name}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+        return sha.hexdigest()[:16]
+
+    @staticmethod
+    def _is_template_trusted(path: Path) -> bool:
+        # another user must not be able to provide or change the profile that sessions start with.
+        if os.name == "nt":
+            return True
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+    def _get_template_ignore(self, src: str, names: list) -> Set[str]:
+        skip = _TEMPLATE_SKIP if self._keep_extensions else _TEMPLATE_SKIP | {"extensions"}
+        return {name for name in names if name in skip}
+
+    def _save_template(self) -> None:
+        # several sessions may start from the same missing template, build it beside the template
+        # and rename it so a session never sees a partial template.
+        profile_path = self.profile_path
+        assert profile_path is not None
+        with contextlib.suppress(OSError):
+            profile_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = profile_path.with_name(f"{profile_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            copytree(self.user_profile, tmp_path, ignore=self._get_template_ignore)
+            # only the current user may change the template, see _is_template_trusted()
+            os.chmod(tmp_path, 0o700)
+            os.rename(tmp_path, profile_path)
+            self._log.debug(f"Cache._save_template(): saved template profile {profile_path}")
+        except OSError:
+            # another session saved the template first.
+            self._log.debug("Cache._save_template(): template profile not saved", exc_info=True)
+        finally:
+            if tmp_path.exists():
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _clone_file(self, src: str, dst: str) -> str:
+        if self._link_mode == "hardlink" and Path(src).suffix.lower() not in _MUTABLE_SUFFIXES:
+            with contextlib.suppress(OSError):
+                os.link(src, dst)
+                return dst
+        if self._link_mode != "copy" and self._reflink(src, dst):
+            return dst
+        return shutil.copy2(src, dst)
+
+    def _reflink(self, src: str, dst: str) -> bool:
+        if self._reflink_supported is False:
+            return False
+        try:
+            import fcntl  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            # not available on Windows
+            self._reflink_supported = False
+            return False
+        try:
+            with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                fcntl.ioctl(f_dst.fileno(), _FICLONE, f_src.fileno())
+            shutil.copystat(src, dst)
+            self._reflink_supported = True
+            return True
+        except OSError:
+            # filesystem does not support reflinks, do not try again.
+            self._reflink_supported = False
+            with contextlib.suppress(OSError):
+                os.remove(dst)
+            return False
+
+    def _clone_tree(self, src: Path, dst: Path) -> None:
+        self._reflink_supported = None
+        copytree(src, dst, copy_function=self._clone_file)
+
+    # endregion template profile
 
     def del_working_dir(self):
         """
@@ -198,6 +368,24 @@ class Cache:
     def working_dir(self, value: PathOrStr):
         self._working_dir = Path(value)
 
+    @property
+    def template(self) -> bool:
+        """
+        Gets if :py:attr:`~Cache.profile_path` is a template profile.
+
+        .. versionadded:: 0.54.0
+        """
+        return self._template
+
+    @property
+    def provision_time(self) -> float:
+        """
+        Gets the seconds taken by the last :py:meth:`~Cache.copy_cache_to_profile` to provision the profile.
+
+        .. versionadded:: 0.54.0
+        """
+        return self._provision_time
+
     @property
     def use_cache(self) -> bool:
         """Gets/Sets if cache is used. Default is ``True``"""
@@ -1,10 +1,11 @@
 """Connection to LibreOffice/OpenOffice"""
 
 from __future__ import annotations
-from typing import Any, List, TYPE_CHECKING, cast
+from typing import Any, Iterator, List, TYPE_CHECKING, cast
 import atexit
 import contextlib
 import os
+import socket
 import time
 from abc import ABC, abstractmethod
 import subprocess
@@ -16,6 +17,7 @@ from com.sun.star.connection import NoConnectException  # type: ignore
 from ooodev.utils.typing.over import override
 from ooodev.conn import connectors
 from ooodev.conn import cache
+from ooodev.conn.startup_report import StartupReport
 from ooodev.utils.sys_info import SysInfo
 from ooodev.io.log.named_logger import NamedLogger
 
@@ -139,7 +141,16 @@ class LoBridgeCommon(ConnectBase):
         self._platform = SysInfo.get_platform()
         self._environment = os.environ.copy()
         self._timeout = 30.0
-        self._conn_try_sleep = 0.2
+        # wait between connection attempts starts short and doubles up to the max.
+        self._conn_try_sleep = 0.01
+        self._conn_try_sleep_max = 0.5
+        # checking if office accepts connections is cheap and backs off to a lower max.
+        self._conn_probe_sleep_max = 0.05
+        # resolve is still tried this often when office does not seem to accept connections,
+        # the check may not see the pipe or port, such as in a sandbox.
+        self._conn_probe_fallback = 1.0
+        self._startup_report = StartupReport()
+        self._spawn_end = 0.0
         self._opened_office = False
         self._cache = cache.Cache(use_cache=False) if cache_obj is None else cache_obj
         if self._cache.use_cache:
@@ -168,14 +179,53 @@ class LoBridgeCommon(ConnectBase):
     @abstractmethod
     def _get_bridge(self, local_factory: XMultiComponentFactory, local_ctx: XComponentContext) -> XBridge: ...
 
+    def _is_accepting(self) -> bool | None:
+        """
+        Gets if office accepts connections, without connecting to office.
+
+        Returns:
+            bool | None: ``None`` if it cannot be checked.
+        """
+        return None
+
+    def _get_try_sleeps(self, max_sleep: float = 0.0) -> Iterator[float]:
+        max_sleep = max_sleep or self._conn_try_sleep_max
+        delay = self._conn_try_sleep
+        while True:
+            yield delay
+            delay = min(delay * 2, max_sleep)
+
+    def _spawn(self) -> None:
+        # starts office and records the time in the startup report.
+        start = time.perf_counter()
+        self._popen()
+        self._spawn_end = time.perf_counter()
+        self._startup_report.spawn = self._spawn_end - start
+
     def _connect(self):
         # see also: _connect_alternative()
         self.log.debug("Connecting")
         conn_str = self._get_connection_str()
+        report = self._startup_report
+        report.attempts = 0
+        report.probes = 0
+        start = self._spawn_end if self._opened_office else time.perf_counter()
+        sleeps = self._get_try_sleeps()
+        probe_sleeps = self._get_try_sleeps(self._conn_probe_sleep_max)
 
         end_time = time.time() + self._timeout
         last_ex = None
+        connected = False
+        last_try = time.perf_counter()
         while end_time > time.time():
+            accepting = self._is_accepting()
+            if accepting is not None:
+                report.probes += 1
+            if accepting is False and time.perf_counter() - last_try < self._conn_probe_fallback:
+                time.sleep(next(probe_sleeps))
+                continue
+            last_try = time.perf_counter()
+            report.attempts += 1
             try:
                 local_context = cast("XComponentContext", uno.getComponentContext())
                 local_factory = local_context.getServiceManager()
@@ -200,16 +250,26 @@ class LoBridgeCommon(ConnectBase):
                 )
 
                 last_ex = None
+                connected = True
                 break
             except NoConnectException as e:  # pylint: disable=invalid-name
                 self.log.debug(f"Connection Error: {e}")
                 last_ex = e
-                time.sleep(self._conn_try_sleep)
+                time.sleep(next(sleeps))
 
-        if last_ex is not None:
+        if not connected:
+            if last_ex is None:
+                last_ex = NoConnectException(f"Office did not accept a connection in {self._timeout} seconds", None)
             self.log.error("Connection Error: %s", last_ex)
             raise last_ex
+        resolved = time.perf_counter()
+        report.accept = last_try - start
+        report.resolve = resolved - last_try
+        with contextlib.suppress(Exception):
+            self._ctx.getByName("/singletons/com.sun.star.frame.theDesktop")  # type: ignore
+        report.desktop = time.perf_counter() - resolved
         self.log.info("Connection Established")
+        self.log.debug("Startup: %s", report)
 
     def _connect_alternative(self):
         # this method is not currently used.
@@ -221,6 +281,7 @@ class LoBridgeCommon(ConnectBase):
         conn_str = self._get_connection_identifier()
         # conn_str = "socket,host=localhost,port=2002"
 
+        sleeps = self._get_try_sleeps()
         end_time = time.time() + self._timeout
         last_ex = None
         while end_time > time.time():
@@ -270,7 +331,7 @@ class LoBridgeCommon(ConnectBase):
                 break
             except NoConnectException as e:  # pylint: disable=invalid-name
                 last_ex = e
-                time.sleep(self._conn_try_sleep)
+                time.sleep(next(sleeps))
 
         if last_ex is not None:
             self.log.error("Connection Error: %s", last_ex)
@@ -416,6 +477,15 @@ class LoBridgeCommon(ConnectBase):
         """
         return self._cache
 
+    @property
+    def startup_report(self) -> StartupReport:
+        """
+        Gets the time taken by each phase of the last connection to office.
+
+        .. versionadded:: 0.54.0
+        """
+        return self._startup_report
+
     @property
     def bridge_component(self) -> XComponent:
         """Gets Bridge Component"""
@@ -563,8 +633,9 @@ class LoPipeStart(LoBridgeCommon):
         """
         self.log.debug("connect() Connecting")
         self._cache.copy_cache_to_profile()
+        self._startup_report = StartupReport()
         if self._connector.start_office:
-            self._popen()
+            self._spawn()
             # now that office is started toggle start office to False to prevent sub processes from starting office.
             self._connector.start_office = False
         try:
@@ -594,6 +665,14 @@ class LoPipeStart(LoBridgeCommon):
         conn = connector.connect(f"pipe,name={self.connector.pipe}")
         return bridge_factory.createBridge("PipeBridgeAD", "urp", conn, None)  # type: ignore
 
+    @override
+    def _is_accepting(self) -> bool | None:
+        # on unix office listens on a socket file named after the pipe, see sal/osl/unx/pipe.cxx
+        if self._platform == SysInfo.PlatformEnum.WINDOWS or self.is_remote:
+            return None
+        name = f"OSL_PIPE_{os.getuid()}_{self.connector.pipe}"  # type: ignore
+        return any(os.path.exists(os.path.join(path, name)) for path in ("/tmp", "/var/tmp"))
+
     def _popen(self, shutdown=False) -> None:
         # it is important that quotes be placed in the correct place.
         # linux is not fussy on this but in windows it breaks things and you
@@ -678,8 +757,9 @@ class LoSocketStart(LoBridgeCommon):
         """
         self.log.debug("connect() Connecting")
         self._cache.copy_cache_to_profile()
+        self._startup_report = StartupReport()
         if self._connector.start_office:
-            self._popen()
+            self._spawn()
             # now that office is started toggle start office to False to prevent sub processes from starting office.
             self._connector.start_office = False
         try:
@@ -709,6 +789,14 @@ class LoSocketStart(LoBridgeCommon):
         conn = connector.connect(f"socket,host={self.connector.host},port={self.connector.port},tcpNoDelay=1")
         return bridge_factory.createBridge("socketBridgeAD", "urp", conn, None)  # type: ignore
 
+    @override
+    def _is_accepting(self) -> bool | None:
+        try:
+            with socket.create_connection((self.connector.host, self.connector.port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
     def _popen(self, shutdown=False) -> None:
         # it is important that quotes be placed in the correct place.
         # linux is not fussy on this but in windows it breaks things and you
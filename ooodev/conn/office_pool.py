@@ -0,0 +1,531 @@
+"""Pool of LibreOffice instances that run jobs in parallel"""
+
+from __future__ import annotations
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, TYPE_CHECKING
+import contextlib
+import queue
+import tempfile
+import threading
+import time
+import uuid
+
+from ooodev.conn import cache as mCache
+from ooodev.conn import connectors
+from ooodev.conn.startup_report import StartupReport
+from ooodev.exceptions import ex as mEx
+from ooodev.io.log.named_logger import NamedLogger
+
+if TYPE_CHECKING:
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.loader.inst.options import Options as LoOptions
+
+_T = TypeVar("_T")
+
+# put on the job queue once per worker to stop it.
+_STOP = object()
+
+
+class StartupTime(NamedTuple):
+    """
+    Time taken to start an office instance of :py:class:`OfficePool`.
+
+    .. versionadded:: 0.54.0
+    """
+
+    index: int
+    """Index of the worker that started the instance"""
+    total: float
+    """Seconds from starting the instance until it was connected"""
+    provision: float
+    """Seconds of ``total`` spent preparing the profile"""
+    report: Optional[StartupReport] = None
+    """Time taken by each phase of connecting to the instance"""
+
+
+class _Job:
+    __slots__ = ("fn", "args", "kwargs", "future")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+
+
+class _PoolWorker:
+    """Thread that owns one office instance and runs jobs from the pool queue."""
+
+    def __init__(self, pool: OfficePool, index: int) -> None:
+        self._pool = pool
+        self._index = index
+        self._log = NamedLogger(f"{self.__class__.__name__} {index}")
+        self._lo: LoInst | None = None
+        self._cache: mCache.Cache | None = None
+        self._job_count = 0
+        self._last_used = 0.0
+        self.thread = threading.Thread(target=self._run, name=f"OfficePool-{index}", daemon=True)
+
+    # region office instance
+    def _start_office(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from ooodev.conn.connect import LoBridgeCommon
+        from ooodev.loader.inst.lo_inst import LoInst
+
+        pool = self._pool
+        # every instance needs its own pipe and its own user installation,
+        # soffice started with an existing user installation hands over to the running process.
+        connector = connectors.ConnectPipe(
+            pipe=f"ooodev_pool_{uuid.uuid4().hex}",
+            headless=pool._headless,
+            soffice=pool._soffice,
+            env_vars=pool._env_vars,
+        )
+        cache_kw: Dict[str, Any] = {
+            "working_dir": tempfile.mkdtemp(prefix="ooodev_pool_"),
+            "template": pool._template,
+            "keep_extensions": pool._keep_extensions,
+        }
+        if pool._profile_path is not None:
+            cache_kw["profile_path"] = pool._profile_path
+        if pool._soffice is not None:
+            cache_kw["soffice"] = pool._soffice
+        self._cache = mCache.Cache(**cache_kw)
+        lo = LoInst(opt=pool._opt)
+        start = time.perf_counter()
+        with pool._get_start_lock():
+            lo.load_office(connector=connector, cache_obj=self._cache, opt=pool._opt)
+        conn = lo.bridge_connector
+        report = conn.startup_report if isinstance(conn, LoBridgeCommon) else None
+        startup = StartupTime(self._index, time.perf_counter() - start, self._cache.provision_time, report)
+        self._log.debug(f"Office started in {startup.total:.2f}s, profile provisioned in {startup.provision:.3f}s")
+        pool._on_office_started(startup)
+        self._lo = lo
+        self._job_count = 0
+        self._last_used = time.monotonic()
+
+    def _stop_office(self, kill: bool = False) -> None:
+        lo = self._lo
+        self._lo = None
+        if lo is not None:
+            terminated = False
+            if not kill:
+                try:
+                    terminated = lo.close_office()
+                except Exception:
+                    self._log.debug("Office failed to close, killing it", exc_info=True)
+            if not terminated:
+                with contextlib.suppress(Exception):
+                    lo.kill_office()
+        if self._cache is not None:
+            self._cache.del_working_dir()
+            self._cache = None
+
+    def _replace_office(self, kill: bool) -> None:
+        self._stop_office(kill=kill)
+        self._pool._on_restart(kill)
+        self._start_office()
+
+    def _is_responsive(self) -> bool:
+        lo = self._lo
+        if lo is None:
+            return False
+        done = threading.Event()
+
+        def probe() -> None:
+            with contextlib.suppress(Exception):
+                if lo.get_context().getServiceManager() is not None:
+                    done.set()
+
+        threading.Thread(target=probe, daemon=True).start()
+        return done.wait(self._pool._health_timeout)
+
+    # endregion office instance
+
+    def _run_job(self, job: _Job) -> None:
+        lo = self._lo
+        assert lo is not None
+        timeout = self._pool._job_timeout
+        if timeout is None:
+            try:
+                job.future.set_result(job.fn(lo, *job.args, **job.kwargs))
+            except BaseException as e:
+                job.future.set_exception(e)
+            return
+
+        outcome: List[Any] = []
+
+        def target() -> None:
+            try:
+                outcome.append((True, job.fn(lo, *job.args, **job.kwargs)))
+            except BaseException as e:
+                outcome.append((False, e))
+
+        runner = threading.Thread(target=target, name=f"{self.thread.name}-job", daemon=True)
+        runner.start()
+        runner.join(timeout)
+        if runner.is_alive():
+            # the office does not answer, killing it releases the blocked bridge call.
+            self._log.warning(f"Job did not finish in {timeout}s, replacing office instance")
+            job.future.set_exception(TimeoutError(f"Job did not finish in {timeout} seconds"))
+            self._replace_office(kill=True)
+            return
+        ok, value = outcome[0]
+        if ok:
+            job.future.set_result(value)
+        else:
+            job.future.set_exception(value)
+
+    def _run(self) -> None:
+        pool = self._pool
+        try:
+            self._start_office()
+        except Exception as e:
+            self._log.exception("Unable to start office")
+            pool._on_worker_failed(e)
+            return
+        pool._on_worker_ready()
+        try:
+            while True:
+                job = pool._jobs.get()
+                if job is _STOP:
+                    break
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                if (
+                    pool._health_interval >= 0
+                    and time.monotonic() - self._last_used >= pool._health_interval
+                    and not self._is_responsive()
+                ):
+                    self._log.warning("Office instance is not responding, replacing it")
+                    try:
+                        self._replace_office(kill=True)
+                    except BaseException as e:
+                        # the job is already running, it must not be left without a result.
+                        job.future.set_exception(e)
+                        raise
+                self._run_job(job)
+                self._job_count += 1
+                self._last_used = time.monotonic()
+                pool._on_job_done()
+                if pool._max_jobs > 0 and self._job_count >= pool._max_jobs and not pool._shutdown:
+                    self._log.debug(f"Recycling office instance after {self._job_count} jobs")
+                    self._replace_office(kill=False)
+        except Exception:
+            self._log.exception("Worker stopped")
+        finally:
+            self._stop_office()
+            pool._on_worker_exit()
+
+
+class OfficePool:
+    """
+    Pool of headless LibreOffice instances that run jobs in parallel.
+
+    A LibreOffice process handles bridge calls one at a time, a pool of processes allows work on more than one core.
+    Each instance is started with its own pipe (:py:class:`~.conn.connectors.ConnectPipe`) and its own profile
+    (:py:class:`~.conn.cache.Cache`) and is owned by a worker thread.
+
+    Jobs are callables that get the :py:class:`~ooodev.loader.inst.lo_inst.LoInst` of the instance as first argument.
+    A job must only use the ``LoInst`` it gets, such as ``CalcDoc.open_doc(fnm, lo_inst=lo_inst)``,
+    and close the documents it opens.
+
+    Instances are checked before a job when they have been idle, are recycled after a number of jobs,
+    and are killed and replaced when a job does not finish in time.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.conn.office_pool import OfficePool
+            from ooodev.write import WriteDoc
+
+            def convert(lo_inst, src, dst):
+                doc = WriteDoc.open_doc(fnm=src, lo_inst=lo_inst)
+                try:
+                    doc.save_doc(dst)
+                finally:
+                    doc.close()
+
+            with OfficePool(size=4, max_jobs=50, job_timeout=120) as pool:
+                futures = [pool.submit(convert, src, src.with_suffix(".pdf")) for src in files]
+                for future in futures:
+                    future.result()
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, size: int = 2, **kwargs: Any) -> None:
+        """
+        Constructor
+
+        Args:
+            size (int, optional): Number of office instances. Defaults to ``2``.
+
+        Keyword Args:
+            max_jobs (int, optional): Number of jobs after which an instance is restarted, ``0`` to never restart.
+                Defaults to ``100``.
+            job_timeout (float, optional): Seconds a job may run before its instance is killed and replaced and
+                the job fails with ``TimeoutError``. Defaults to ``None`` (no limit).
+            health_interval (float, optional): Seconds an instance may be idle before it is checked ahead of
+                the next job, ``-1`` to never check. Defaults to ``30.0``.
+            health_timeout (float, optional): Seconds an instance has to answer a check. Defaults to ``5.0``.
+            headless (bool, optional): Start instances headless. Defaults to ``True``.
+            soffice (PathOrStr, optional): Path to soffice.
+            env_vars (Dict[str, str], optional): Environment variables to be set when starting office.
+            profile_path (PathOrStr, optional): Profile that is copied for each instance.
+                Defaults to the user profile or, when ``template`` is ``True``, to a template profile in the cache dir
+                of the current user. Empty string to start each instance with a new profile.
+            template (bool, optional): Build a template profile with the first instance and clone it for
+                the others, see :py:class:`~.conn.cache.Cache`. Defaults to ``True``.
+            keep_extensions (bool, optional): Keep user extensions in the template profile. Defaults to ``False``.
+            opt (Options, optional): Options for each ``LoInst``.
+
+        Raises:
+            ValueError: If ``size`` is less than ``1``.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._log = NamedLogger(self.__class__.__name__)
+        self._size = size
+        self._max_jobs = int(kwargs.get("max_jobs", 100))
+        self._job_timeout: float | None = kwargs.get("job_timeout", None)
+        self._health_interval = float(kwargs.get("health_interval", 30.0))
+        self._health_timeout = float(kwargs.get("health_timeout", 5.0))
+        self._headless = bool(kwargs.get("headless", True))
+        self._soffice = kwargs.get("soffice", None)
+        self._env_vars = kwargs.get("env_vars", {})
+        self._profile_path = kwargs.get("profile_path", None)
+        self._template = bool(kwargs.get("template", True))
+        self._keep_extensions = bool(kwargs.get("keep_extensions", False))
+        self._opt: LoOptions | None = kwargs.get("opt", None)
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._workers: List[_PoolWorker] = []
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._profile_ready = False
+        self._alive = 0
+        self._ready = threading.Semaphore(0)
+        self._started = False
+        self._shutdown = False
+        self._completed = 0
+        self._restarts = 0
+        self._killed = 0
+        self._startup_times: List[StartupTime] = []
+        self._errors: List[Exception] = []
+
+    def __enter__(self) -> OfficePool:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.shutdown(wait=True, cancel_jobs=exc_type is not None)
+
+    def __repr__(self) -> str:
+        return f"<OfficePool size={self._size} completed={self._completed} restarts={self._restarts}>"
+
+    # region worker callbacks
+    @contextlib.contextmanager
+    def _get_start_lock(self) -> Iterator[None]:
+        # the first instance copies and caches the profile, others may start in parallel once it is ready.
+        locked = False
+        if not self._profile_ready:
+            self._start_lock.acquire()
+            locked = not self._profile_ready
+            if not locked:
+                self._start_lock.release()
+        try:
+            yield
+            if locked:
+                self._profile_ready = True
+        finally:
+            if locked:
+                self._start_lock.release()
+
+    def _on_worker_ready(self) -> None:
+        with self._lock:
+            self._alive += 1
+        self._ready.release()
+
+    def _on_worker_exit(self) -> None:
+        with self._lock:
+            self._alive -= 1
+            if self._alive > 0 or self._shutdown:
+                return
+        # last instance is gone, queued jobs would never run.
+        self._log.error("No office instance of the pool is running")
+        self._fail_pending(mEx.ConnectionError("No office instance of the pool is running"))
+
+    def _fail_pending(self, error: Exception | None) -> None:
+        # cancels queued jobs or, when error is set, fails them with error.
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if job is _STOP:
+                continue
+            if error is None:
+                job.future.cancel()
+            elif job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+
+    def _on_worker_failed(self, error: Exception) -> None:
+        with self._lock:
+            self._errors.append(error)
+        self._ready.release()
+
+    def _on_office_started(self, startup: StartupTime) -> None:
+        with self._lock:
+            self._startup_times.append(startup)
+
+    def _on_job_done(self) -> None:
+        with self._lock:
+            self._completed += 1
+
+    def _on_restart(self, killed: bool) -> None:
+        with self._lock:
+            self._restarts += 1
+            if killed:
+                self._killed += 1
+
+    # endregion worker callbacks
+
+    def start(self) -> None:
+        """
+        Starts the office instances and waits until they are connected.
+
+        Calling this method again has no effect.
+
+        Raises:
+            ConnectionError: If no office instance could be started.
+
+        Returns:
+            None:
+        """
+        if self._started:
+            return
+        if self._shutdown:
+            raise RuntimeError("Cannot start a pool that has been shut down")
+        self._started = True
+        self._workers = [_PoolWorker(self, i) for i in range(self._size)]
+        for worker in self._workers:
+            worker.thread.start()
+        for _ in self._workers:
+            self._ready.acquire()
+        if self._errors:
+            self._log.warning(f"{len(self._errors)} of {self._size} office instances failed to start")
+            if len(self._errors) == self._size:
+                self._shutdown = True
+                raise mEx.ConnectionError("No office instance of the pool could be started") from self._errors[0]
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> Future[_T]:
+        """
+        Submits a job.
+
+        Args:
+            fn (Callable[..., T]): Job, called as ``fn(lo_inst, *args, **kwargs)``.
+            args (Any): Extra positional arguments for ``fn``.
+            kwargs (Any): Extra keyword arguments for ``fn``.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+
+        Returns:
+            Future[T]: Future of the job result.
+
+        Note:
+            The pool is started on first submit if ``start()`` has not been called.
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot submit a job after shutdown")
+        if not self._started:
+            self.start()
+        job = _Job(fn, args, kwargs)
+        self._jobs.put(job)
+        return job.future
+
+    def map(self, fn: Callable[..., _T], *iterables: Iterable[Any], timeout: float | None = None) -> Iterator[_T]:
+        """
+        Runs a job for each set of arguments.
+
+        Args:
+            fn (Callable[..., T]): Job, called as ``fn(lo_inst, *args)``.
+            iterables (Iterable[Any]): Arguments for the jobs, as for the built-in ``map()``.
+            timeout (float, optional): Seconds to wait for each result. Defaults to ``None``.
+
+        Returns:
+            Iterator[T]: Job results in the order of the arguments.
+        """
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+
+        def results() -> Iterator[_T]:
+            try:
+                for future in futures:
+                    yield future.result(timeout)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return results()
+
+    def shutdown(self, wait: bool = True, cancel_jobs: bool = False) -> None:
+        """
+        Shuts down the pool and closes the office instances.
+
+        Jobs that are already submitted are run before the instances are closed,
+        unless ``cancel_jobs`` is ``True``.
+
+        Args:
+            wait (bool, optional): Wait until the office instances are closed. Defaults to ``True``.
+            cancel_jobs (bool, optional): Cancel jobs that have not started. Defaults to ``False``.
+
+        Returns:
+            None:
+        """
+        with self._lock:
+            if self._shutdown and not self._workers:
+                return
+            self._shutdown = True
+        if cancel_jobs:
+            self._fail_pending(None)
+        for _ in self._workers:
+            self._jobs.put(_STOP)
+        if wait:
+            for worker in self._workers:
+                worker.thread.join()
+        self._workers = []
+
+    # region Properties
+    @property
+    def size(self) -> int:
+        """Gets the number of office instances."""
+        return self._size
+
+    @property
+    def completed(self) -> int:
+        """Gets the number of jobs that have run."""
+        return self._completed
+
+    @property
+    def restarts(self) -> int:
+        """Gets the number of times an office instance was recycled or replaced."""
+        return self._restarts
+
+    @property
+    def killed(self) -> int:
+        """Gets the number of office instances that were killed because they did not respond."""
+        return self._killed
+
+    @property
+    def startup_times(self) -> Tuple[StartupTime, ...]:
+        """Gets the time taken by each start of an office instance, including restarts, in order of start."""
+        with self._lock:
+            return tuple(self._startup_times)
+
+    @property
+    def pending(self) -> int:
+        """Gets the approximate number of jobs waiting to run."""
+        return self._jobs.qsize()
+
+    # endregion Properties
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class StartupReport:
+    """
+    Time taken by each phase of connecting to office.
+
+    Times are in seconds, a phase that did not take place is ``0.0``.
+
+    .. versionadded:: 0.54.0
+    """
+
+    spawn: float = 0.0
+    """Starting the soffice process, ``0.0`` when connecting to an office that is already running."""
+    accept: float = 0.0
+    """From process start until office accepted the connection that was resolved."""
+    resolve: float = 0.0
+    """Resolving the office component context and creating the bridge."""
+    desktop: float = 0.0
+    """Getting the office desktop once the bridge was created."""
+    attempts: int = 0
+    """Number of times resolving the component context was tried."""
+    probes: int = 0
+    """Number of times it was checked if office accepts connections."""
+
+    def __str__(self) -> str:
+        return (
+            f"total {self.total:.3f}s (spawn {self.spawn:.3f}s, accept {self.accept:.3f}s, "
+            f"resolve {self.resolve:.3f}s, desktop {self.desktop:.3f}s), "
+            f"attempts {self.attempts}, probes {self.probes}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the report as a dictionary, such as for logging as JSON.
+
+        Returns:
+            Dict[str, Any]: Phases, counts and ``total``.
+        """
+        result = asdict(self)
+        result["total"] = self.total
+        return result
+
+    @property
+    def total(self) -> float:
+        """Gets the seconds of all phases."""
+        return self.spawn + self.accept + self.resolve + self.desktop
@@ -113,6 +113,23 @@ class CalcNamedEvent:
     CELLS_HIGH_LIGHTED = "calc_cells_high_lighted"
     """Cells Highlighted see :py:meth:`Calc.highlight_range() <.office.calc.Calc.highlight_range>`"""
 
+    ARRAY_CHUNK_WRITTEN = "calc_array_chunk_written"
+    """Array block written when ``chunk_cells`` is set, see :py:meth:`Calc.set_array() <.office.calc.Calc.set_array>`"""
+
+    CSV_IMPORTING = "calc_csv_importing"
+    """CSV Importing see :py:meth:`CalcSheet.import_csv() <ooodev.calc.CalcSheet.import_csv>`"""
+    CSV_IMPORT_PROGRESS = "calc_csv_import_progress"
+    """CSV Import block written see :py:meth:`CalcSheet.import_csv() <ooodev.calc.CalcSheet.import_csv>`"""
+    CSV_IMPORTED = "calc_csv_imported"
+    """CSV Imported see :py:meth:`CalcSheet.import_csv() <ooodev.calc.CalcSheet.import_csv>`"""
+
+    CALCULATION_SUSPENDED = "calc_calculation_suspended"
+    """Automatic calculation suspended see :py:meth:`CalcDoc.calculation_suspended() <ooodev.calc.CalcDoc.calculation_suspended>`"""
+    RECALCULATING = "calc_recalculating"
+    """Recalculating after suspension see :py:meth:`CalcDoc.calculation_suspended() <ooodev.calc.CalcDoc.calculation_suspended>`"""
+    RECALCULATED = "calc_recalculated"
+    """Recalculated after suspension see :py:meth:`CalcDoc.calculation_suspended() <ooodev.calc.CalcDoc.calculation_suspended>`"""
+
     EXPORTING_RANGE_PNG = "calc_exporting_range_png"
     """
     Exporting a Range to image format of PNG.
@@ -130,3 +147,21 @@ class CalcNamedEvent:
     """
     Exported a Range to image format of JPG.
     """
+
+    EXPORTING_RANGE_CSV = "calc_exporting_range_csv"
+    """
+    Exporting a Range to CSV.
+    """
+    EXPORTED_RANGE_CSV = "calc_exported_range_csv"
+    """
+    Exported a Range to CSV.
+    """
+
+    EXPORTING_RANGE_PARQUET = "calc_exporting_range_parquet"
+    """
+    Exporting a Range to Apache Parquet.
+    """
+    EXPORTED_RANGE_PARQUET = "calc_exported_range_parquet"
+    """
+    Exported a Range to Apache Parquet.
+    """
@@ -73,6 +73,7 @@ from ooodev.utils import info as mInfo
 from ooodev.utils import props as mProps
 from ooodev.utils import script_context
 from ooodev.utils import table_helper as mThelper
+from ooodev.utils.uno_profiler import profiled
 from ooodev.utils.factory.doc_factory import doc_factory, is_known_doc
 from ooodev.utils.cache.lru_cache import LRUCache
 from ooodev.io.log import logging as logger
@@ -372,6 +373,7 @@ class LoInst(EventsPartial):
     @overload
     def qi(self, atype: Type[T], obj: Any, raise_err: Literal[False]) -> T | None: ...
 
+    @profiled("Lo.qi")
     def qi(self, atype: Type[T], obj: XTypeProvider, raise_err: bool = False) -> T | None:
         """
         Generic method that get an interface instance from  an object.
@@ -584,6 +586,7 @@ class LoInst(EventsPartial):
         self, atype: Type[T], service_name: str, msf: Any | None, raise_err: Literal[False], *args: Any
     ) -> T | None: ...
 
+    @profiled("Lo.create_instance_msf")
     def create_instance_msf(
         self,
         atype: Type[T],
@@ -645,6 +648,7 @@ class LoInst(EventsPartial):
         self, atype: Type[T], service_name: str, args: Tuple[Any, ...] | None, raise_err: Literal[False]
     ) -> T | None: ...
 
+    @profiled("Lo.create_instance_mcf")
     def create_instance_mcf(
         self, atype: Type[T], service_name: str, args: Tuple[Any, ...] | None = None, raise_err: bool = False
     ) -> T | None:
@@ -42,6 +42,7 @@ from ooodev.events.gbl_named_event import GblNamedEvent
 from ooodev.formatters.formatter_table import FormatterTable
 from ooodev.meta.static_meta import StaticProperty, classproperty
 from ooodev.mock import mock_g
+from ooodev.utils.uno_profiler import UnoProfiler
 
 
 if TYPE_CHECKING:
@@ -2180,6 +2181,34 @@ class Lo(metaclass=StaticProperty):
         _ = inst.load_from_lo_loader(cls._lo_inst.lo_loader)
         return inst
 
+    @classmethod
+    def profile(cls) -> UnoProfiler:
+        """
+        Gets a profiler that counts and times office bridge calls while it is running.
+
+        ``Lo.qi()``, ``Lo.create_instance_msf()``, ``Lo.create_instance_mcf()``, ``Props.get()`` and ``Props.set()``
+        are recorded and grouped by the ooodev method or user function that made the call.
+        Other UNO calls are part of the time of the calling function in ``cProfile``.
+
+        |lo_safe|
+
+        Returns:
+            UnoProfiler: Profiler, use it as a context manager or call its ``start()`` and ``stop()`` methods.
+
+        Example:
+            .. code-block:: python
+
+                with Lo.profile() as prof:
+                    sheet["A1"].value = 10
+                print(prof.to_json(indent=2))
+
+        See Also:
+            :py:class:`~ooodev.utils.uno_profiler.UnoProfiler`
+
+        .. versionadded:: 0.54.0
+        """
+        return UnoProfiler()
+
     @classproperty
     def current_doc(cls) -> OfficeDocumentT | None:
         """
@@ -4,10 +4,15 @@
 # region Imports
 from __future__ import annotations
 import contextlib
+from datetime import datetime
 import itertools
 from enum import IntEnum, IntFlag, Enum
+import math
 import re
-from typing import Any, List, Tuple, cast, overload, Sequence, Optional, TYPE_CHECKING
+import threading
+import time
+import weakref
+from typing import Any, Generator, Iterable, List, Tuple, cast, overload, Sequence, Optional, TYPE_CHECKING
 import uno
 
 # from ..mock import mock_g
@@ -24,9 +29,11 @@ from com.sun.star.frame import XModel
 from com.sun.star.lang import Locale
 from com.sun.star.lang import XComponent
 from com.sun.star.sheet import SolverConstraint  # struct
+from com.sun.star.sheet import XCalculatable
 from com.sun.star.sheet import XCellAddressable
 from com.sun.star.sheet import XCellRangeAddressable
 from com.sun.star.sheet import XCellRangeData
+from com.sun.star.sheet import XCellRangeFormula
 from com.sun.star.sheet import XCellRangeMovement
 from com.sun.star.sheet import XCellRangesQuery
 from com.sun.star.sheet import XCellSeries
@@ -59,6 +66,7 @@ from com.sun.star.table import XColumnRowRange
 from com.sun.star.text import XSimpleText
 from com.sun.star.uno import Exception as UnoException
 from com.sun.star.util import NumberFormat  # const
+from com.sun.star.util import XCloseable
 from com.sun.star.util import XMergeable
 from com.sun.star.util import XNumberFormatsSupplier
 from com.sun.star.util import XNumberFormatTypes
@@ -88,6 +96,7 @@ from ooodev.loader import lo as mLo
 from ooodev.utils import props as mProps
 from ooodev.utils import table_helper as mTblHelper
 from ooodev.utils import view_state as mViewState
+from ooodev.utils.helper.ndarray_helper import NdArrayHelper
 from ooodev.utils.color import CommonColor, Color
 from ooodev.utils.data_type import cell_obj as mCellObj
 from ooodev.utils.data_type import range_obj as mRngObj
@@ -125,6 +134,7 @@ if TYPE_CHECKING:
     from com.sun.star.util import CellProtection
     from ooodev.units.unit_obj import UnitT
     from ooodev.proto.style_obj import StyleT
+    from numpy import ndarray  # type: ignore
 else:
     XComponentLoader = Any
     XController = Any
@@ -143,6 +153,7 @@ else:
     CellProtection = Any
     UnitT = Any
     StyleT = Any
+    ndarray = Any
 
 NameVal = ArgsHelper.NameValue
 # endregion Imports
@@ -188,6 +199,12 @@ class Calc:
 
     _rx_cell = re.compile(r"([a-zA-Z]+)([0-9]+)")
 
+    # hidden documents reused by call_fun_many(), one [lock, document] entry per LoInst.
+    _scratch_docs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _scratch_docs_lock = threading.Lock()
+    # longest string that is written into a scratch formula.
+    _SCRATCH_STR_MAX = 255
+
     # endregion Constants
 
     # region --------------- document methods --------------------------
@@ -3908,7 +3925,12 @@ class Calc:
     # region    set_array()
     @classmethod
     def _set_array_doc_addr(
-        cls, values: Table, doc: XSpreadsheetDocument, addr: CellAddress, styles: Sequence[StyleT] | None = None
+        cls,
+        values: Table,
+        doc: XSpreadsheetDocument,
+        addr: CellAddress,
+        styles: Sequence[StyleT] | None = None,
+        chunk_cells: int = 0,
     ) -> None:
         """Lo Safe Method."""
         v_len = len(values)
@@ -3921,14 +3943,18 @@ class Calc:
         cell_range = cls._get_cell_range_col_row(
             sheet=sheet, start_col=addr.Column, start_row=addr.Row, end_col=col_end, end_row=row_end
         )
-        if styles is None:
+        if chunk_cells > 0:
+            cls._set_cell_range_array_chunked(
+                cell_range=cell_range, values=values, chunk_cells=chunk_cells, styles=styles
+            )
+        elif styles is None:
             cls.set_cell_range_array(cell_range=cell_range, values=values)
         else:
             cls.set_cell_range_array(cell_range=cell_range, values=values, styles=styles)
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, cell_range: XCellRange) -> None:
+    def set_array(cls, values: Table, cell_range: XCellRange, *, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -3937,6 +3963,7 @@ class Calc:
         Args:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_range (XCellRange): Range in spreadsheet to insert data.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -3945,7 +3972,9 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, cell_range: XCellRange, *, styles: Sequence[StyleT]) -> None:
+    def set_array(
+        cls, values: Table, cell_range: XCellRange, *, styles: Sequence[StyleT], chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -3955,6 +3984,7 @@ class Calc:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             cell_range (XCellRange): Range in spreadsheet to insert data.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -3963,7 +3993,7 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, sheet: XSpreadsheet, name: str) -> None:
+    def set_array(cls, values: Table, sheet: XSpreadsheet, name: str, *, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -3973,6 +4003,7 @@ class Calc:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             sheet (XSpreadsheet): Spreadsheet.
             name (str): Range name such as 'A1:D4' or cell name such as ``B4``.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -3981,7 +4012,9 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, sheet: XSpreadsheet, name: str, *, styles: Sequence[StyleT]) -> None:
+    def set_array(
+        cls, values: Table, sheet: XSpreadsheet, name: str, *, styles: Sequence[StyleT], chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -3992,6 +4025,7 @@ class Calc:
             sheet (XSpreadsheet): Spreadsheet.
             name (str): Range name such as 'A1:D4' or cell name such as ``B4``.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4000,7 +4034,9 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> None:
+    def set_array(
+        cls, values: Table, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj, *, chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -4010,6 +4046,7 @@ class Calc:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             sheet (XSpreadsheet): Spreadsheet.
             range_obj (RangeObj): Range Object.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4019,7 +4056,13 @@ class Calc:
     @overload
     @classmethod
     def set_array(
-        cls, values: Table, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj, *, styles: Sequence[StyleT]
+        cls,
+        values: Table,
+        sheet: XSpreadsheet,
+        range_obj: mRngObj.RangeObj,
+        *,
+        styles: Sequence[StyleT],
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4031,6 +4074,7 @@ class Calc:
             sheet (XSpreadsheet): Spreadsheet.
             range_obj (RangeObj): Range Object.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4039,7 +4083,9 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> None:
+    def set_array(
+        cls, values: Table, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj, *, chunk_cells: int = ...
+    ) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -4049,6 +4095,7 @@ class Calc:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             sheet (XSpreadsheet): Spreadsheet.
             cell_obj (CellObj): Cell Object.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4058,7 +4105,13 @@ class Calc:
     @overload
     @classmethod
     def set_array(
-        cls, values: Table, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj, *, styles: Sequence[StyleT]
+        cls,
+        values: Table,
+        sheet: XSpreadsheet,
+        cell_obj: mCellObj.CellObj,
+        *,
+        styles: Sequence[StyleT],
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4070,6 +4123,7 @@ class Calc:
             sheet (XSpreadsheet): Spreadsheet.
             cell_obj (CellObj): Cell Object.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4078,7 +4132,7 @@ class Calc:
 
     @overload
     @classmethod
-    def set_array(cls, values: Table, doc: XSpreadsheetDocument, addr: CellAddress) -> None:
+    def set_array(cls, values: Table, doc: XSpreadsheetDocument, addr: CellAddress, *, chunk_cells: int = ...) -> None:
         """
         Inserts array of data into spreadsheet.
 
@@ -4088,6 +4142,7 @@ class Calc:
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             doc (XSpreadsheetDocument): Spreadsheet Document.
             addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4097,7 +4152,13 @@ class Calc:
     @overload
     @classmethod
     def set_array(
-        cls, values: Table, doc: XSpreadsheetDocument, addr: CellAddress, *, styles: Sequence[StyleT]
+        cls,
+        values: Table,
+        doc: XSpreadsheetDocument,
+        addr: CellAddress,
+        *,
+        styles: Sequence[StyleT],
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4109,6 +4170,7 @@ class Calc:
             doc (XSpreadsheetDocument): Spreadsheet Document.
             addr (CellAddress): Address to insert data.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4125,6 +4187,8 @@ class Calc:
         row_start: int,
         col_end: int,
         row_end: int,
+        *,
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4138,6 +4202,7 @@ class Calc:
             row_start (int): Zero-base Start Row.
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4156,6 +4221,7 @@ class Calc:
         row_end: int,
         *,
         styles: Sequence[StyleT],
+        chunk_cells: int = ...,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4170,6 +4236,7 @@ class Calc:
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4197,18 +4264,35 @@ class Calc:
             col_end (int): Zero-base End Column.
             row_end (int): Zero-base End Row.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): When greater than ``0`` values are written in blocks of rows
+                holding at most ``chunk_cells`` cells each. While writing blocks controllers are locked and
+                automatic calculation is turned off. Default ``0`` writes all values in a single call.
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.ARRAY_CHUNK_WRITTEN` :eventref:`src-docs-event`
 
         Returns:
             None:
 
+        Note:
+            ``ARRAY_CHUNK_WRITTEN`` is only triggered when ``chunk_cells`` is greater than ``0``.
+            Event arg ``event_data`` is a dictionary containing ``range_obj``, ``chunk_index``, ``rows``,
+            ``cells`` and ``elapsed`` (seconds spent writing the block).
+
         See Also:
             - :ref:`help_calc_format_style_cell`
             - :ref:`help_calc_format_direct_cell`
 
         .. versionchanged:: 0.9.1
             Added overloads for styles.
+
+        .. versionchanged:: 0.54.0
+            Added ``chunk_cells`` keyword argument.
         """
         styles = cast(Sequence[StyleT], kwargs.pop("styles", ()))
+        chunk_cells = int(kwargs.pop("chunk_cells", 0))
         ordered_keys = (1, 2, 3, 4, 5, 6)
         kargs_len = len(kwargs)
         count = len(args) + kargs_len
@@ -4263,7 +4347,12 @@ class Calc:
 
         if count == 2:
             #  set_array(values: Sequence[Sequence[object]], cell_range: XCellRange)
-            cls.set_cell_range_array(cell_range=kargs[2], values=kargs[1], styles=styles)
+            if chunk_cells > 0:
+                cls._set_cell_range_array_chunked(
+                    cell_range=kargs[2], values=kargs[1], chunk_cells=chunk_cells, styles=styles
+                )
+            else:
+                cls.set_cell_range_array(cell_range=kargs[2], values=kargs[1], styles=styles)
             return
         if count == 3:
             arg1 = kargs[1]
@@ -4273,24 +4362,37 @@ class Calc:
             if isinstance(arg3, str):
                 # set_array(values: Sequence[Sequence[object]], sheet: XSpreadsheet, name: str)
                 if cls.is_cell_range_name(arg3):
-                    cls._set_array_range(sheet=arg2, range_name=cls.get_safe_rng_str(arg3), values=arg1, styles=styles)
+                    cls._set_array_range(
+                        sheet=arg2,
+                        range_name=cls.get_safe_rng_str(arg3),
+                        values=arg1,
+                        styles=styles,
+                        chunk_cells=chunk_cells,
+                    )
                     return
                 else:
-                    cls._set_array_cell(sheet=arg2, cell_name=arg3, values=arg1, styles=styles)
+                    cls._set_array_cell(
+                        sheet=arg2, cell_name=arg3, values=arg1, styles=styles, chunk_cells=chunk_cells
+                    )
                     return
             elif isinstance(arg3, mRngObj.RangeObj):
-                cls._set_array_range(sheet=arg2, range_name=arg3, values=arg1, styles=styles)
+                cls._set_array_range(sheet=arg2, range_name=arg3, values=arg1, styles=styles, chunk_cells=chunk_cells)
             elif isinstance(arg3, mCellObj.CellObj):
-                cls._set_array_cell(sheet=arg2, cell_name=arg3, values=arg1, styles=styles)
+                cls._set_array_cell(sheet=arg2, cell_name=arg3, values=arg1, styles=styles, chunk_cells=chunk_cells)
             else:
-                cls._set_array_doc_addr(values=arg1, doc=arg2, addr=arg3, styles=styles)
+                cls._set_array_doc_addr(values=arg1, doc=arg2, addr=arg3, styles=styles, chunk_cells=chunk_cells)
             return
         if count == 6:
             #  def set_array(values: Sequence[Sequence[object]], sheet: XSpreadsheet, col_start: int, row_start: int, col_end:int, row_end: int)
             cell_range = cls._get_cell_range_col_row(
                 sheet=kargs[2], start_col=kargs[3], start_row=kargs[4], end_col=kargs[5], end_row=kargs[6]
             )
-            cls.set_cell_range_array(cell_range=cell_range, values=kargs[1], styles=styles)
+            if chunk_cells > 0:
+                cls._set_cell_range_array_chunked(
+                    cell_range=cell_range, values=kargs[1], chunk_cells=chunk_cells, styles=styles
+                )
+            else:
+                cls.set_cell_range_array(cell_range=cell_range, values=kargs[1], styles=styles)
         return
 
     # endregion set_array()
@@ -4304,6 +4406,7 @@ class Calc:
         range_name: str | mRngObj.RangeObj,
         values: Table,
         styles: Sequence[StyleT] | None = None,
+        chunk_cells: int = 0,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4315,6 +4418,7 @@ class Calc:
             range_name (str): Range to insert data such as 'A1:E12'
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
 
         Returns:
             None:
@@ -4324,7 +4428,11 @@ class Calc:
             mLo.Lo.print("Values has not data")
             return
         cell_range = cls.get_cell_range(sheet, range_name)
-        if styles is None:
+        if chunk_cells > 0:
+            cls._set_cell_range_array_chunked(
+                cell_range=cell_range, values=values, chunk_cells=chunk_cells, styles=styles
+            )
+        elif styles is None:
             cls.set_cell_range_array(cell_range=cell_range, values=values)
         else:
             cls.set_cell_range_array(cell_range=cell_range, values=values, styles=styles)
@@ -4525,6 +4633,11 @@ class Calc:
         cr_data.setDataArray(values)  # type: ignore
         if styles is None:
             return
+        Calc._apply_cell_range_styles(cell_range=cell_range, styles=styles)
+
+    @staticmethod
+    def _apply_cell_range_styles(cell_range: XCellRange, styles: Sequence[StyleT]) -> None:
+        """LO Safe Method."""
         supported_styles = (
             "com.sun.star.style.CharacterProperties",
             "com.sun.star.style.ParagraphProperties",
@@ -4537,6 +4650,126 @@ class Calc:
             if style.support_service(*supported_styles):
                 style.apply(cell_range)
 
+    @classmethod
+    def _set_cell_range_array_chunked(
+        cls,
+        cell_range: XCellRange,
+        values: Table,
+        chunk_cells: int,
+        styles: Sequence[StyleT] | None = None,
+    ) -> None:
+        """
+        Inserts array of data into spreadsheet in blocks of rows.
+
+        Each block holds at most ``chunk_cells`` cells, but never less than one row.
+        Controllers of the document that contains ``cell_range`` are locked and its automatic calculation
+        is turned off while the blocks are written. Both are restored afterwards.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell Range
+            values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
+            chunk_cells (int): Maximum number of cells written in one block.
+            styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.calc_named_event.CalcNamedEvent.ARRAY_CHUNK_WRITTEN` :eventref:`src-docs-event`
+
+        Note:
+            ``ARRAY_CHUNK_WRITTEN`` event arg ``event_data`` is a dictionary containing
+            ``range_obj``, ``chunk_index``, ``rows``, ``cells`` and ``elapsed`` (seconds spent in ``setDataArray()``).
+        """
+        v_len = len(values)
+        if v_len == 0:
+            mLo.Lo.print("Values has not data")
+            return
+        col_count = len(values[0])
+        chunk_rows = max(1, chunk_cells // max(col_count, 1))
+        addr = cls._get_address_cell(cell_range)
+        # the document of the range, which is not always the current document.
+        model = cls._get_cell_range_model(cell_range)
+        calculatable = mLo.Lo.qi(XCalculatable, model)
+        auto_calc = calculatable is not None and calculatable.isAutomaticCalculationEnabled()
+        locked = model is not None and cls._lock_model_controllers(model)
+        try:
+            if auto_calc:
+                calculatable.enableAutomaticCalculation(False)  # type: ignore
+            for chunk_index, row_offset in enumerate(range(0, v_len, chunk_rows)):
+                row_last = min(row_offset + chunk_rows, v_len) - 1
+                start = time.perf_counter()
+                # positions are relative to cell_range
+                chunk = cell_range.getCellRangeByPosition(0, row_offset, col_count - 1, row_last)
+                cr_data = mLo.Lo.qi(XCellRangeData, chunk, True)
+                cr_data.setDataArray(values[row_offset : row_last + 1])  # type: ignore
+                elapsed = time.perf_counter() - start
+
+                rv = mRngValues.RangeValues(
+                    col_start=addr.StartColumn,
+                    col_end=addr.StartColumn + col_count - 1,
+                    row_start=addr.StartRow + row_offset,
+                    row_end=addr.StartRow + row_last,
+                    sheet_idx=addr.Sheet,
+                )
+                rows = row_last - row_offset + 1
+                eargs = EventArgs(Calc.set_array.__qualname__)
+                eargs.event_data = {
+                    "range_obj": mRngObj.RangeObj.from_range(rv),
+                    "chunk_index": chunk_index,
+                    "rows": rows,
+                    "cells": rows * col_count,
+                    "elapsed": elapsed,
+                }
+                _Events().trigger(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, eargs)
+        finally:
+            if auto_calc:
+                calculatable.enableAutomaticCalculation(True)  # type: ignore
+            if locked:
+                cls._unlock_model_controllers(model)  # type: ignore
+        if styles:
+            cls._apply_cell_range_styles(cell_range=cell_range, styles=styles)
+
+    @classmethod
+    def _get_cell_range_model(cls, cell_range: XCellRange) -> XModel | None:
+        """LO Safe Method. Gets the document that contains a sheet cell range."""
+        sheet_range = mLo.Lo.qi(XSheetCellRange, cell_range)
+        if sheet_range is None:
+            return None
+        try:
+            doc = cls.get_doc_from_sheet(sheet_range.getSpreadsheet())  # type: ignore
+        except Exception:
+            mLo.Lo.print("Unable to get document of cell range")
+            return None
+        return mLo.Lo.qi(XModel, doc)
+
+    @staticmethod
+    def _lock_model_controllers(model: XModel) -> bool:
+        """LO Safe Method. Same events as ``Lo.lock_controllers()`` but for ``model`` rather than the current document."""
+        lo_inst = mLo.Lo.current_lo
+        cargs = CancelEventArgs(Calc._lock_model_controllers.__qualname__)
+        lo_inst.on_controllers_locking(cargs)
+        if cargs.cancel:
+            return False
+        model.lockControllers()
+        lo_inst.on_controllers_locked(EventArgs(lo_inst))
+        return True
+
+    @staticmethod
+    def _unlock_model_controllers(model: XModel) -> bool:
+        """LO Safe Method. Same events as ``Lo.unlock_controllers()`` but for ``model`` rather than the current document."""
+        lo_inst = mLo.Lo.current_lo
+        cargs = CancelEventArgs(Calc._unlock_model_controllers.__qualname__)
+        lo_inst.on_controllers_unlocking(cargs)
+        if cargs.cancel:
+            return False
+        if model.hasControllersLocked():
+            model.unlockControllers()
+            lo_inst.on_controllers_unlocked(EventArgs(lo_inst))
+            return True
+        return False
+
     # endregion set_cell_range_array()
 
     # region set_array_cell()
@@ -4548,6 +4781,7 @@ class Calc:
         cell_name: str | mCellObj.CellObj,
         values: Table,
         styles: Sequence[StyleT] | None = None,
+        chunk_cells: int = 0,
     ) -> None:
         """
         Inserts array of data into spreadsheet.
@@ -4559,6 +4793,7 @@ class Calc:
             cell_name (str): Cell Name such as 'A1'
             values (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
             styles (Sequence[StyleT], optional): One or more styles to apply to cell range.
+            chunk_cells (int, optional): Maximum number of cells written in one block. Default ``0`` (no blocks).
         """
         v_len = len(values)
         if v_len == 0:
@@ -4570,7 +4805,11 @@ class Calc:
         cell_range = cls._get_cell_range_col_row(
             sheet=sheet, start_col=pos.X, start_row=pos.Y, end_col=col_end, end_row=row_end
         )
-        if styles is None:
+        if chunk_cells > 0:
+            cls._set_cell_range_array_chunked(
+                cell_range=cell_range, values=values, chunk_cells=chunk_cells, styles=styles
+            )
+        elif styles is None:
             cls.set_cell_range_array(cell_range=cell_range, values=values)
         else:
             cls.set_cell_range_array(cell_range=cell_range, values=values, styles=styles)
@@ -4786,205 +5025,1132 @@ class Calc:
 
         Args:
             cell_range (XCellRange): Cell range to get data from.
-            sheet (XSpreadsheet): Spreadsheet
-            range_name (str): Range of data to get such as "A1:E16"
-            range_obj (RangeObj): Range object
-            cell_obj (CellObj): Cell Object
+            sheet (XSpreadsheet): Spreadsheet
+            range_name (str): Range of data to get such as "A1:E16"
+            range_obj (RangeObj): Range object
+            cell_obj (CellObj): Cell Object
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: Resulting data array.
+        """
+        ordered_keys = (1, 2)
+        kargs_len = len(kwargs)
+        count = len(args) + kargs_len
+
+        def get_kwargs() -> dict:
+            ka = {}
+            if kargs_len == 0:
+                return ka
+            valid_keys = ("cell_range", "sheet", "range_name", "range_obj", "cell_obj")
+            check = all(key in valid_keys for key in kwargs)
+            if not check:
+                raise TypeError("get_array() got an unexpected keyword argument")
+            keys = ("cell_range", "sheet")
+            for key in keys:
+                if key in kwargs:
+                    ka[1] = kwargs[key]
+                    break
+            if count == 1:
+                return ka
+            keys = ("range_name", "range_obj", "cell_obj")
+            for key in keys:
+                if key in kwargs:
+                    ka[2] = kwargs[key]
+                    break
+            return ka
+
+        if count not in (1, 2):
+            raise TypeError("get_array() got an invalid number of arguments")
+
+        kargs = get_kwargs()
+        for i, arg in enumerate(args):
+            kargs[ordered_keys[i]] = arg
+
+        if count == 1:
+            cell_range = cast(XCellRange, kargs[1])
+        else:
+            cell_range = cls.get_cell_range(kargs[1], kargs[2])
+
+        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, raise_err=True)
+        return cr_data.getDataArray()
+
+    # endregion get_array()
+
+    # region iter_array()
+
+    @classmethod
+    def _iter_cell_range_array(
+        cls, cell_range: XCellRange, chunk_rows: int
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """LO Safe Method."""
+        addr = cls._get_address_cell(cell_range)
+        col_count = addr.EndColumn - addr.StartColumn + 1
+        row_count = addr.EndRow - addr.StartRow + 1
+        for row_offset in range(0, row_count, chunk_rows):
+            row_last = min(row_offset + chunk_rows, row_count) - 1
+            # positions are relative to cell_range
+            chunk = cell_range.getCellRangeByPosition(0, row_offset, col_count - 1, row_last)
+            cr_data = mLo.Lo.qi(XCellRangeData, chunk, True)
+            rv = mRngValues.RangeValues(
+                col_start=addr.StartColumn,
+                col_end=addr.EndColumn,
+                row_start=addr.StartRow + row_offset,
+                row_end=addr.StartRow + row_last,
+                sheet_idx=addr.Sheet,
+            )
+            yield mRngObj.RangeObj.from_range(rv), cr_data.getDataArray()
+
+    @overload
+    @classmethod
+    def iter_array(
+        cls, cell_range: XCellRange, *, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def iter_array(
+        cls, sheet: XSpreadsheet, range_name: str, *, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet
+            range_name (str): Range of data to get such as "A1:E16"
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def iter_array(
+        cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj, *, chunk_rows: int = ...
+    ) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet
+            range_obj (RangeObj): Range object
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+        """
+        ...
+
+    @classmethod
+    def iter_array(cls, *args, **kwargs) -> Generator[Tuple[mRngObj.RangeObj, TupleArray], None, None]:
+        """
+        Gets Array of data from a spreadsheet in blocks of rows.
+
+        Each block is read with a single ``getDataArray()`` call and is yielded as soon as it is read.
+        Only one block is held at a time, so memory use is bounded by ``chunk_rows`` rather than the size of the range.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            sheet (XSpreadsheet): Spreadsheet
+            range_name (str): Range of data to get such as "A1:E16"
+            range_obj (RangeObj): Range object
+            chunk_rows (int, optional): Maximum number of rows in each block. Defaults to ``1000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            Generator[Tuple[RangeObj, TupleArray], None, None]: Generator of range object and data array for each block.
+            The range object is the part of the sheet the data array was read from.
+
+        Example:
+            .. code-block:: python
+
+                for rng, block in Calc.iter_array(sheet, "A1:F500000", chunk_rows=5000):
+                    print(rng, len(block))
+
+        See Also:
+            :py:meth:`~.calc.Calc.get_array`
+
+        .. versionadded:: 0.54.0
+        """
+        chunk_rows = int(kwargs.pop("chunk_rows", 1000))
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be greater than 0")
+        ordered_keys = (1, 2)
+        kargs_len = len(kwargs)
+        count = len(args) + kargs_len
+
+        def get_kwargs() -> dict:
+            ka = {}
+            if kargs_len == 0:
+                return ka
+            valid_keys = ("cell_range", "sheet", "range_name", "range_obj")
+            check = all(key in valid_keys for key in kwargs)
+            if not check:
+                raise TypeError("iter_array() got an unexpected keyword argument")
+            keys = ("cell_range", "sheet")
+            for key in keys:
+                if key in kwargs:
+                    ka[1] = kwargs[key]
+                    break
+            if count == 1:
+                return ka
+            keys = ("range_name", "range_obj")
+            for key in keys:
+                if key in kwargs:
+                    ka[2] = kwargs[key]
+                    break
+            return ka
+
+        if count not in (1, 2):
+            raise TypeError("iter_array() got an invalid number of arguments")
+
+        kargs = get_kwargs()
+        for i, arg in enumerate(args):
+            kargs[ordered_keys[i]] = arg
+
+        if count == 1:
+            cell_range = cast(XCellRange, kargs[1])
+        else:
+            cell_range = cls.get_cell_range(kargs[1], kargs[2])
+        return cls._iter_cell_range_array(cell_range=cell_range, chunk_rows=chunk_rows)
+
+    # endregion iter_array()
+
+    # region get_formula_array()
+
+    @overload
+    @classmethod
+    def get_formula_array(cls, cell_range: XCellRange) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get formulas from.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_formula_array(cls, sheet: XSpreadsheet, range_name: str) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet.
+            range_name (str): Range of formulas to get such as ``A1:E16``.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_formula_array(cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet.
+            range_obj (RangeObj): Range object.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_formula_array(cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet.
+            cell_obj (CellObj): Cell Object.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_formula_array(
+        cls, sheet: XSpreadsheet, col_start: int, row_start: int, col_end: int, row_end: int
+    ) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+        """
+        ...
+
+    @classmethod
+    def get_formula_array(cls, *args, **kwargs) -> TupleArray:
+        """
+        Gets the formulas of a range in a single call.
+
+        For cells without a formula the cell content is returned as a string;
+        numbers are returned in their string form and empty cells as empty strings.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get formulas from.
+            sheet (XSpreadsheet): Spreadsheet.
+            range_name (str): Range of formulas to get such as ``A1:E16``.
+            range_obj (RangeObj): Range object.
+            cell_obj (CellObj): Cell Object.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            TupleArray: 2-Dimensional tuple of formula strings.
+
+        See Also:
+            :py:meth:`~.Calc.set_formula_array`
+
+        .. versionadded:: 0.54.0
+        """
+        ordered_keys = (1, 2, 3, 4, 5)
+        kargs_len = len(kwargs)
+        count = len(args) + kargs_len
+
+        def get_kwargs() -> dict:
+            ka = {}
+            if kargs_len == 0:
+                return ka
+            valid_keys = (
+                "cell_range",
+                "sheet",
+                "range_name",
+                "range_obj",
+                "cell_obj",
+                "col_start",
+                "row_start",
+                "col_end",
+                "row_end",
+            )
+            check = all(key in valid_keys for key in kwargs)
+            if not check:
+                raise TypeError("get_formula_array() got an unexpected keyword argument")
+            keys = ("cell_range", "sheet")
+            for key in keys:
+                if key in kwargs:
+                    ka[1] = kwargs[key]
+                    break
+            if count == 1:
+                return ka
+            keys = ("range_name", "range_obj", "cell_obj", "col_start")
+            for key in keys:
+                if key in kwargs:
+                    ka[2] = kwargs[key]
+                    break
+            if count == 2:
+                return ka
+            ka[3] = kwargs.get("row_start", None)
+            ka[4] = kwargs.get("col_end", None)
+            ka[5] = kwargs.get("row_end", None)
+            return ka
+
+        if count not in (1, 2, 5):
+            raise TypeError("get_formula_array() got an invalid number of arguments")
+
+        kargs = get_kwargs()
+        for i, arg in enumerate(args):
+            kargs[ordered_keys[i]] = arg
+
+        if count == 1:
+            cell_range = cast(XCellRange, kargs[1])
+        elif count == 2:
+            cell_range = cls.get_cell_range(kargs[1], kargs[2])
+        else:
+            cell_range = cls._get_cell_range_col_row(
+                sheet=kargs[1], start_col=kargs[2], start_row=kargs[3], end_col=kargs[4], end_row=kargs[5]
+            )
+
+        cr_formula = mLo.Lo.qi(XCellRangeFormula, cell_range, raise_err=True)
+        return cr_formula.getFormulaArray()
+
+    # endregion get_formula_array()
+
+    # region set_formula_array()
+
+    @overload
+    @classmethod
+    def set_formula_array(cls, formulas: Table, cell_range: XCellRange) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            cell_range (XCellRange): Range in spreadsheet to insert formulas. Must be the same size as ``formulas``.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    @classmethod
+    def set_formula_array(cls, formulas: Table, sheet: XSpreadsheet, name: str) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            sheet (XSpreadsheet): Spreadsheet.
+            name (str): Range name such as ``A1:D4`` or cell name such as ``B4``.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    @classmethod
+    def set_formula_array(cls, formulas: Table, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            sheet (XSpreadsheet): Spreadsheet.
+            range_obj (RangeObj): Range Object.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    @classmethod
+    def set_formula_array(cls, formulas: Table, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            sheet (XSpreadsheet): Spreadsheet.
+            cell_obj (CellObj): Cell Object to start writing at.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @overload
+    @classmethod
+    def set_formula_array(
+        cls, formulas: Table, sheet: XSpreadsheet, col_start: int, row_start: int, col_end: int, row_end: int
+    ) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            sheet (XSpreadsheet): Spreadsheet.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Returns:
+            None:
+        """
+        ...
+
+    @classmethod
+    def set_formula_array(cls, *args, **kwargs) -> None:
+        """
+        Inserts a 2-Dimensional array of formulas into a range in a single call.
+
+        |lo_safe|
+
+        Args:
+            formulas (Table): 2-Dimensional array of formulas such as ``[["=A1*2", "=SUM(A1:A10)"]]``.
+            cell_range (XCellRange): Range in spreadsheet to insert formulas.
+            sheet (XSpreadsheet): Spreadsheet.
+            name (str): Range name such as ``A1:D4`` or cell name such as ``B4``.
+            range_obj (RangeObj): Range Object.
+            cell_obj (CellObj): Cell Object to start writing at.
+            col_start (int): Zero-base Start Column.
+            row_start (int): Zero-base Start Row.
+            col_end (int): Zero-base End Column.
+            row_end (int): Zero-base End Row.
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            None:
+
+        Note:
+            Formulas are in the same (English) syntax as used by ``XCell.setFormula()``.
+            Values that are not strings are converted into strings; ``None`` clears the cell.
+
+            When a cell name or ``CellObj`` is passed the range is sized to fit ``formulas``.
+
+        Example:
+            .. code-block:: python
+
+                formulas = [[f"=A{row}*B{row}"] for row in range(1, 100_001)]
+                Calc.set_formula_array(formulas, sheet, "C1")
+
+        See Also:
+            :py:meth:`~.Calc.get_formula_array`
+
+        .. versionadded:: 0.54.0
+        """
+        ordered_keys = (1, 2, 3, 4, 5, 6)
+        kargs_len = len(kwargs)
+        count = len(args) + kargs_len
+
+        def get_kwargs() -> dict:
+            ka = {}
+            if kargs_len == 0:
+                return ka
+            valid_keys = (
+                "formulas",
+                "cell_range",
+                "sheet",
+                "name",
+                "range_obj",
+                "cell_obj",
+                "col_start",
+                "row_start",
+                "col_end",
+                "row_end",
+            )
+            check = all(key in valid_keys for key in kwargs)
+            if not check:
+                raise TypeError("set_formula_array() got an unexpected keyword argument")
+            ka[1] = kwargs.get("formulas", None)
+            keys = ("cell_range", "sheet")
+            for key in keys:
+                if key in kwargs:
+                    ka[2] = kwargs[key]
+                    break
+            if count == 2:
+                return ka
+            keys = ("name", "range_obj", "cell_obj", "col_start")
+            for key in keys:
+                if key in kwargs:
+                    ka[3] = kwargs[key]
+                    break
+            if count == 3:
+                return ka
+            ka[4] = kwargs.get("row_start", None)
+            ka[5] = kwargs.get("col_end", None)
+            ka[6] = kwargs.get("row_end", None)
+            return ka
+
+        if count not in (2, 3, 6):
+            raise TypeError("set_formula_array() got an invalid number of arguments")
+
+        kargs = get_kwargs()
+        for i, arg in enumerate(args):
+            kargs[ordered_keys[i]] = arg
+
+        formulas = cast(Table, kargs[1])
+        if len(formulas) == 0:
+            mLo.Lo.print("Formulas has not data")
+            return
+
+        if count == 2:
+            cell_range = cast(XCellRange, kargs[2])
+        elif count == 3:
+            sheet = cast(XSpreadsheet, kargs[2])
+            arg3 = kargs[3]
+            if isinstance(arg3, mRngObj.RangeObj) or (isinstance(arg3, str) and cls.is_cell_range_name(arg3)):
+                cell_range = cls.get_cell_range(sheet, arg3)
+            else:
+                pos = cls.get_cell_position(arg3)
+                cell_range = cls._get_cell_range_col_row(
+                    sheet=sheet,
+                    start_col=pos.X,
+                    start_row=pos.Y,
+                    end_col=pos.X + len(formulas[0]) - 1,
+                    end_row=pos.Y + len(formulas) - 1,
+                )
+        else:
+            cell_range = cls._get_cell_range_col_row(
+                sheet=kargs[2], start_col=kargs[3], start_row=kargs[4], end_col=kargs[5], end_row=kargs[6]
+            )
+
+        cr_formula = mLo.Lo.qi(XCellRangeFormula, cell_range, raise_err=True)
+        cr_formula.setFormulaArray(cls._convert_to_formula_table(formulas))
+
+    @staticmethod
+    def _convert_to_formula_table(formulas: Table) -> Tuple[Tuple[str, ...], ...]:
+        """LO Safe Method."""
+        return tuple(
+            tuple(val if isinstance(val, str) else ("" if val is None else str(val)) for val in row)
+            for row in formulas
+        )
+
+    # endregion set_formula_array()
+
+    # region print_array()
+
+    @overload
+    @staticmethod
+    def print_array(vals: Table) -> None: ...
+
+    @overload
+    @staticmethod
+    def print_array(vals: Table, format_opt: FormatterTable) -> None: ...
+
+    @staticmethod
+    def print_array(vals: Table, format_opt: FormatterTable | None = None) -> None:
+        """
+        Prints a 2-Dimensional array to console.
+
+        |lo_safe|
+
+        Args:
+            vals (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
+            format_opt (FormatterTable, optional): Optional format used to format values when printing to console such as ``FormatterTable(format=".2f")``
+
+        Returns:
+            None:
+
+        See Also:
+            - :ref:`ch21_format_data_console`
+            - :py:data:`~.type_var.Table`
+
+        .. versionchanged:: 0.6.6
+            Added ``format_opt`` parameter
+
+        .. versionchanged:: 0.6.10
+
+            Removed cancel event args.
+        """
+        row_len = len(vals)
+        if row_len == 0:
+            print("No data in array to print")
+            return
+        col_len = len(vals[0])
+        print(f"Row x Column size: {row_len} x {col_len}")
+
+        if format_opt:
+            for i, row in enumerate(vals):
+                col_str = format_opt.get_formatted(idx_row=i, row_data=row)
+                print(col_str)
+        else:
+            for row in vals:
+                col_str = "  ".join([str(cell) for cell in row])
+                print(col_str)
+        print()
+
+    # endregion print_array()
+
+    # region get_float_array()
+
+    @overload
+    @classmethod
+    def get_float_array(cls, cell_range: XCellRange) -> FloatTable:
+        """
+        Gets a 2-Dimensional List of floats.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+
+        Returns:
+            FloatTable: 2-Dimensional List of floats.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_float_array(cls, sheet: XSpreadsheet, range_name: str) -> FloatTable:
+        """
+        Gets a 2-Dimensional List of floats.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            range_name (str): Range to get array of floats from such as ``A1:E18``.
+
+        Returns:
+            FloatTable: 2-Dimensional List of floats.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_float_array(cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> FloatTable:
+        """
+        Gets a 2-Dimensional List of floats.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            range_obj (RangeObj): Range object.
+
+        Returns:
+            FloatTable: 2-Dimensional List of floats.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_float_array(cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> FloatTable:
+        """
+        Gets a 2-Dimensional List of floats.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            cell_obj (CellObj): Cell Object.
+
+        Returns:
+            FloatTable: 2-Dimensional List of floats.
+        """
+        ...
+
+    @classmethod
+    def get_float_array(cls, *args, **kwargs) -> FloatTable:
+        """
+        Gets a 2-Dimensional List of floats.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            range_name (str): Range to get array of floats from such as ``A1:E18``.
+            range_obj (RangeObj): Range object.
+            cell_obj (CellObj): Cell Object.
+
+        Returns:
+            FloatTable: 2-Dimensional List of floats.
+        """
+        return cls._convert_to_floats_2d(cls.get_array(*args, **kwargs))
+
+    # endregion get_float_array()
+
+    get_doubles_array = get_float_array
+
+    # region get_ndarray()
+
+    @overload
+    @classmethod
+    def get_ndarray(
+        cls, cell_range: XCellRange, *, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(
+        cls, sheet: XSpreadsheet, range_name: str, *, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the values from.
+            range_name (str): Range to get values from such as ``A1:E18``.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(
+        cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj, *, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the values from.
+            range_obj (RangeObj): Range object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(
+        cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj, *, dtype: Any = ..., with_mask: bool = ...
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        |lo_safe|
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet to get the values from.
+            cell_obj (CellObj): Cell Object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
+        """
+        ...
+
+    @classmethod
+    def get_ndarray(cls, *args, **kwargs) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Gets a 2-Dimensional ``numpy.ndarray`` of floats.
+
+        Empty and text cells are returned as ``NaN``.
+
+        |lo_safe|
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            sheet (XSpreadsheet): Spreadsheet to get the values from.
+            range_name (str): Range to get values from such as ``A1:E18``.
+            range_obj (RangeObj): Range object.
+            cell_obj (CellObj): Cell Object.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned. Defaults to ``False``.
 
         Raises:
-            MissingInterfaceError: if interface is missing
+            ImportError: If ``numpy`` is not installed.
 
         Returns:
-            TupleArray: Resulting data array.
-        """
-        ordered_keys = (1, 2)
-        kargs_len = len(kwargs)
-        count = len(args) + kargs_len
-
-        def get_kwargs() -> dict:
-            ka = {}
-            if kargs_len == 0:
-                return ka
-            valid_keys = ("cell_range", "sheet", "range_name", "range_obj", "cell_obj")
-            check = all(key in valid_keys for key in kwargs)
-            if not check:
-                raise TypeError("get_array() got an unexpected keyword argument")
-            keys = ("cell_range", "sheet")
-            for key in keys:
-                if key in kwargs:
-                    ka[1] = kwargs[key]
-                    break
-            if count == 1:
-                return ka
-            keys = ("range_name", "range_obj", "cell_obj")
-            for key in keys:
-                if key in kwargs:
-                    ka[2] = kwargs[key]
-                    break
-            return ka
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask of non-numeric cells.
 
-        if count not in (1, 2):
-            raise TypeError("get_array() got an invalid number of arguments")
+        Note:
+            NumPy is an optional dependency and must be installed separately.
 
-        kargs = get_kwargs()
-        for i, arg in enumerate(args):
-            kargs[ordered_keys[i]] = arg
+            Values are read with a single ``getDataArray()`` call and copied into a preallocated array.
+            When ``dtype`` is not a floating point type then non-numeric cells are set to ``0``,
+            use ``with_mask=True`` to identify them.
 
-        if count == 1:
-            cell_range = cast(XCellRange, kargs[1])
-        else:
-            cell_range = cls.get_cell_range(kargs[1], kargs[2])
+        Example:
+            .. code-block:: python
 
-        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, raise_err=True)
-        return cr_data.getDataArray()
+                arr, mask = Calc.get_ndarray(sheet, "A1:D1000", with_mask=True)
+                col_means = arr.mean(axis=0, where=~mask)
 
-    # endregion get_array()
+        .. versionadded:: 0.54.0
+        """
+        dtype = kwargs.pop("dtype", None)
+        with_mask = bool(kwargs.pop("with_mask", False))
+        # fail before reading from the sheet if numpy is missing.
+        NdArrayHelper.import_numpy()
+        return NdArrayHelper.table_to_ndarray(cls.get_array(*args, **kwargs), dtype=dtype, with_mask=with_mask)
 
-    # region print_array()
+    # endregion get_ndarray()
 
-    @overload
-    @staticmethod
-    def print_array(vals: Table) -> None: ...
+    # region set_ndarray()
 
     @overload
-    @staticmethod
-    def print_array(vals: Table, format_opt: FormatterTable) -> None: ...
-
-    @staticmethod
-    def print_array(vals: Table, format_opt: FormatterTable | None = None) -> None:
+    @classmethod
+    def set_ndarray(cls, arr: ndarray, cell_range: XCellRange, *, chunk_cells: int = ...) -> None:
         """
-        Prints a 2-Dimensional array to console.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            vals (Table): A 2-Dimensional array of value such as a list of list or tuple of tuples.
-            format_opt (FormatterTable, optional): Optional format used to format values when printing to console such as ``FormatterTable(format=".2f")``
+            arr (ndarray): 2-Dimensional array of values.
+            cell_range (XCellRange): Range to insert data into.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
             None:
-
-        See Also:
-            - :ref:`ch21_format_data_console`
-            - :py:data:`~.type_var.Table`
-
-        .. versionchanged:: 0.6.6
-            Added ``format_opt`` parameter
-
-        .. versionchanged:: 0.6.10
-
-            Removed cancel event args.
         """
-        row_len = len(vals)
-        if row_len == 0:
-            print("No data in array to print")
-            return
-        col_len = len(vals[0])
-        print(f"Row x Column size: {row_len} x {col_len}")
-
-        if format_opt:
-            for i, row in enumerate(vals):
-                col_str = format_opt.get_formatted(idx_row=i, row_data=row)
-                print(col_str)
-        else:
-            for row in vals:
-                col_str = "  ".join([str(cell) for cell in row])
-                print(col_str)
-        print()
-
-    # endregion print_array()
-
-    # region get_float_array()
+        ...
 
     @overload
     @classmethod
-    def get_float_array(cls, cell_range: XCellRange) -> FloatTable:
+    def set_ndarray(cls, arr: ndarray, sheet: XSpreadsheet, name: str, *, chunk_cells: int = ...) -> None:
         """
-        Gets a 2-Dimensional List of floats.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            cell_range (XCellRange): Cell range to get data from.
+            arr (ndarray): 2-Dimensional array of values.
+            sheet (XSpreadsheet): Spreadsheet
+            name (str): Range name such as ``A1:D4`` or cell name such as ``B4``.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
-            FloatTable: 2-Dimensional List of floats.
+            None:
         """
         ...
 
     @overload
     @classmethod
-    def get_float_array(cls, sheet: XSpreadsheet, range_name: str) -> FloatTable:
+    def set_ndarray(
+        cls, arr: ndarray, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj, *, chunk_cells: int = ...
+    ) -> None:
         """
-        Gets a 2-Dimensional List of floats.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            sheet (XSpreadsheet): Spreadsheet to get the float values from.
-            range_name (str): Range to get array of floats from such as ``A1:E18``.
+            arr (ndarray): 2-Dimensional array of values.
+            sheet (XSpreadsheet): Spreadsheet
+            range_obj (RangeObj): Range Object.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
-            FloatTable: 2-Dimensional List of floats.
+            None:
         """
         ...
 
     @overload
     @classmethod
-    def get_float_array(cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> FloatTable:
+    def set_ndarray(
+        cls, arr: ndarray, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj, *, chunk_cells: int = ...
+    ) -> None:
         """
-        Gets a 2-Dimensional List of floats.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            sheet (XSpreadsheet): Spreadsheet to get the float values from.
-            range_obj (RangeObj): Range object.
+            arr (ndarray): 2-Dimensional array of values.
+            sheet (XSpreadsheet): Spreadsheet
+            cell_obj (CellObj): Cell Object to start writing at.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
-            FloatTable: 2-Dimensional List of floats.
+            None:
         """
         ...
 
     @overload
     @classmethod
-    def get_float_array(cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> FloatTable:
+    def set_ndarray(
+        cls, arr: ndarray, doc: XSpreadsheetDocument, addr: CellAddress, *, chunk_cells: int = ...
+    ) -> None:
         """
-        Gets a 2-Dimensional List of floats.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            sheet (XSpreadsheet): Spreadsheet to get the float values from.
-            cell_obj (CellObj): Cell Object.
+            arr (ndarray): 2-Dimensional array of values.
+            doc (XSpreadsheetDocument): Spreadsheet Document
+            addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
-            FloatTable: 2-Dimensional List of floats.
+            None:
         """
         ...
 
     @classmethod
-    def get_float_array(cls, *args, **kwargs) -> FloatTable:
+    def set_ndarray(cls, arr: ndarray, *args, **kwargs) -> None:
         """
-        Gets a 2-Dimensional List of floats.
+        Inserts a 2-Dimensional ``numpy.ndarray`` into a range.
+
+        ``NaN`` values are written as empty cells.
 
         |lo_safe|
 
         Args:
-            cell_range (XCellRange): Cell range to get data from.
-            sheet (XSpreadsheet): Spreadsheet to get the float values from.
-            range_name (str): Range to get array of floats from such as ``A1:E18``.
-            range_obj (RangeObj): Range object.
-            cell_obj (CellObj): Cell Object.
+            arr (ndarray): 2-Dimensional array of values.
+            cell_range (XCellRange): Range to insert data into.
+            sheet (XSpreadsheet): Spreadsheet
+            name (str): Range name such as ``A1:D4`` or cell name such as ``B4``.
+            range_obj (RangeObj): Range Object.
+            cell_obj (CellObj): Cell Object to start writing at.
+            doc (XSpreadsheetDocument): Spreadsheet Document
+            addr (CellAddress): Address to insert data.
+            chunk_cells (int, optional): Maximum number of cells to write per ``setDataArray()`` call. See :py:meth:`~.Calc.set_array`.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
 
         Returns:
-            FloatTable: 2-Dimensional List of floats.
-        """
-        return cls._convert_to_floats_2d(cls.get_array(*args, **kwargs))
+            None:
 
-    # endregion get_float_array()
+        Note:
+            NumPy is an optional dependency and must be installed separately.
 
-    get_doubles_array = get_float_array
+            The array is converted with ``ndarray.tolist()`` and written using :py:meth:`~.Calc.set_array`.
+
+        .. versionadded:: 0.54.0
+        """
+        cls.set_array(NdArrayHelper.ndarray_to_table(arr), *args, **kwargs)
+
+    # endregion set_ndarray()
 
     # region    convert_to_floats()
 
@@ -5844,6 +7010,71 @@ class Calc:
         nformat = format_types.getStandardFormat(NumberFormat.DATE, locale)
         mProps.Props.set(xcell, NumberFormat=nformat)
 
+    @staticmethod
+    def get_null_date(doc: XSpreadsheetDocument) -> datetime:
+        """
+        Gets the null date of a spreadsheet document.
+
+        The null date is the date that serial date number ``0`` represents.
+
+        |lo_safe|
+
+        Args:
+            doc (XSpreadsheetDocument): Spreadsheet Document.
+
+        Returns:
+            datetime: Null date. Default for Calc documents is ``1899-12-30``.
+
+        .. versionadded:: 0.54.0
+        """
+        n_supplier = mLo.Lo.qi(XNumberFormatsSupplier, doc, True)
+        d = n_supplier.getNumberFormatSettings().getPropertyValue("NullDate")
+        return datetime(d.Year, d.Month, d.Day)
+
+    @staticmethod
+    def get_date_format_key(doc: XSpreadsheetDocument, with_time: bool = False) -> int:
+        """
+        Gets the key of the standard date format of a spreadsheet document.
+
+        |lo_safe|
+
+        Args:
+            doc (XSpreadsheetDocument): Spreadsheet Document.
+            with_time (bool, optional): If ``True`` the standard date time format key is returned. Defaults to ``False``.
+
+        Returns:
+            int: Number format key that can be assigned to the ``NumberFormat`` property of a cell or range.
+
+        .. versionadded:: 0.54.0
+        """
+        n_supplier = mLo.Lo.qi(XNumberFormatsSupplier, doc, True)
+        format_types = mLo.Lo.qi(XNumberFormatTypes, n_supplier.getNumberFormats(), True)
+        kind = NumberFormat.DATETIME if with_time else NumberFormat.DATE
+        return format_types.getStandardFormat(kind, Locale())
+
+    @staticmethod
+    def is_date_format(doc: XSpreadsheetDocument, key: int) -> bool:
+        """
+        Gets if a number format key of a spreadsheet document is a date or date time format.
+
+        |lo_safe|
+
+        Args:
+            doc (XSpreadsheetDocument): Spreadsheet Document.
+            key (int): Number format key such as the ``NumberFormat`` property of a cell.
+
+        Returns:
+            bool: ``True`` if format is a date format; Otherwise, ``False``.
+
+        .. versionadded:: 0.54.0
+        """
+        n_supplier = mLo.Lo.qi(XNumberFormatsSupplier, doc, True)
+        try:
+            fmt_type = int(n_supplier.getNumberFormats().getByKey(key).getPropertyValue("Type"))
+        except Exception:
+            return False
+        return bool(fmt_type & NumberFormat.DATE)
+
     # region    add_annotation()
     @overload
     @classmethod
@@ -10921,6 +12152,190 @@ class Calc:
             mLo.Lo.print(f"    {e}")
         return None
 
+    @classmethod
+    def call_fun_many(
+        cls,
+        func_name: str,
+        arg_rows: Iterable[Sequence[Any]],
+        min_batch: int = 200,
+        chunk_rows: int = 50_000,
+    ) -> List[Any]:
+        """
+        Execute a Calc function by its (English) name once for each row of arguments.
+
+        When there are at least ``min_batch`` rows and every argument is a number or a string,
+        the function is evaluated by a formula on each row of a hidden scratch spreadsheet, with the arguments
+        written into the formula as values. Formulas and results are each transferred in a single call per block of
+        ``chunk_rows`` rows, rather than one call for each row.
+        Otherwise, the function is called once for each row as with :py:meth:`~.Calc.call_fun`.
+
+        |lo_unsafe|
+
+        Args:
+            func_name (str): the English name of the function to execute
+            arg_rows (Iterable[Sequence[Any]]): Arguments of each call of the function.
+            min_batch (int, optional): Minimum number of rows evaluated on the scratch spreadsheet.
+                Smaller batches are evaluated one call at a time. Defaults to ``200``.
+            chunk_rows (int, optional): Maximum number of rows evaluated on the scratch spreadsheet at once.
+                Defaults to ``50_000``.
+
+        Returns:
+            List[Any]: Result of each row in the order of ``arg_rows``. ``None`` for rows where the function failed.
+
+        Note:
+            The scratch spreadsheet evaluates each row in a single cell so functions that return an array
+            only return their first value; use ``min_batch=0`` to turn off the scratch spreadsheet for such functions.
+
+            The scratch spreadsheet is a hidden document of the current office instance that is reused by later calls.
+            It can be closed with :py:meth:`~.Calc.close_scratch_doc`.
+            Calls from several threads to the same office instance use the scratch spreadsheet one at a time.
+
+            The number of rows where evaluating on the scratch spreadsheet is faster than one call per row
+            depends on the connection to the office.
+            ``tests/test_calc/test_calc_ns/test_calc_call_fun_many.py`` prints timings of both methods.
+
+        Example:
+            .. code-block:: python
+
+                >>> Calc.call_fun_many("ROUND", [(1.234, 1), (5.678, 2)], min_batch=0)
+                [1.2, 5.68]
+
+        .. versionadded:: 0.54.0
+        """
+        rows = [tuple(row) for row in arg_rows]
+        if not rows:
+            return []
+        name = func_name.upper()
+        literal_rows = cls._get_literal_args(rows) if min_batch > 0 and len(rows) >= min_batch else None
+        if literal_rows is not None:
+            try:
+                return cls._call_fun_sheet(name, literal_rows, max(1, chunk_rows))
+            except Exception as e:
+                mLo.Lo.print(f"Could not evaluate function '{name}' on scratch sheet, calling it for each row")
+                mLo.Lo.print(f"    {e}")
+
+        try:
+            fa = mLo.Lo.create_instance_mcf(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
+        except Exception as e:
+            mLo.Lo.print(f"Could not invoke function '{name}'")
+            mLo.Lo.print(f"    {e}")
+            return [None] * len(rows)
+        results: List[Any] = []
+        errors = 0
+        for row in rows:
+            try:
+                results.append(fa.callFunction(name, row))
+            except Exception:
+                errors += 1
+                results.append(None)
+        if errors:
+            mLo.Lo.print(f"Could not invoke function '{name}' for {errors} of {len(rows)} rows")
+        return results
+
+    @classmethod
+    def _get_literal_args(cls, rows: List[Tuple[Any, ...]]) -> List[str] | None:
+        # arguments as formula values, cell references would change the result of functions such as SUM() or ROW().
+        result: List[str] = []
+        for row in rows:
+            args: List[str] = []
+            for val in row:
+                val_type = type(val)
+                if val_type is str:
+                    if len(val) > cls._SCRATCH_STR_MAX:
+                        return None
+                    args.append('"' + val.replace('"', '""') + '"')
+                elif val_type is bool:
+                    args.append("1" if val else "0")
+                elif val_type is int:
+                    args.append(str(val))
+                elif val_type is float and math.isfinite(val):
+                    args.append(repr(val))
+                else:
+                    return None
+            result.append(";".join(args))
+        return result
+
+    @classmethod
+    def _call_fun_sheet(cls, name: str, rows: List[str], chunk_rows: int) -> List[Any]:
+        entry = cls._get_scratch_entry()
+        with entry[0]:
+            sheet = cls._get_scratch_sheet(entry)
+            results: List[Any] = []
+            for offset in range(0, len(rows), chunk_rows):
+                chunk = rows[offset : offset + chunk_rows]
+                result_range = sheet.getCellRangeByPosition(0, 0, 0, len(chunk) - 1)
+                try:
+                    formulas = tuple((f"={name}({args})",) for args in chunk)
+                    mLo.Lo.qi(XCellRangeFormula, result_range, True).setFormulaArray(formulas)
+                    values = [row[0] for row in mLo.Lo.qi(XCellRangeData, result_range, True).getDataArray()]
+                    # 4 is com.sun.star.sheet.FormulaResult.ERROR
+                    errors = mLo.Lo.qi(XCellRangesQuery, result_range, True).queryFormulaCells(4)
+                    for addr in errors.getRangeAddresses():
+                        for row in range(addr.StartRow, addr.EndRow + 1):
+                            values[row] = None
+                    results.extend(values)
+                finally:
+                    mLo.Lo.qi(XSheetOperation, result_range, True).clearContents(
+                        (CellFlagsEnum.VALUE | CellFlagsEnum.STRING | CellFlagsEnum.FORMULA).value
+                    )
+            return results
+
+    @classmethod
+    def _get_scratch_entry(cls) -> List[Any]:
+        lo_inst = mLo.Lo.current_lo
+        with cls._scratch_docs_lock:
+            entry = cls._scratch_docs.get(lo_inst)
+            if entry is None:
+                entry = [threading.Lock(), None]
+                cls._scratch_docs[lo_inst] = entry
+            return entry
+
+    @classmethod
+    def _get_scratch_sheet(cls, entry: List[Any]) -> XSpreadsheet:
+        # called with the lock of entry held.
+        if entry[1] is not None:
+            try:
+                return cls._get_first_sheet(entry[1])
+            except Exception:
+                # document was closed or office was restarted.
+                entry[1] = None
+        # loaded directly rather than with Lo.create_doc() so the current document is not changed.
+        component = mLo.Lo.loader_current.loadComponentFromURL(
+            "private:factory/scalc", "_blank", 0, mProps.Props.make_props(Hidden=True)
+        )
+        doc = mLo.Lo.qi(XSpreadsheetDocument, component, True)
+        entry[1] = doc
+        return cls._get_first_sheet(doc)
+
+    @staticmethod
+    def _get_first_sheet(doc: XSpreadsheetDocument) -> XSpreadsheet:
+        sheets = mLo.Lo.qi(XIndexAccess, doc.getSheets(), True)
+        return mLo.Lo.qi(XSpreadsheet, sheets.getByIndex(0), True)
+
+    @classmethod
+    def close_scratch_doc(cls) -> None:
+        """
+        Closes the hidden scratch document of the current office instance used by :py:meth:`~.Calc.call_fun_many`,
+        if it is open.
+
+        |lo_unsafe|
+
+        Returns:
+            None:
+
+        .. versionadded:: 0.54.0
+        """
+        with cls._scratch_docs_lock:
+            entry = cls._scratch_docs.get(mLo.Lo.current_lo)
+        if entry is None:
+            return
+        with entry[0]:
+            doc = entry[1]
+            entry[1] = None
+        if doc is not None:
+            with contextlib.suppress(Exception):
+                mLo.Lo.qi(XCloseable, doc, True).close(True)
+
     @staticmethod
     def get_function_names() -> List[str] | None:
         """
@@ -3,6 +3,8 @@ from abc import abstractmethod
 from typing import TypeVar
 from dataclasses import dataclass
 
+from ooodev.utils.decorator.dataclass_slots import dataclass_slots
+
 
 # Note that from __future__ import annotations converts annotations to string.
 # this means that @enforce.enforce_types will see string as type. This is fine in
@@ -11,6 +13,7 @@ from dataclasses import dataclass
 _BaseIntValue = TypeVar("_BaseIntValue", bound="BaseIntValue")
 
 
+@dataclass_slots()
 @dataclass(unsafe_hash=True)
 class BaseIntValue:
     """Base class for Int Value"""
@@ -7,6 +7,7 @@ from ooo.dyn.table.cell_address import CellAddress
 
 from ooodev.loader import lo as mLo
 from ooodev.utils import table_helper as mTb
+from ooodev.utils.decorator.dataclass_slots import dataclass_slots
 from ooodev.utils.validation import check
 from ooodev.loader.inst.doc_type import DocType
 
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from ooodev.calc.calc_doc import CalcDoc
 
 
+@dataclass_slots("_sheet_name", "_col_info", "_row_info", "_cell_right", "_cell_left", "_cell_down", "_cell_up")
 @dataclass(frozen=True)
 class CellObj:
     """
@@ -25,6 +27,9 @@ class CellObj:
     .. versionchanged:: 0.32.0
         If index is set to ``-2`` then no attempt is made to get index from spreadsheet.
 
+    .. versionchanged:: 0.54.0
+        Instances use ``__slots__`` and share column name strings.
+
     .. versionadded:: 0.8.2
     """
 
@@ -44,12 +49,15 @@ class CellObj:
     """Range Object that instance is part of"""
 
     def __post_init__(self):
-        object.__setattr__(self, "col", self.col.upper())
+        col = self.col.upper()
         try:
             # convert col to index for the purpose of validation
-            _ = mTb.TableHelper.col_name_to_int(name=self.col)
+            col_num = mTb.TableHelper.col_name_to_int(name=col)
         except ValueError as e:
             raise AssertionError from e
+        # use the shared name string of the column when the name is a plain column name.
+        name = mTb.TableHelper.make_column_name(col_num)
+        object.__setattr__(self, "col", name if name == col else col)
         check(self.row >= 1, f"{self}", f"Expected a row of 1 or greater. Got: {self.row}")
         if self.sheet_idx == -1:
             # do not use the commented out code below!!! It will cause recursion error.
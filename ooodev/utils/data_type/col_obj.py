@@ -1,16 +1,21 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 from dataclasses import dataclass, field
 from weakref import ref
 import numbers
 
 from ooodev.utils import table_helper as mTb
+from ooodev.utils.decorator.dataclass_slots import dataclass_slots
 from ooodev.utils.validation import check
 
 if TYPE_CHECKING:
     from ooodev.utils.data_type import cell_obj as mCell
 
+_MAX_INTERNED = 16384
+"""Columns of a sheet that have a shared instance"""
 
+
+@dataclass_slots("_next", "_prev")
 @dataclass(frozen=True)
 class ColObj:
     """
@@ -19,6 +24,9 @@ class ColObj:
     .. seealso::
         - :ref:`help_ooodev.utils.data_type.cell_obj.CellObj`
 
+    .. versionchanged:: 0.54.0
+        Instances use ``__slots__``. ``from_int()`` and ``from_str()`` return shared instances for the columns of a sheet.
+
     .. versionadded:: 0.8.2
     """
 
@@ -32,11 +40,14 @@ class ColObj:
     """Cell Object that instance is part of"""
 
     def __post_init__(self):
-        object.__setattr__(self, "value", self.value.upper())
+        value = self.value.upper()
         try:
-            idx = mTb.TableHelper.col_name_to_int(name=self.value, zero_index=True)
+            idx = mTb.TableHelper.col_name_to_int(name=value, zero_index=True)
         except ValueError as e:
             raise AssertionError from e
+        # use the shared name string of the column when the value is a plain column name.
+        name = mTb.TableHelper.make_column_name(idx, True) if idx >= 0 else value
+        object.__setattr__(self, "value", name if name == value else value)
         check(idx >= 0, f"{self}", f"Expected a value index of 0 or greater. Got: {idx}")
         object.__setattr__(self, "index", idx)
 
@@ -60,7 +71,7 @@ class ColObj:
         """
         try:
             num = mTb.TableHelper.col_name_to_int(name=name)
-            return ColObj(mTb.TableHelper.make_column_name(num))
+            return ColObj.from_int(num)
         except AssertionError:
             raise
         except Exception as e:
@@ -81,17 +92,23 @@ class ColObj:
         Returns:
             ColObj: Cell Object
         """
+        col = _INTERNED.get(num + 1 if zero_index else num, None)
+        if col is not None:
+            return col
         if zero_index:
             check(num >= 0, f"{ColObj}", f"Expected a value of 0 or greater. Got: {num}")
         else:
             check(num >= 1, f"{ColObj}", f"Expected a value of 1 or greater. Got: {num}")
         try:
             col_name = mTb.TableHelper.make_column_name(num, zero_index)
-            return ColObj(col_name)
+            col = ColObj(col_name)
         except AssertionError:
             raise
         except Exception as e:
             raise AssertionError from e
+        if col.index < _MAX_INTERNED:
+            _INTERNED[col.index + 1] = col
+        return col
 
     # endregion static methods
 
@@ -326,3 +343,7 @@ class ColObj:
             return self._prev()  # type: ignore
 
     # endregion properties
+
+
+_INTERNED: Dict[int, ColObj] = {}
+"""Shared instances keyed by one based column number"""
@@ -12,6 +12,7 @@ from ooodev.events.gbl_named_event import GblNamedEvent
 from ooodev.exceptions import ex as mEx
 from ooodev.utils import table_helper as mTb
 from ooodev.utils.decorator import enforce
+from ooodev.utils.decorator.dataclass_slots import dataclass_slots
 from ooodev.loader.inst.doc_type import DocType
 
 
@@ -26,6 +27,7 @@ if TYPE_CHECKING:
 
 
 @enforce.enforce_types
+@dataclass_slots("_sheet_name", "_cell_start", "_cell_end", "_start_col_index", "_end_col_index")
 @dataclass(frozen=True)
 class RangeObj:
     """
@@ -37,6 +39,9 @@ class RangeObj:
     .. versionchanged:: 0.32.0
         Added support for ``__contains__`` and ``__iter__`` methods. If sheet_idx is set to -2 then no attempt is made to get the sheet index or name from spreadsheet.
 
+    .. versionchanged:: 0.54.0
+        Instances use ``__slots__`` and share column name strings.
+
     .. versionadded:: 0.8.2
     """
 
@@ -69,11 +74,15 @@ class RangeObj:
             object.__setattr__(self, "row_start", row_start)
             object.__setattr__(self, "row_end", row_end)
 
-        object.__setattr__(self, "col_start", self.col_start.upper())
-        object.__setattr__(self, "col_end", self.col_end.upper())
-
-        col_start_num = mTb.TableHelper.col_name_to_int(self.col_start)
-        col_end_num = mTb.TableHelper.col_name_to_int(self.col_end)
+        col_start = self.col_start.upper()
+        col_end = self.col_end.upper()
+        col_start_num = mTb.TableHelper.col_name_to_int(col_start)
+        col_end_num = mTb.TableHelper.col_name_to_int(col_end)
+        # use the shared name strings of the columns when the names are plain column names.
+        name = mTb.TableHelper.make_column_name(col_start_num)
+        object.__setattr__(self, "col_start", name if name == col_start else col_start)
+        name = mTb.TableHelper.make_column_name(col_end_num)
+        object.__setattr__(self, "col_end", name if name == col_end else col_end)
         if col_start_num > col_end_num:
             # swap columns
             col_start, col_end = self.col_end, self.col_start
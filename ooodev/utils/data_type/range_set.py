@@ -0,0 +1,517 @@
+from __future__ import annotations
+import itertools
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING, Union, cast
+
+from ooodev.loader import lo as mLo
+from ooodev.utils import table_helper as mTb
+from ooodev.utils.data_type import cell_obj as mCellObj
+from ooodev.utils.data_type import range_obj as mRngObj
+from ooodev.utils.data_type import range_values as mRngValues
+
+if TYPE_CHECKING:
+    from ooo.dyn.table.cell_range_address import CellRangeAddress
+    from ooodev.adapter.sheet.sheet_cell_ranges_comp import SheetCellRangesComp
+    from ooodev.calc.calc_doc import CalcDoc
+
+RangeLike = Union[mRngObj.RangeObj, mCellObj.CellObj, mRngValues.RangeValues, str]
+
+# Cells of a sheet are stored as row bands. Each band is (row_start, row_end, intervals) where the rows and the
+# column intervals are zero-based and half-open. Bands are sorted and do not overlap, intervals of a band are sorted,
+# do not overlap and do not touch, and touching bands always have different intervals.
+# This makes the representation of a set of cells unique, so sets can be compared directly.
+_Intervals = Tuple[Tuple[int, int], ...]
+_Band = Tuple[int, int, _Intervals]
+_Bands = Tuple[_Band, ...]
+_Rect = Tuple[int, int, int, int]
+_Keep = Callable[[bool, bool], bool]
+
+
+def _union(a: bool, b: bool) -> bool:
+    return a or b
+
+
+def _intersection(a: bool, b: bool) -> bool:
+    return a and b
+
+
+def _difference(a: bool, b: bool) -> bool:
+    return a and not b
+
+
+def _symmetric_difference(a: bool, b: bool) -> bool:
+    return a != b
+
+
+def _combine_intervals(a: _Intervals, b: _Intervals, keep: _Keep) -> _Intervals:
+    points = sorted(set(itertools.chain.from_iterable(a)).union(itertools.chain.from_iterable(b)))
+    result: List[Tuple[int, int]] = []
+    ia = ib = 0
+    len_a = len(a)
+    len_b = len(b)
+    for start, end in zip(points, points[1:]):
+        while ia < len_a and a[ia][1] <= start:
+            ia += 1
+        while ib < len_b and b[ib][1] <= start:
+            ib += 1
+        if keep(ia < len_a and a[ia][0] <= start, ib < len_b and b[ib][0] <= start):
+            if result and result[-1][1] == start:
+                result[-1] = (result[-1][0], end)
+            else:
+                result.append((start, end))
+    return tuple(result)
+
+
+def _combine_bands(a: _Bands, b: _Bands, keep: _Keep) -> _Bands:
+    # same sweep as _combine_intervals over the row boundaries of both sets.
+    points = sorted({p for band in a for p in band[:2]}.union(p for band in b for p in band[:2]))
+    result: List[_Band] = []
+    ia = ib = 0
+    len_a = len(a)
+    len_b = len(b)
+    last_key: Tuple[_Intervals, _Intervals] | None = None
+    intervals: _Intervals = ()
+    for start, end in zip(points, points[1:]):
+        while ia < len_a and a[ia][1] <= start:
+            ia += 1
+        while ib < len_b and b[ib][1] <= start:
+            ib += 1
+        ivs_a = a[ia][2] if ia < len_a and a[ia][0] <= start else ()
+        ivs_b = b[ib][2] if ib < len_b and b[ib][0] <= start else ()
+        key = (ivs_a, ivs_b)
+        if key != last_key:
+            # consecutive rows mostly see the same pair of intervals.
+            last_key = key
+            intervals = _combine_intervals(ivs_a, ivs_b, keep)
+        if not intervals:
+            continue
+        if result and result[-1][1] == start and result[-1][2] == intervals:
+            result[-1] = (result[-1][0], end, intervals)
+        else:
+            result.append((start, end, intervals))
+    return tuple(result)
+
+
+def _build_bands(rects: List[_Rect]) -> _Bands:
+    # rectangles are (col_start, row_start, col_end, row_end) half-open, merged by pairs to keep each union small.
+    items: List[_Bands] = [((r0, r1, ((c0, c1),)),) for c0, r0, c1, r1 in rects]
+    if not items:
+        return ()
+    while len(items) > 1:
+        merged = [_combine_bands(items[i], items[i + 1], _union) for i in range(0, len(items) - 1, 2)]
+        if len(items) % 2:
+            merged.append(items[-1])
+        items = merged
+    return items[0]
+
+
+def _cover_bands(bands: _Bands) -> List[_Rect]:
+    # joins intervals that span the same columns in consecutive bands into one rectangle.
+    result: List[_Rect] = []
+    open_rects: Dict[Tuple[int, int], List[int]] = {}
+    for row_start, row_end, intervals in bands:
+        next_open: Dict[Tuple[int, int], List[int]] = {}
+        for iv in intervals:
+            rect = open_rects.pop(iv, None)
+            if rect is not None and rect[1] == row_start:
+                rect[1] = row_end
+            else:
+                if rect is not None:
+                    result.append((iv[0], rect[0], iv[1], rect[1]))
+                rect = [row_start, row_end]
+            next_open[iv] = rect
+        for iv, rect in open_rects.items():
+            result.append((iv[0], rect[0], iv[1], rect[1]))
+        open_rects = next_open
+    for iv, rect in open_rects.items():
+        result.append((iv[0], rect[0], iv[1], rect[1]))
+    return result
+
+
+def _cover(bands: _Bands) -> List[_Rect]:
+    by_rows = _cover_bands(bands)
+    if len(by_rows) > 1:
+        # covering by columns is better for shapes such as tall columns joined by a single row.
+        transposed = _build_bands([(r0, c0, r1, c1) for c0, r0, c1, r1 in by_rows])
+        by_cols = [(c0, r0, c1, r1) for r0, c0, r1, c1 in _cover_bands(transposed)]
+        if len(by_cols) < len(by_rows):
+            by_rows = by_cols
+    by_rows.sort(key=lambda rect: (rect[1], rect[0]))
+    return by_rows
+
+
+def _to_rect(value: RangeLike) -> Tuple[int, _Rect]:
+    if isinstance(value, str):
+        value = mRngObj.RangeObj.from_range(value) if ":" in value else mCellObj.CellObj.from_cell(value)
+    if isinstance(value, mRngObj.RangeObj):
+        return (
+            value.sheet_idx,
+            (value.start_col_index, value.start_row_index, value.end_col_index + 1, value.end_row_index + 1),
+        )
+    if isinstance(value, mCellObj.CellObj):
+        col = value.col_obj.index
+        return (value.sheet_idx, (col, value.row - 1, col + 1, value.row))
+    if isinstance(value, mRngValues.RangeValues):
+        return (value.sheet_idx, (value.col_start, value.row_start, value.col_end + 1, value.row_end + 1))
+    raise TypeError(f"Unsupported range type: {type(value).__name__}")
+
+
+class RangeSet:
+    """
+    Immutable set of cells made of any number of ranges.
+
+    Union, intersection and difference of range sets are computed with a sweep over sorted row bands and column
+    intervals, so combining thousands of ranges does not compare every range with every other range.
+    Overlapping and touching ranges are merged, so two range sets that contain the same cells are equal.
+
+    Ranges on different sheets, as given by ``sheet_idx``, are kept apart.
+
+    This class does not access a spreadsheet, except for :py:meth:`~.RangeSet.get_sheet_cell_ranges`.
+
+    Example:
+        .. code-block:: python
+
+            >>> rs = RangeSet(["A1:C3", "B2:D4"])
+            >>> [str(rng) for rng in rs.coalesce()]
+            ['A1:C1', 'A2:D3', 'B4:D4']
+            >>> rs.cell_count
+            14
+            >>> (rs - RangeSet(["B2:C3"])).cell_count
+            10
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self, ranges: Iterable[RangeLike] = ()) -> None:
+        """
+        Constructor
+
+        Args:
+            ranges (Iterable[RangeObj | CellObj | RangeValues | str], optional): Ranges or cells of the set.
+                Strings are range names such as ``A1:C4`` or cell names such as ``B2``.
+
+        Raises:
+            TypeError: If a range is not one of the supported types.
+        """
+        rects: Dict[int, List[_Rect]] = {}
+        for value in ranges:
+            sheet_idx, rect = _to_rect(value)
+            rects.setdefault(sheet_idx, []).append(rect)
+        self._sheets: Dict[int, _Bands] = {idx: _build_bands(items) for idx, items in rects.items()}
+        self._row_starts: Dict[int, List[int]] = {}
+
+    # region Class Methods
+    @classmethod
+    def from_indexes(cls, rects: Iterable[Tuple[int, int, int, int]], sheet_idx: int = -2) -> RangeSet:
+        """
+        Creates a range set from zero-based rectangles.
+
+        This is the fastest way to build a range set as no ``RangeObj`` instances are created.
+
+        Args:
+            rects (Iterable[Tuple[int, int, int, int]]): Rectangles as zero-based ``(col_start, row_start, col_end, row_end)``,
+                such as the result of :py:meth:`CellWriteBuffer.merge_cells() <ooodev.calc.sheet.cell_write_buffer.CellWriteBuffer.merge_cells>`.
+            sheet_idx (int, optional): Sheet index of the rectangles. Defaults to ``-2``.
+
+        Raises:
+            ValueError: If an index is negative.
+
+        Returns:
+            RangeSet: Range set.
+        """
+        items: List[_Rect] = []
+        for col_start, row_start, col_end, row_end in rects:
+            if col_start > col_end:
+                col_start, col_end = col_end, col_start
+            if row_start > row_end:
+                row_start, row_end = row_end, row_start
+            if col_start < 0 or row_start < 0:
+                raise ValueError(f"Indexes must not be negative, got {(col_start, row_start, col_end, row_end)}")
+            items.append((col_start, row_start, col_end + 1, row_end + 1))
+        return cls._from_sheets({sheet_idx: _build_bands(items)} if items else {})
+
+    @classmethod
+    def _from_sheets(cls, sheets: Dict[int, _Bands]) -> RangeSet:
+        inst = cls.__new__(cls)
+        inst._sheets = {idx: bands for idx, bands in sheets.items() if bands}
+        inst._row_starts = {}
+        return inst
+
+    # endregion Class Methods
+
+    # region Set Operations
+    def _combine(self, others: Iterable[RangeSet | Iterable[RangeLike]], keep: _Keep) -> RangeSet:
+        sheets = dict(self._sheets)
+        for other in others:
+            other_sheets = RangeSet._get_range_set(other)._sheets
+            for idx in set(sheets).union(other_sheets):
+                sheets[idx] = _combine_bands(sheets.get(idx, ()), other_sheets.get(idx, ()), keep)
+        return RangeSet._from_sheets(sheets)
+
+    @staticmethod
+    def _get_range_set(value: RangeSet | Iterable[RangeLike]) -> RangeSet:
+        return value if isinstance(value, RangeSet) else RangeSet(value)
+
+    def union(self, *others: RangeSet | Iterable[RangeLike]) -> RangeSet:
+        """
+        Gets the cells that are in this set or in any of the other sets.
+
+        Args:
+            others (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other sets or ranges.
+
+        Returns:
+            RangeSet: New range set.
+        """
+        return self._combine(others, _union)
+
+    def intersection(self, *others: RangeSet | Iterable[RangeLike]) -> RangeSet:
+        """
+        Gets the cells that are in this set and in all of the other sets.
+
+        Args:
+            others (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other sets or ranges.
+
+        Returns:
+            RangeSet: New range set.
+        """
+        return self._combine(others, _intersection)
+
+    def difference(self, *others: RangeSet | Iterable[RangeLike]) -> RangeSet:
+        """
+        Gets the cells that are in this set and not in any of the other sets.
+
+        Args:
+            others (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other sets or ranges.
+
+        Returns:
+            RangeSet: New range set.
+        """
+        return self._combine(others, _difference)
+
+    def symmetric_difference(self, other: RangeSet | Iterable[RangeLike]) -> RangeSet:
+        """
+        Gets the cells that are in either this set or the other set but not in both.
+
+        Args:
+            other (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other set or ranges.
+
+        Returns:
+            RangeSet: New range set.
+        """
+        return self._combine((other,), _symmetric_difference)
+
+    def isdisjoint(self, other: RangeSet | Iterable[RangeLike]) -> bool:
+        """
+        Gets if this set has no cells in common with another set.
+
+        Args:
+            other (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other set or ranges.
+
+        Returns:
+            bool: ``True`` if the sets do not overlap; Otherwise, ``False``.
+        """
+        return not self.intersection(other)
+
+    def issubset(self, other: RangeSet | Iterable[RangeLike]) -> bool:
+        """
+        Gets if every cell of this set is in another set.
+
+        Args:
+            other (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other set or ranges.
+
+        Returns:
+            bool: ``True`` if this set is a subset of ``other``; Otherwise, ``False``.
+        """
+        return not self.difference(other)
+
+    def issuperset(self, other: RangeSet | Iterable[RangeLike]) -> bool:
+        """
+        Gets if every cell of another set is in this set.
+
+        Args:
+            other (RangeSet | Iterable[RangeObj | CellObj | RangeValues | str]): Other set or ranges.
+
+        Returns:
+            bool: ``True`` if this set is a superset of ``other``; Otherwise, ``False``.
+        """
+        return not RangeSet._get_range_set(other).difference(self)
+
+    # endregion Set Operations
+
+    # region Conversion
+    def get_indexes(self) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Gets the rectangles of :py:meth:`~.RangeSet.coalesce` as indexes.
+
+        Returns:
+            List[Tuple[int, int, int, int, int]]: Rectangles as zero-based ``(sheet_idx, col_start, row_start, col_end, row_end)``
+            ordered by sheet index, then by row and column.
+        """
+        result: List[Tuple[int, int, int, int, int]] = []
+        for idx in sorted(self._sheets):
+            for c0, r0, c1, r1 in _cover(self._sheets[idx]):
+                result.append((idx, c0, r0, c1 - 1, r1 - 1))
+        return result
+
+    def coalesce(self) -> List[mRngObj.RangeObj]:
+        """
+        Gets a small number of ranges that cover exactly the cells of the set.
+
+        Cells are joined into rectangles both row wise and column wise and the cover with fewer ranges is returned.
+        For most shapes this is the minimal number of ranges.
+
+        Returns:
+            List[RangeObj]: Non-overlapping ranges ordered by sheet index, then by row and column.
+        """
+        make_name = mTb.TableHelper.make_column_name
+        return [
+            mRngObj.RangeObj(
+                col_start=make_name(c0 + 1),
+                col_end=make_name(c1 + 1),
+                row_start=r0 + 1,
+                row_end=r1 + 1,
+                sheet_idx=idx,
+            )
+            for idx, c0, r0, c1, r1 in self.get_indexes()
+        ]
+
+    def get_cell_range_addresses(self) -> List[CellRangeAddress]:
+        """
+        Gets the ranges of :py:meth:`~.RangeSet.coalesce` as cell range addresses.
+
+        Returns:
+            List[CellRangeAddress]: Cell range addresses.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ooo.dyn.table.cell_range_address import CellRangeAddress
+
+        return [
+            CellRangeAddress(Sheet=idx, StartColumn=c0, StartRow=r0, EndColumn=c1, EndRow=r1)
+            for idx, c0, r0, c1, r1 in self.get_indexes()
+        ]
+
+    def get_sheet_cell_ranges(self, doc: CalcDoc | None = None) -> SheetCellRangesComp:
+        """
+        Gets the ranges of :py:meth:`~.RangeSet.coalesce` as a ``SheetCellRanges`` container.
+
+        Properties set on the container, such as cell styles or colors, are applied to all of its ranges
+        with a single call to the office.
+
+        Args:
+            doc (CalcDoc, optional): Document that contains the sheets. Defaults to the current document.
+
+        Raises:
+            ValueError: If a range does not have a sheet index.
+
+        Returns:
+            SheetCellRangesComp: Sheet cell ranges.
+        """
+        # pylint: disable=import-outside-toplevel
+        from com.sun.star.sheet import XSheetCellRangeContainer
+        from ooodev.adapter.sheet.sheet_cell_ranges_comp import SheetCellRangesComp
+
+        if any(idx < 0 for idx in self._sheets):
+            raise ValueError("All ranges must have a sheet index to create sheet cell ranges.")
+        if doc is None:
+            doc = cast("CalcDoc", mLo.Lo.current_doc)
+        container = doc.lo_inst.create_instance_msf(
+            XSheetCellRangeContainer, "com.sun.star.sheet.SheetCellRanges", doc.component, raise_err=True
+        )
+        container.addRangeAddresses(tuple(self.get_cell_range_addresses()), False)
+        return SheetCellRangesComp(container)  # type: ignore
+
+    # endregion Conversion
+
+    # region dunder
+    def _contains_cell(self, sheet_idx: int, col: int, row: int) -> bool:
+        bands = self._sheets.get(sheet_idx)
+        if not bands:
+            return False
+        starts = self._row_starts.get(sheet_idx)
+        if starts is None:
+            starts = [band[0] for band in bands]
+            self._row_starts[sheet_idx] = starts
+        i = bisect_right(starts, row) - 1
+        if i < 0 or bands[i][1] <= row:
+            return False
+        intervals = bands[i][2]
+        j = bisect_right(intervals, (col, float("inf"))) - 1
+        return j >= 0 and intervals[j][1] > col
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Gets if a cell or all cells of a range are in the set.
+
+        Args:
+            value (RangeObj | CellObj | RangeValues | str): Cell or range.
+
+        Returns:
+            bool: ``True`` if contained; Otherwise, ``False``.
+        """
+        try:
+            sheet_idx, (c0, r0, c1, r1) = _to_rect(value)
+        except Exception:
+            return False
+        if c1 - c0 == 1 and r1 - r0 == 1:
+            return self._contains_cell(sheet_idx, c0, r0)
+        other = RangeSet._from_sheets({sheet_idx: ((r0, r1, ((c0, c1),)),)})
+        return other.issubset(self)
+
+    def __iter__(self) -> Iterator[mRngObj.RangeObj]:
+        """Iterates the ranges of :py:meth:`~.RangeSet.coalesce`."""
+        return iter(self.coalesce())
+
+    def __bool__(self) -> bool:
+        return bool(self._sheets)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RangeSet):
+            return self._sheets == other._sheets
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(sorted(self._sheets.items())))
+
+    def __or__(self, other: object) -> RangeSet:
+        return self.union(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __and__(self, other: object) -> RangeSet:
+        return self.intersection(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __sub__(self, other: object) -> RangeSet:
+        return self.difference(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __xor__(self, other: object) -> RangeSet:
+        return self.symmetric_difference(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        return self.issubset(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        return self.issuperset(other) if isinstance(other, RangeSet) else NotImplemented
+
+    def __repr__(self) -> str:
+        make_name = mTb.TableHelper.make_column_name
+        names = [
+            f"{make_name(c0 + 1)}{r0 + 1}:{make_name(c1 + 1)}{r1 + 1}" for _, c0, r0, c1, r1 in self.get_indexes()
+        ]
+        return f"RangeSet({names})"
+
+    # endregion dunder
+
+    # region Properties
+    @property
+    def cell_count(self) -> int:
+        """Gets the number of cells in the set."""
+        return sum(
+            (row_end - row_start) * sum(end - start for start, end in intervals)
+            for bands in self._sheets.values()
+            for row_start, row_end, intervals in bands
+        )
+
+    @property
+    def sheet_indexes(self) -> Tuple[int, ...]:
+        """Gets the sorted sheet indexes of the ranges of the set."""
+        return tuple(sorted(self._sheets))
+
+    # endregion Properties
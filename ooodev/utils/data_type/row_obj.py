@@ -10,6 +10,7 @@ try:
 except ImportError:
     from typing_extensions import override  # noqa # type: ignore
 
+from ooodev.utils.decorator.dataclass_slots import dataclass_slots
 from ooodev.utils.validation import check
 from ooodev.utils.data_type.base_int_value import BaseIntValue
 
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from ooodev.utils.data_type import cell_obj as mCell
 
 
+@dataclass_slots("_next", "_prev")
 @dataclass(unsafe_hash=True)
 class RowObj(BaseIntValue):
     """
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import itertools
+from dataclasses import fields, FrozenInstanceError
+from typing import Any, Callable, Iterator, Type, TypeVar
+
+_T = TypeVar("_T")
+
+
+def _get_slots(cls: type) -> Iterator[str]:
+    slots = cls.__dict__.get("__slots__", ())
+    if isinstance(slots, str):
+        yield slots
+    else:
+        yield from slots
+
+
+def dataclass_slots(*extra: str) -> Callable[[Type[_T]], Type[_T]]:
+    """
+    Class decorator that adds ``__slots__`` to a dataclass.
+
+    Same as ``@dataclass(slots=True, weakref_slot=True)`` of Python ``3.11`` for earlier versions of Python.
+    Must be applied after (above) the ``@dataclass`` decorator.
+
+    Args:
+        extra (str): Names of attributes that are not fields, such as cached values. They are not pickled or copied.
+
+    Returns:
+        Callable[[Type[_T]], Type[_T]]: Decorator.
+
+    Example:
+        .. code-block:: python
+
+            @dataclass_slots("_cache")
+            @dataclass(frozen=True)
+            class Point:
+                x: int
+                y: int = 0
+
+    .. versionadded:: 0.54.0
+    """
+
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        cls_dict = dict(cls.__dict__)
+        field_names = tuple(f.name for f in fields(cls))  # type: ignore
+        inherited = set(itertools.chain.from_iterable(_get_slots(c) for c in cls.__mro__[1:-1]))
+        names = itertools.chain(field_names, extra, ("__weakref__",))
+        cls_dict["__slots__"] = tuple(dict.fromkeys(name for name in names if name not in inherited))
+        for name in field_names:
+            # class attributes hold field defaults, __init__ already has them.
+            cls_dict.pop(name, None)
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+        new_cls: Any = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new_cls.__qualname__ = cls.__qualname__
+
+        if cls.__dataclass_params__.frozen:  # type: ignore
+            # methods generated by @dataclass refer to the original class and must be replaced.
+            def __setattr__(self, name: str, value: Any) -> None:
+                if type(self) is new_cls or name in field_names:
+                    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+                super(new_cls, self).__setattr__(name, value)
+
+            def __delattr__(self, name: str) -> None:
+                if type(self) is new_cls or name in field_names:
+                    raise FrozenInstanceError(f"cannot delete field {name!r}")
+                super(new_cls, self).__delattr__(name)
+
+            new_cls.__setattr__ = __setattr__
+            new_cls.__delattr__ = __delattr__
+
+        # only fields are pickled, extra slots hold cached values that may not be picklable such as weak references.
+        def __getstate__(self) -> list:
+            return [getattr(self, name) for name in field_names]
+
+        def __setstate__(self, state: list) -> None:
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        new_cls.__getstate__ = __getstate__
+        new_cls.__setstate__ = __setstate__
+        return new_cls
+
+    return wrap
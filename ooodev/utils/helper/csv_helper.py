@@ -0,0 +1,341 @@
+"""
+Parsing of CSV and TSV files in blocks of rows.
+
+Files are read as raw bytes and split into blocks of whole records.
+Blocks are decoded, parsed and converted independently, optionally in a process pool,
+so only a bounded number of blocks is held in memory at any time.
+
+.. versionadded:: 0.54.0
+"""
+
+from __future__ import annotations
+import codecs
+import csv
+import io
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Container, Deque, FrozenSet, Iterator, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+from ooodev.utils.helper.dataframe_helper import NULL_DATE
+
+if TYPE_CHECKING:
+    from ooodev.utils.type_var import PathOrStr
+
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?")
+_SECONDS_PER_DAY = 86400.0
+
+
+class CsvOptions(NamedTuple):
+    """Options used to parse and convert a block of CSV records."""
+
+    delimiter: str = ","
+    """Field delimiter"""
+    quotechar: str = '"'
+    """Character used to quote fields"""
+    encoding: str = "utf-8"
+    """Encoding of the file. Must be ASCII compatible such as ``utf-8``, ``latin-1`` or ``cp1252``"""
+    decimal: str = "."
+    """Decimal separator of numbers"""
+    convert_numbers: bool = True
+    """If ``True`` numeric fields are converted to ``float``"""
+    convert_dates: bool = True
+    """If ``True`` ISO 8601 dates such as ``2024-01-31`` or ``2024-01-31 13:45:00`` are converted to serial dates"""
+    null_date: datetime = NULL_DATE
+    """Date of serial number ``0``"""
+
+
+class CsvBlock(NamedTuple):
+    """Block of parsed CSV records that is ready for ``setDataArray()``."""
+
+    index: int
+    """Zero based index of the block"""
+    row_offset: int
+    """Zero based offset of the first record of the block from the first imported record"""
+    values: Tuple[Tuple[Any, ...], ...]
+    """2-Dimensional table of values. Short records are padded with empty strings"""
+    date_columns: FrozenSet[int]
+    """Zero based indexes of columns of the block that contain at least one date"""
+    time_columns: FrozenSet[int]
+    """Zero based indexes of columns of the block that contain at least one date with a time part"""
+    byte_count: int
+    """Number of bytes of the file that the block was parsed from"""
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the block"""
+        return len(self.values)
+
+    @property
+    def col_count(self) -> int:
+        """Number of columns in the block"""
+        return len(self.values[0]) if self.values else 0
+
+
+def _parse_block(index: int, row_offset: int, data: bytes, byte_count: int, options: CsvOptions) -> CsvBlock:
+    # module level so it can be pickled and run in a worker process.
+    text = data.decode(options.encoding)
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=options.delimiter, quotechar=options.quotechar)
+    rows = list(reader)
+    width = max(map(len, rows), default=0)
+    null_date = options.null_date
+    alt_decimal = options.decimal if options.decimal != "." else ""
+    date_cols = set()
+    time_cols = set()
+    values = []
+    for row in rows:
+        out: List[Any] = []
+        for i, field in enumerate(row):
+            val = field.strip()
+            if not val:
+                out.append(field)
+                continue
+            if options.convert_numbers:
+                num = val
+                if alt_decimal:
+                    num = "" if "." in val else val.replace(alt_decimal, ".")
+                if _NUMBER_RE.fullmatch(num):
+                    out.append(float(num))
+                    continue
+            if options.convert_dates and _DATE_RE.fullmatch(val):
+                try:
+                    dt = datetime.fromisoformat(val)
+                except ValueError:
+                    out.append(field)
+                    continue
+                delta = dt - null_date
+                out.append(delta.days + (delta.seconds + delta.microseconds / 1_000_000) / _SECONDS_PER_DAY)
+                date_cols.add(i)
+                if delta.seconds or delta.microseconds:
+                    time_cols.add(i)
+                continue
+            out.append(field)
+        if len(out) < width:
+            out.extend([""] * (width - len(out)))
+        values.append(tuple(out))
+    return CsvBlock(
+        index=index,
+        row_offset=row_offset,
+        values=tuple(values) if width else (),
+        date_columns=frozenset(date_cols),
+        time_columns=frozenset(time_cols),
+        byte_count=byte_count,
+    )
+
+
+class CsvHelper:
+    """
+    Helper methods for reading CSV and TSV files in blocks of rows and for writing cell values as CSV.
+
+    This class does not access a spreadsheet and can be used without a running office.
+
+    See Also:
+        - :py:meth:`CalcSheet.import_csv() <ooodev.calc.CalcSheet.import_csv>`
+        - :py:meth:`CalcCellRange.export_csv() <ooodev.calc.CalcCellRange.export_csv>`
+
+    .. versionadded:: 0.54.0
+    """
+
+    @staticmethod
+    def get_delimiter(path: PathOrStr) -> str:
+        """
+        Gets the default delimiter for a file from its extension.
+
+        Args:
+            path (PathOrStr): File path.
+
+        Returns:
+            str: Tab for ``.tsv`` and ``.tab`` files; Otherwise, comma.
+        """
+        return "\t" if Path(path).suffix.lower() in (".tsv", ".tab") else ","
+
+    @staticmethod
+    def serial_to_datetime(serial: float, null_date: datetime | None = None) -> datetime:
+        """
+        Converts a Calc serial date into a ``datetime``.
+
+        Args:
+            serial (float): Serial date where the integer part is the day and the fraction is the time of day.
+            null_date (datetime, optional): Date of serial number ``0``. Defaults to ``1899-12-30``.
+
+        Returns:
+            datetime: Date rounded to the nearest second.
+        """
+        return (null_date or NULL_DATE) + timedelta(seconds=round(serial * _SECONDS_PER_DAY))
+
+    @classmethod
+    def format_row(
+        cls, row: Sequence[Any], date_columns: Container[int] = (), null_date: datetime | None = None
+    ) -> List[Any]:
+        """
+        Converts a row of cell values, such as a row of ``getDataArray()``, into CSV fields.
+
+        Whole numbers are written without a fraction, such as ``3`` rather than ``3.0``.
+        Numbers in ``date_columns`` are written as ISO 8601 dates such as ``2024-01-31`` or ``2024-01-31 13:45:00``.
+
+        Args:
+            row (Sequence[Any]): Row of values.
+            date_columns (Container[int], optional): Zero based indexes of columns that contain serial dates.
+            null_date (datetime, optional): Date of serial number ``0``. Defaults to ``1899-12-30``.
+
+        Returns:
+            List[Any]: Fields that can be passed to ``csv.writer.writerow()``.
+        """
+        fields: List[Any] = []
+        for i, val in enumerate(row):
+            if type(val) is float:
+                if i in date_columns:
+                    dt = cls.serial_to_datetime(val, null_date)
+                    if dt.hour or dt.minute or dt.second:
+                        fields.append(dt.isoformat(sep=" "))
+                    else:
+                        fields.append(dt.date().isoformat())
+                elif val.is_integer():
+                    fields.append(int(val))
+                else:
+                    fields.append(val)
+            else:
+                fields.append(val)
+        return fields
+
+    @staticmethod
+    def iter_raw_blocks(
+        path: PathOrStr, chunk_rows: int, quotechar: str = '"', skip_rows: int = 0
+    ) -> Iterator[Tuple[bytes, int, int]]:
+        """
+        Reads a file in blocks of whole records without decoding or parsing them.
+
+        A record ends at a line break that is not inside a quoted field, so quoted fields may contain line breaks.
+
+        Args:
+            path (PathOrStr): File path.
+            chunk_rows (int): Maximum number of records in a block.
+            quotechar (str, optional): Character used to quote fields. Defaults to ``"``.
+            skip_rows (int, optional): Number of records to skip at the start of the file. Defaults to ``0``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            Tuple[bytes, int, int]: Tuple of ``(data, record_count, byte_count)`` where ``byte_count``
+            includes any skipped records that preceded the block.
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be greater than 0, got {chunk_rows}")
+        quote = quotechar.encode("ascii")
+        lines: List[bytes] = []
+        records = 0
+        byte_count = 0
+        in_quotes = False
+        first = True
+        with open(path, "rb") as file:
+            for line in file:
+                byte_count += len(line)
+                if first:
+                    first = False
+                    if line.startswith(codecs.BOM_UTF8):
+                        line = line[len(codecs.BOM_UTF8) :]
+                # an escaped quote is doubled, so an odd count toggles quoting.
+                if line.count(quote) % 2:
+                    in_quotes = not in_quotes
+                if skip_rows > 0:
+                    if not in_quotes:
+                        skip_rows -= 1
+                    continue
+                lines.append(line)
+                if in_quotes:
+                    continue
+                records += 1
+                if records >= chunk_rows:
+                    yield (b"".join(lines), records, byte_count)
+                    lines = []
+                    records = 0
+                    byte_count = 0
+        if lines:
+            yield (b"".join(lines), records + (1 if in_quotes else 0), byte_count)
+
+    @staticmethod
+    def parse_block(data: bytes, options: CsvOptions | None = None, index: int = 0, row_offset: int = 0) -> CsvBlock:
+        """
+        Decodes, parses and converts a block of CSV records.
+
+        Args:
+            data (bytes): Raw block such as a block from :py:meth:`~.CsvHelper.iter_raw_blocks`.
+            options (CsvOptions, optional): Parse options.
+            index (int, optional): Index assigned to the block. Defaults to ``0``.
+            row_offset (int, optional): Row offset assigned to the block. Defaults to ``0``.
+
+        Returns:
+            CsvBlock: Parsed block.
+        """
+        return _parse_block(index, row_offset, data, len(data), options or CsvOptions())
+
+    @staticmethod
+    def iter_blocks(
+        path: PathOrStr,
+        chunk_rows: int = 10_000,
+        options: CsvOptions | None = None,
+        skip_rows: int = 0,
+        max_workers: int | None = None,
+    ) -> Iterator[CsvBlock]:
+        """
+        Reads, parses and converts a file in blocks of rows.
+
+        Blocks are parsed in a process pool and yielded in file order.
+        At most two blocks per worker are read ahead of the block being yielded,
+        so memory use depends on ``chunk_rows`` and not on the size of the file.
+
+        Args:
+            path (PathOrStr): File path.
+            chunk_rows (int, optional): Maximum number of records in a block. Defaults to ``10_000``.
+            options (CsvOptions, optional): Parse options.
+            skip_rows (int, optional): Number of records to skip at the start of the file. Defaults to ``0``.
+            max_workers (int, optional): Number of worker processes. Defaults to the number of processors.
+                When ``0`` blocks are parsed in the current process.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            CsvBlock: Parsed blocks.
+
+        Note:
+            Use ``max_workers=0`` when running inside of the office, such as from a macro,
+            where new Python processes cannot be started.
+            Worker processes are started with ``spawn`` and import the main module again,
+            so scripts must start importing from an ``if __name__ == "__main__":`` block.
+        """
+        opts = options or CsvOptions()
+        raw_blocks = CsvHelper.iter_raw_blocks(
+            path=path, chunk_rows=chunk_rows, quotechar=opts.quotechar, skip_rows=skip_rows
+        )
+        if max_workers == 0:
+            row_offset = 0
+            for index, (data, records, byte_count) in enumerate(raw_blocks):
+                yield _parse_block(index, row_offset, data, byte_count, opts)
+                row_offset += records
+            return
+
+        workers = max_workers or os.cpu_count() or 1
+        # not fork, a forked child of a process connected to office inherits its bridge threads and sockets.
+        executor: Executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        read_ahead = 2 * workers
+        pending: Deque[Future] = deque()
+        try:
+            row_offset = 0
+            for index, (data, records, byte_count) in enumerate(raw_blocks):
+                pending.append(executor.submit(_parse_block, index, row_offset, data, byte_count, opts))
+                row_offset += records
+                if len(pending) >= read_ahead:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
@@ -0,0 +1,237 @@
+"""
+Conversion between Calc data tables and pandas ``DataFrame`` objects.
+
+pandas is an optional dependency of ``ooodev``; it is only imported when one of the methods
+of :py:class:`DataFrameHelper` is called.
+
+.. versionadded:: 0.54.0
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Iterable, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+from ooodev.utils.helper.ndarray_helper import NdArrayHelper
+
+if TYPE_CHECKING:
+    from pandas import DataFrame  # type: ignore
+else:
+    DataFrame = Any
+
+_NUMERIC_TYPES = frozenset((float, int))
+_NUMERIC_OR_TEXT_TYPES = frozenset((float, int, str))
+_UNO_SCALAR_TYPES = (str, float, int, bool)
+
+NULL_DATE = datetime(1899, 12, 30)
+"""Default Calc null date. Serial date ``0`` is this date."""
+
+
+class DataFrameBlock(NamedTuple):
+    """Block of adjacent ``DataFrame`` columns that share the same kind of data."""
+
+    col: int
+    """Zero based offset of the first column of the block"""
+    kind: str
+    """Kind of data in block: ``number``, ``date`` or ``text``"""
+    values: Tuple[Tuple[Any, ...], ...]
+    """2-Dimensional table of values that are ready for ``setDataArray()``"""
+    has_time: bool = False
+    """For ``date`` blocks; ``True`` if any value has a time part"""
+
+    @property
+    def col_count(self) -> int:
+        """Number of columns in the block"""
+        return len(self.values[0]) if self.values else 0
+
+
+class DataFrameHelper:
+    """
+    Helper methods for moving Calc data into and out of pandas ``DataFrame`` objects.
+
+    .. versionadded:: 0.54.0
+    """
+
+    @staticmethod
+    def import_pandas() -> ModuleType:
+        """
+        Imports and returns the ``pandas`` module.
+
+        Raises:
+            ImportError: If ``pandas`` is not installed.
+
+        Returns:
+            ModuleType: ``pandas`` module.
+        """
+        try:
+            import pandas  # type: ignore
+        except ImportError as e:
+            raise ImportError("pandas is required for this operation. Install it with: pip install pandas") from e
+        return pandas
+
+    # region table to DataFrame
+    @staticmethod
+    def _get_header(row: Sequence[Any]) -> List[str]:
+        names = []
+        for i, val in enumerate(row):
+            if type(val) is float and val.is_integer():
+                val = int(val)
+            name = str(val)
+            names.append(name if name else f"Unnamed: {i}")
+        return names
+
+    @classmethod
+    def _column_to_array(cls, np: ModuleType, col: Sequence[Any]) -> Any:
+        types = set(map(type, col))
+        if types <= _NUMERIC_TYPES:
+            return np.asarray(col, dtype=np.float64)
+        if types <= _NUMERIC_OR_TEXT_TYPES and not any(type(v) is str and v for v in col):
+            # numbers and empty cells
+            return np.array([np.nan if type(v) is str else v for v in col], dtype=np.float64)
+        return np.array([None if v == "" else v for v in col], dtype=object)
+
+    @classmethod
+    def table_to_dataframe(
+        cls,
+        values: Sequence[Sequence[Any]],
+        header: bool = True,
+        date_columns: Iterable[int] = (),
+        null_date: datetime | None = None,
+    ) -> DataFrame:
+        """
+        Converts a 2-Dimensional table, such as the result of ``getDataArray()``, into a ``DataFrame``.
+
+        Columns that contain only numbers and empty cells become ``float64`` columns where empty cells are ``NaN``.
+        Other columns are ``object`` columns where empty cells are ``None``.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values.
+            header (bool, optional): If ``True`` then the first row is used as column names. Defaults to ``True``.
+            date_columns (Iterable[int], optional): Zero based indexes of columns that contain Calc serial dates.
+                Numeric date columns are converted to ``datetime64`` columns in a single vectorized step.
+            null_date (datetime, optional): Date of serial number ``0``. Defaults to ``1899-12-30``.
+
+        Raises:
+            ImportError: If ``pandas`` is not installed.
+
+        Returns:
+            DataFrame: Data frame.
+        """
+        pd = cls.import_pandas()
+        np = NdArrayHelper.import_numpy()
+        rows = list(values)
+        columns = None
+        if header and rows:
+            columns = cls._get_header(rows[0])
+            rows = rows[1:]
+        col_count = len(columns) if columns is not None else (len(rows[0]) if rows else 0)
+        if columns is None:
+            columns = list(range(col_count))
+
+        if not rows:
+            return pd.DataFrame(columns=columns)
+
+        # zip() transposes rows into columns at C speed.
+        data = {}
+        for i, col in enumerate(zip(*rows)):
+            data[i] = cls._column_to_array(np, col)
+
+        origin = pd.Timestamp(null_date or NULL_DATE)
+        for i in date_columns:
+            arr = data.get(i)
+            if arr is None or arr.dtype != np.float64:
+                continue
+            data[i] = pd.to_datetime(arr, unit="D", origin=origin).round("ms")
+
+        df = pd.DataFrame(data)
+        df.columns = columns
+        return df
+
+    # endregion table to DataFrame
+
+    # region DataFrame to table
+    @staticmethod
+    def _get_kind(pd: ModuleType, dtype: Any) -> str:
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
+            return "number"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "date"
+        return "text"
+
+    @staticmethod
+    def _to_uno_scalar(val: Any) -> Any:
+        if isinstance(val, _UNO_SCALAR_TYPES):
+            return val
+        return str(val)
+
+    @classmethod
+    def get_header_row(cls, df: DataFrame) -> Tuple[Tuple[str, ...]]:
+        """
+        Gets the column names of a ``DataFrame`` as a single row table.
+
+        Args:
+            df (DataFrame): Data frame.
+
+        Returns:
+            Tuple[Tuple[str, ...]]: Single row table of column names.
+        """
+        return (tuple(str(name) for name in df.columns),)
+
+    @classmethod
+    def dataframe_to_blocks(cls, df: DataFrame, null_date: datetime | None = None) -> List[DataFrameBlock]:
+        """
+        Splits the values of a ``DataFrame`` into blocks of adjacent columns of the same kind.
+
+        Each block is converted in one vectorized step and is ready to be written with a single ``setDataArray()`` call.
+
+        - ``number`` columns (numeric and boolean) are written as floats, missing values become empty cells.
+        - ``date`` columns are converted into Calc serial dates, ``NaT`` becomes an empty cell.
+        - ``text`` columns are written as strings, missing values become empty cells.
+
+        Args:
+            df (DataFrame): Data frame. Column names and index are not included.
+            null_date (datetime, optional): Date of serial number ``0``. Defaults to ``1899-12-30``.
+
+        Raises:
+            ImportError: If ``pandas`` is not installed.
+
+        Returns:
+            List[DataFrameBlock]: Blocks of columns.
+        """
+        pd = cls.import_pandas()
+        np = NdArrayHelper.import_numpy()
+        kinds = [cls._get_kind(pd, dtype) for dtype in df.dtypes]
+        if len(df) == 0 or not kinds:
+            return []
+
+        groups: List[Tuple[int, int, str]] = []
+        start = 0
+        for i in range(1, len(kinds) + 1):
+            if i == len(kinds) or kinds[i] != kinds[start]:
+                groups.append((start, i, kinds[start]))
+                start = i
+
+        origin = pd.Timestamp(null_date or NULL_DATE)
+        one_day = pd.Timedelta(days=1)
+        blocks: List[DataFrameBlock] = []
+        for start, end, kind in groups:
+            block = df.iloc[:, start:end]
+            has_time = False
+            if kind == "number":
+                values = NdArrayHelper.ndarray_to_table(block.to_numpy(dtype=np.float64, na_value=np.nan))
+            elif kind == "date":
+                serials = []
+                for _, series in block.items():
+                    if series.dt.tz is not None:
+                        series = series.dt.tz_localize(None)
+                    if not has_time:
+                        has_time = bool((series.dropna() != series.dropna().dt.normalize()).any())
+                    serials.append(((series - origin) / one_day).to_numpy(dtype=np.float64, na_value=np.nan))
+                values = NdArrayHelper.ndarray_to_table(np.column_stack(serials))
+            else:
+                obj = block.astype(object).where(block.notna(), "")
+                values = tuple(tuple(cls._to_uno_scalar(v) for v in row) for row in obj.itertuples(index=False))
+            blocks.append(DataFrameBlock(col=start, kind=kind, values=values, has_time=has_time))
+        return blocks
+
+    # endregion DataFrame to table
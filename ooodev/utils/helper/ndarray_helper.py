@@ -0,0 +1,125 @@
+"""
+Conversion between Calc data tables and NumPy arrays.
+
+NumPy is an optional dependency of ``ooodev``; it is only imported when one of the methods
+of :py:class:`NdArrayHelper` is called.
+
+.. versionadded:: 0.54.0
+"""
+
+from __future__ import annotations
+from types import ModuleType
+from typing import Any, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy import ndarray  # type: ignore
+else:
+    ndarray = Any
+
+_NUMERIC_TYPES = frozenset((float, int))
+
+
+class NdArrayHelper:
+    """
+    Helper methods for moving Calc data into and out of ``numpy.ndarray`` objects.
+
+    .. versionadded:: 0.54.0
+    """
+
+    @staticmethod
+    def import_numpy() -> ModuleType:
+        """
+        Imports and returns the ``numpy`` module.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ModuleType: ``numpy`` module.
+        """
+        try:
+            import numpy  # type: ignore
+        except ImportError as e:
+            raise ImportError("numpy is required for this operation. Install it with: pip install numpy") from e
+        return numpy
+
+    @classmethod
+    def table_to_ndarray(
+        cls, values: Sequence[Sequence[Any]], dtype: Any = None, with_mask: bool = False
+    ) -> ndarray | Tuple[ndarray, ndarray]:
+        """
+        Converts a 2-Dimensional table, such as the result of ``getDataArray()``, into a ``numpy.ndarray``.
+
+        Numeric values are copied into a preallocated ``float64`` array. Any value that is not numeric,
+        such as text or an empty cell, becomes ``NaN``.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values.
+            dtype (Any, optional): NumPy dtype of the returned array. Defaults to ``float64``.
+                When ``dtype`` is not a floating point type then non-numeric values are set to ``0``.
+            with_mask (bool, optional): If ``True`` then a tuple of ``(array, mask)`` is returned
+                where ``mask`` is a boolean array that is ``True`` for each non-numeric value. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+
+        Returns:
+            ndarray | Tuple[ndarray, ndarray]: Array or tuple of array and mask.
+        """
+        np = cls.import_numpy()
+        row_count = len(values)
+        col_count = len(values[0]) if row_count > 0 else 0
+        arr = np.full((row_count, col_count), np.nan, dtype=np.float64)
+        mask = np.zeros((row_count, col_count), dtype=bool)
+        for i, row in enumerate(values):
+            if _NUMERIC_TYPES.issuperset(map(type, row)):
+                # all numeric, let numpy copy the whole row in one step
+                arr[i] = row
+                continue
+            for j, val in enumerate(row):
+                if type(val) in _NUMERIC_TYPES:
+                    arr[i, j] = val
+                else:
+                    mask[i, j] = True
+
+        if dtype is not None:
+            np_dtype = np.dtype(dtype)
+            if np_dtype != arr.dtype:
+                if not np.issubdtype(np_dtype, np.floating):
+                    arr[mask] = 0
+                arr = arr.astype(np_dtype)
+        if with_mask:
+            return (arr, mask)
+        return arr
+
+    @classmethod
+    def ndarray_to_table(cls, arr: ndarray) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Converts a 2-Dimensional ``numpy.ndarray`` into a table suitable for ``setDataArray()``.
+
+        ``NaN`` values are converted into empty strings which results in empty cells.
+
+        Args:
+            arr (ndarray): 2-Dimensional array.
+
+        Raises:
+            ImportError: If ``numpy`` is not installed.
+            ValueError: If ``arr`` is not 2-Dimensional.
+
+        Returns:
+            Tuple[Tuple[Any, ...], ...]: 2-Dimensional table.
+        """
+        np = cls.import_numpy()
+        arr = np.asarray(arr)
+        if arr.ndim != 2:
+            raise ValueError(f"Expected a 2-Dimensional array, got {arr.ndim} dimension(s)")
+        if np.issubdtype(arr.dtype, np.floating):
+            nan_mask = np.isnan(arr)
+            if nan_mask.any():
+                obj = arr.astype(object)
+                obj[nan_mask] = ""
+                return tuple(tuple(row) for row in obj.tolist())
+        elif np.issubdtype(arr.dtype, np.bool_):
+            arr = arr.astype(np.float64)
+        # tolist() converts NumPy scalars into native Python types which uno can marshal.
+        return tuple(tuple(row) for row in arr.tolist())
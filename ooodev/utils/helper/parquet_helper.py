@@ -0,0 +1,195 @@
+"""
+Conversion of Calc data tables into Apache Parquet tables.
+
+pyarrow is an optional dependency of ``ooodev``; it is only imported when one of the methods
+of :py:class:`ParquetHelper` is called.
+
+.. versionadded:: 0.54.0
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Container, List, Sequence, TYPE_CHECKING
+
+from ooodev.utils.helper.csv_helper import CsvHelper
+
+if TYPE_CHECKING:
+    from pyarrow import Schema, Table  # type: ignore
+else:
+    Schema = Any
+    Table = Any
+
+
+class ParquetHelper:
+    """
+    Helper methods for writing Calc data into Apache Parquet files with ``pyarrow``.
+
+    Each column has one of three kinds:
+
+    - ``number`` columns are written as ``float64``.
+    - ``date`` columns are written as ``timestamp[ms]``.
+    - ``text`` columns are written as ``string``.
+
+    Empty cells are written as ``null``.
+
+    See Also:
+        :py:meth:`CalcCellRange.export_parquet() <ooodev.calc.CalcCellRange.export_parquet>`
+
+    .. versionadded:: 0.54.0
+    """
+
+    @staticmethod
+    def import_pyarrow() -> ModuleType:
+        """
+        Imports and returns the ``pyarrow`` module with its ``parquet`` sub module loaded.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+
+        Returns:
+            ModuleType: ``pyarrow`` module.
+        """
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore # noqa: F401
+        except ImportError as e:
+            raise ImportError("pyarrow is required for this operation. Install it with: pip install pyarrow") from e
+        return pyarrow
+
+    @staticmethod
+    def get_column_names(row: Sequence[Any]) -> List[str]:
+        """
+        Gets unique column names from a header row.
+
+        Whole numbers are used without a fraction, empty names become ``Unnamed: <index>``
+        and repeated names get a ``.1``, ``.2`` ... suffix.
+
+        Args:
+            row (Sequence[Any]): Header row.
+
+        Returns:
+            List[str]: Column names.
+        """
+        names: List[str] = []
+        seen = set()
+        for i, val in enumerate(row):
+            if type(val) is float and val.is_integer():
+                val = int(val)
+            name = str(val) or f"Unnamed: {i}"
+            unique = name
+            n = 0
+            while unique in seen:
+                n += 1
+                unique = f"{name}.{n}"
+            seen.add(unique)
+            names.append(unique)
+        return names
+
+    @staticmethod
+    def get_column_kinds(values: Sequence[Sequence[Any]], date_columns: Container[int] = ()) -> List[str]:
+        """
+        Gets the kind of each column of a table.
+
+        A column is ``number`` when it holds at least one number and no text, numeric columns in ``date_columns`` are ``date``.
+        All other columns are ``text``.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values.
+            date_columns (Container[int], optional): Zero based indexes of columns that contain serial dates.
+
+        Returns:
+            List[str]: Kind of each column.
+        """
+        if not values:
+            return []
+        kinds: List[str] = []
+        for i, col in enumerate(zip(*values)):
+            has_number = False
+            has_text = False
+            for val in col:
+                if type(val) is float:
+                    has_number = True
+                elif val != "":
+                    has_text = True
+                    break
+            if has_number and not has_text:
+                kinds.append("date" if i in date_columns else "number")
+            else:
+                kinds.append("text")
+        return kinds
+
+    @staticmethod
+    def get_text_columns(values: Sequence[Sequence[Any]], kinds: Sequence[str]) -> List[int]:
+        """
+        Gets the ``number`` and ``date`` columns of a table that hold text.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values.
+            kinds (Sequence[str]): Column kinds such as the result of :py:meth:`~.ParquetHelper.get_column_kinds`.
+
+        Returns:
+            List[int]: Zero based indexes of columns that must be ``text`` to keep all values.
+        """
+        if not values:
+            return []
+        return [
+            i
+            for i, (kind, col) in enumerate(zip(kinds, zip(*values)))
+            if kind != "text" and any(type(val) is not float and val != "" for val in col)
+        ]
+
+    @classmethod
+    def get_schema(cls, names: Sequence[str], kinds: Sequence[str]) -> Schema:
+        """
+        Gets a ``pyarrow`` schema for columns.
+
+        Args:
+            names (Sequence[str]): Column names.
+            kinds (Sequence[str]): Column kinds such as the result of :py:meth:`~.ParquetHelper.get_column_kinds`.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+
+        Returns:
+            Schema: Schema.
+        """
+        pa = cls.import_pyarrow()
+        types = {"number": pa.float64(), "date": pa.timestamp("ms"), "text": pa.string()}
+        return pa.schema([pa.field(name, types[kind]) for name, kind in zip(names, kinds)])
+
+    @classmethod
+    def table_to_arrow(
+        cls, values: Sequence[Sequence[Any]], schema: Schema, kinds: Sequence[str], null_date: datetime | None = None
+    ) -> Table:
+        """
+        Converts a 2-Dimensional table, such as the result of ``getDataArray()``, into a ``pyarrow.Table``.
+
+        Values that do not match the kind of their column are converted;
+        text in ``number`` and ``date`` columns becomes ``null`` and numbers in ``text`` columns become text.
+
+        Args:
+            values (Sequence[Sequence[Any]]): 2-Dimensional table of values.
+            schema (Schema): Schema such as the result of :py:meth:`~.ParquetHelper.get_schema`.
+            kinds (Sequence[str]): Column kinds.
+            null_date (datetime, optional): Date of serial number ``0``. Defaults to ``1899-12-30``.
+
+        Raises:
+            ImportError: If ``pyarrow`` is not installed.
+
+        Returns:
+            Table: Table.
+        """
+        pa = cls.import_pyarrow()
+        if not values:
+            return schema.empty_table()
+        arrays = []
+        for field, kind, col in zip(schema, kinds, zip(*values)):
+            if kind == "number":
+                data = [v if type(v) is float else None for v in col]
+            elif kind == "date":
+                data = [CsvHelper.serial_to_datetime(v, null_date) if type(v) is float else None for v in col]
+            else:
+                data = [None if v == "" else str(v) for v in CsvHelper.format_row(col)]
+            arrays.append(pa.array(data, type=field.type))
+        return pa.Table.from_arrays(arrays, schema=schema)
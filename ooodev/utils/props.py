@@ -38,6 +38,7 @@ from ooodev.events.event_singleton import _Events
 from ooodev.events.props_named_event import PropsNamedEvent
 from ooodev.exceptions import ex as mEx
 from ooodev.utils.helper.dot_dict import DotDict
+from ooodev.utils.uno_profiler import profiled
 
 
 if TYPE_CHECKING:
@@ -878,6 +879,7 @@ class Props:
         return (False, None)
 
     @classmethod
+    @profiled("Props.set")
     def set(cls, obj: Any, **kwargs) -> None:
         """
         Set one or more properties.
@@ -1105,6 +1107,7 @@ class Props:
         ...
 
     @classmethod
+    @profiled("Props.get")
     def get(cls, obj: Any, name: str, default: Any = gUtil.NULL_OBJ) -> Any:
         """
         Gets a property value from an object.
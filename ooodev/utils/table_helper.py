@@ -6,6 +6,7 @@ import contextlib
 import re
 import sys
 import string
+from functools import lru_cache
 from typing import Callable, Iterable, Sequence, List, Any, Tuple, overload, TypeVar, NamedTuple, TYPE_CHECKING
 
 from ooodev.utils import gen_util as gUtil
@@ -19,6 +20,25 @@ else:
 
 T = TypeVar("T")
 
+_MAX_COLS = 16384
+"""Number of columns of a Calc sheet, ``A`` to ``XFD``."""
+_PARSE_CACHE_SIZE = 4096
+"""Maximum number of cell and range names kept by the parse cache."""
+
+
+def _make_column_names() -> Tuple[str, ...]:
+    letters = string.ascii_uppercase
+    names = list(letters)
+    names.extend(a + b for a in letters for b in letters)
+    names.extend(a + b + c for a in letters for b in letters for c in letters)
+    return tuple(names[:_MAX_COLS])
+
+
+_COL_NAMES = _make_column_names()
+"""Column names in order, ``_COL_NAMES[0]`` is ``A``."""
+_COL_NUMBERS = {name: i for i, name in enumerate(_COL_NAMES, 1)}
+"""One based column number of each column name."""
+
 
 class CellParts(NamedTuple):
     """Cell Named parts"""
@@ -69,27 +89,14 @@ class TableHelper:
 
         .. versionchanged:: 0.51.3:: Now supports range names with ``$`` in them.
 
+        .. versionchanged:: 0.54.0
+            Results are kept in a bounded cache, repeated names are not parsed again.
+
         .. versionadded:: 0.8.3
         """
         if not cell_name:
             raise ValueError("Cell name cannot be empty")
-
-        cell_name = cell_name.replace("$", "")
-
-        doc_idx = cell_name.find(".")
-
-        if doc_idx >= 0:
-            sheet_name = cell_name[:doc_idx]
-            cell_name = cell_name[doc_idx + 1 :]
-        else:
-            sheet_name = ""
-        # split will cover if a range is passed in, return first cell
-        cells = cell_name.split(":")
-
-        col = cells[0].rstrip(string.digits).upper()
-        row = cls.row_name_to_int(cells[0])
-
-        return CellParts(sheet=sheet_name, col=col, row=row)
+        return _get_cell_parts(cell_name)
 
     @classmethod
     def get_range_parts(cls, range_name: str) -> RangeParts:
@@ -110,40 +117,14 @@ class TableHelper:
 
         .. versionchanged:: 0.51.3:: Now supports range names with ``$`` in them.
 
+        .. versionchanged:: 0.54.0
+            Results are kept in a bounded cache, repeated names are not parsed again.
+
         .. versionadded:: 0.8.2
         """
         if not range_name:
             raise ValueError("Range name cannot be empty")
-
-        range_name = range_name.replace("$", "")
-        doc_idx = range_name.find(".")
-
-        if doc_idx >= 0:
-            sheet_name = range_name[:doc_idx]
-            range_name = range_name[doc_idx + 1 :]
-        else:
-            sheet_name = ""
-
-        cells = range_name.split(":")
-        if len(cells) == 1:
-            # if single cell to convert to single cell range
-            cells.append(cells[0])
-        col_start = cells[0].rstrip(string.digits).upper()
-        col_end = cells[1].rstrip(string.digits).upper()
-        row_start = cls.row_name_to_int(cells[0])
-        row_end = cls.row_name_to_int(cells[1])
-        start_col_num = cls.col_name_to_int(col_start)
-        end_col_num = cls.col_name_to_int(col_end)
-        # check and see if the range name need to be reversed
-        # e.g. D12:B3 => B3:D12
-        if start_col_num > end_col_num:
-            # swap
-            col_start, col_end = col_end, col_start
-        # B12:D3 => B3:D12
-        if row_start > row_end:
-            row_start, row_end = row_end, row_start
-
-        return RangeParts(sheet=sheet_name, col_start=col_start, row_start=row_start, col_end=col_end, row_end=row_end)
+        return _get_range_parts(range_name)
 
     @staticmethod
     def col_name_to_int(name: str, zero_index: bool = False) -> int:
@@ -171,8 +152,17 @@ class TableHelper:
 
         .. versionchanged:: 0.8.2
             Added ``zero_index`` parameter.
+
+        .. versionchanged:: 0.54.0
+            Column names of a Calc sheet are looked up in a precomputed table.
         """
+        col_num = _COL_NUMBERS.get(name, 0)
+        if col_num:
+            return col_num - 1 if zero_index else col_num
         chars = name.rstrip(string.digits).strip()
+        col_num = _COL_NUMBERS.get(chars.upper(), 0)
+        if col_num:
+            return col_num - 1 if zero_index else col_num
         c_len = len(chars)
         if c_len == 0:
             raise ValueError("Empty name value or Invalid or characters detected.")
@@ -281,12 +271,17 @@ class TableHelper:
 
         .. versionchanged:: 0.8.2
             Added ``zero_index`` parameter.
+
+        .. versionchanged:: 0.54.0
+            Column names of a Calc sheet are looked up in a precomputed table.
         """
         idx_min = 0 if zero_index else 1
         if col < idx_min:
             raise ValueError(f"Value cannot be less then {idx_min}: {col}")
-        str_col = str()
         div = col + 1 if zero_index else col
+        if div <= _MAX_COLS:
+            return _COL_NAMES[div - 1]
+        str_col = str()
         while div:
             (div, mod) = divmod(div - 1, 26)  # will return (x, 0 .. 25)
             str_col = chr(mod + 65) + str_col
@@ -795,3 +790,57 @@ class TableHelper:
         return new_lst  # type: ignore
 
     # endregion convert_1d_to_2d()
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _get_cell_parts(cell_name: str) -> CellParts:
+    # module level so a single thread safe cache is shared, parts are immutable named tuples.
+    cell_name = cell_name.replace("$", "")
+
+    doc_idx = cell_name.find(".")
+
+    if doc_idx >= 0:
+        sheet_name = cell_name[:doc_idx]
+        cell_name = cell_name[doc_idx + 1 :]
+    else:
+        sheet_name = ""
+    # split will cover if a range is passed in, return first cell
+    cells = cell_name.split(":")
+
+    col = cells[0].rstrip(string.digits).upper()
+    row = TableHelper.row_name_to_int(cells[0])
+
+    return CellParts(sheet=sheet_name, col=col, row=row)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _get_range_parts(range_name: str) -> RangeParts:
+    range_name = range_name.replace("$", "")
+    doc_idx = range_name.find(".")
+
+    if doc_idx >= 0:
+        sheet_name = range_name[:doc_idx]
+        range_name = range_name[doc_idx + 1 :]
+    else:
+        sheet_name = ""
+
+    cells = range_name.split(":")
+    if len(cells) == 1:
+        # if single cell to convert to single cell range
+        cells.append(cells[0])
+    col_start = cells[0].rstrip(string.digits).upper()
+    col_end = cells[1].rstrip(string.digits).upper()
+    row_start = TableHelper.row_name_to_int(cells[0])
+    row_end = TableHelper.row_name_to_int(cells[1])
+    start_col_num = TableHelper.col_name_to_int(col_start)
+    end_col_num = TableHelper.col_name_to_int(col_end)
+    # check and see if the range name need to be reversed
+    # e.g. D12:B3 => B3:D12
+    if start_col_num > end_col_num:
+        # swap
+        col_start, col_end = col_end, col_start
+    # B12:D3 => B3:D12
+    if row_start > row_end:
+        row_start, row_end = row_end, row_start
+
+    return RangeParts(sheet=sheet_name, col_start=col_start, row_start=row_start, col_end=col_end, row_end=row_end)
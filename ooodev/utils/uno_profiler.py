@@ -0,0 +1,329 @@
+from __future__ import annotations
+import functools
+import json
+import marshal
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+# (file name, line number, function name), the same key as ``pstats``.
+SiteKey = Tuple[str, int, str]
+
+# profiler that records calls, ``None`` when profiling is off.
+_active: Optional[UnoProfiler] = None
+_active_lock = threading.Lock()
+
+# modules whose frames are passed over when looking for the call site.
+_PLUMBING = frozenset(("ooodev.loader.lo", "ooodev.loader.inst.lo_inst", "ooodev.utils.props", __name__))
+
+
+class UnoCallStat(NamedTuple):
+    """
+    Calls of one profiled operation from one call site.
+
+    Times are in seconds.
+
+    .. versionadded:: 0.54.0
+    """
+
+    name: str
+    """Operation name such as ``Lo.qi``."""
+    site: SiteKey
+    """Call site as file name, line number of the function and function name."""
+    calls: int
+    """Number of calls."""
+    total: float
+    """Time of all calls, including other profiled operations they made."""
+    own: float
+    """Time of all calls, less the time of other profiled operations they made."""
+    max: float
+    """Time of the slowest call."""
+    errors: int
+    """Number of calls that raised an error."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the stat as a dictionary, such as for logging as JSON.
+
+        Returns:
+            Dict[str, Any]: Stat values, ``site`` as ``file:line(function)``.
+        """
+        result = self._asdict()
+        result["site"] = _site_str(self.site)
+        return result
+
+
+def _site_str(site: SiteKey) -> str:
+    return f"{site[0]}:{site[1]}({site[2]})"
+
+
+def _get_site(frame: Any) -> SiteKey:
+    # nearest frame outside of Lo, LoInst and Props, the ooodev method or user code that made the call.
+    while frame is not None and frame.f_globals.get("__name__") in _PLUMBING:
+        frame = frame.f_back
+    if frame is None:
+        return ("~", 0, "<unknown>")
+    code = frame.f_code
+    return (code.co_filename, code.co_firstlineno, getattr(code, "co_qualname", code.co_name))
+
+
+def profiled(name: str) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """
+    Decorator that records calls of a method while a :py:class:`UnoProfiler` is running.
+
+    When no profiler is running the method is called directly.
+    For class methods apply it below (after) ``@classmethod``.
+
+    Args:
+        name (str): Operation name such as ``Lo.qi``.
+
+    Returns:
+        Callable[[Callable[..., T]], Callable[..., T]]: Decorator.
+
+    .. versionadded:: 0.54.0
+    """
+
+    def decorator(fn: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> _T:
+            prof = _active
+            if prof is None:
+                return fn(*args, **kwargs)
+            return prof._call(name, fn, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class UnoProfiler:
+    """
+    Counts and times the calls that ooodev makes over the office bridge.
+
+    Profiled operations are ``Lo.qi()``, ``Lo.create_instance_msf()``, ``Lo.create_instance_mcf()``,
+    ``Props.get()`` and ``Props.set()``, each of them is at least one round trip to office.
+    Calls are grouped by operation and by call site, the nearest ooodev method or user function that made the call.
+
+    Usually created by :py:meth:`Lo.profile() <ooodev.loader.Lo.profile>`.
+    Profiling is for the whole process, calls from all threads are recorded.
+    When no profiler is running profiled operations cost a single extra function call.
+
+    Results can be read with :py:meth:`~UnoProfiler.get_stats`, exported as JSON with
+    :py:meth:`~UnoProfiler.to_json` or loaded into ``pstats``,
+    where each operation is a function and each call site a caller.
+
+    Example:
+        .. code-block:: python
+
+            import pstats
+            from ooodev.loader import Lo
+
+            with Lo.profile() as prof:
+                sheet = doc.sheets[0]
+                sheet["A1"].value = 10
+
+            print(prof.calls, prof.total)
+            pstats.Stats(prof).sort_stats("cumulative").print_callers()
+            prof.dump_stats("uno.prof")
+
+    .. versionadded:: 0.54.0
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._data: Dict[Tuple[str, SiteKey], List[Any]] = {}
+        self._previous: Optional[UnoProfiler] = None
+        self._running = False
+        self.stats: Dict[Tuple[str, int, str], Tuple[int, int, float, float, Dict[SiteKey, Tuple]]] = {}
+        """Stats in ``pstats`` layout, filled by :py:meth:`~UnoProfiler.create_stats`."""
+
+    def __enter__(self) -> UnoProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.stop()
+
+    def _call(self, name: str, fn: Callable[..., _T], args: tuple, kwargs: dict) -> _T:
+        # frame 0 is this method, frame 1 the profiled wrapper.
+        site = _get_site(sys._getframe(2))  # pylint: disable=protected-access
+        try:
+            children: List[float] = self._local.children
+        except AttributeError:
+            children = self._local.children = []
+        children.append(0.0)
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            child_time = children.pop()
+            if children:
+                children[-1] += elapsed
+            self._record(name, site, elapsed, elapsed - child_time, failed)
+
+    def _record(self, name: str, site: SiteKey, elapsed: float, own: float, failed: bool) -> None:
+        with self._lock:
+            stat = self._data.get((name, site))
+            if stat is None:
+                self._data[(name, site)] = [1, elapsed, own, elapsed, int(failed)]
+                return
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] += own
+            if elapsed > stat[3]:
+                stat[3] = elapsed
+            stat[4] += int(failed)
+
+    def start(self) -> None:
+        """
+        Starts recording calls, a profiler that was running is paused until :py:meth:`~UnoProfiler.stop`.
+
+        Raises:
+            RuntimeError: If the profiler is already running.
+
+        Returns:
+            None:
+        """
+        global _active
+        with _active_lock:
+            if self._running:
+                raise RuntimeError("Profiler is already running")
+            self._previous = _active
+            self._running = True
+            _active = self
+
+    def stop(self) -> None:
+        """
+        Stops recording calls and resumes the profiler that was running before :py:meth:`~UnoProfiler.start`.
+
+        A profiler that is stopped while another profiler started after it is still running is only
+        taken out of the chain of paused profilers, it is not resumed when the later profiler stops.
+
+        Returns:
+            None:
+        """
+        global _active
+        with _active_lock:
+            if not self._running:
+                return
+            self._running = False
+            if _active is self:
+                _active = self._previous
+            else:
+                # stopped out of order, take this profiler out of the chain of paused profilers.
+                prof = _active
+                while prof is not None and prof._previous is not self:
+                    prof = prof._previous
+                if prof is not None:
+                    prof._previous = self._previous
+            self._previous = None
+
+    def reset(self) -> None:
+        """
+        Removes all recorded calls.
+
+        Returns:
+            None:
+        """
+        with self._lock:
+            self._data.clear()
+        self.stats = {}
+
+    def get_stats(self) -> List[UnoCallStat]:
+        """
+        Gets the recorded calls, slowest first.
+
+        Returns:
+            List[UnoCallStat]: One stat per operation and call site.
+        """
+        with self._lock:
+            items = [(key, list(value)) for key, value in self._data.items()]
+        result = [UnoCallStat(name, site, *values) for (name, site), values in items]
+        result.sort(key=lambda stat: stat.total, reverse=True)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the recorded calls as a dictionary.
+
+        Returns:
+            Dict[str, Any]: ``calls`` and ``total`` of all operations and ``stats``, a list of stats dictionaries.
+        """
+        stats = self.get_stats()
+        return {
+            "calls": sum(stat.calls for stat in stats),
+            "total": sum(stat.own for stat in stats),
+            "stats": [stat.to_dict() for stat in stats],
+        }
+
+    def to_json(self, indent: int | None = None) -> str:
+        """
+        Gets the recorded calls as JSON.
+
+        Args:
+            indent (int, optional): JSON indent. Defaults to ``None``.
+
+        Returns:
+            str: JSON of :py:meth:`~UnoProfiler.to_dict`.
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def create_stats(self) -> None:
+        """
+        Fills :py:attr:`~UnoProfiler.stats` in the layout of ``cProfile.Profile.stats``.
+
+        Called by ``pstats.Stats(profiler)``. Each operation is a function named such as ``<ooodev Lo.qi>``
+        and each call site is one of its callers.
+
+        Returns:
+            None:
+        """
+        stats: Dict[Tuple[str, int, str], Tuple[int, int, float, float, Dict[SiteKey, Tuple]]] = {}
+        for stat in self.get_stats():
+            func = ("~", 0, f"<ooodev {stat.name}>")
+            cc, nc, tt, ct, callers = stats.get(func, (0, 0, 0.0, 0.0, {}))
+            callers[stat.site] = (stat.calls, stat.calls, stat.own, stat.total)
+            stats[func] = (cc + stat.calls, nc + stat.calls, tt + stat.own, ct + stat.total, callers)
+        self.stats = stats
+
+    def dump_stats(self, file: str) -> None:
+        """
+        Writes the recorded calls to a file that can be loaded by ``pstats`` or tools such as ``snakeviz``.
+
+        Args:
+            file (str): File name.
+
+        Returns:
+            None:
+        """
+        self.create_stats()
+        with open(file, "wb") as f:
+            marshal.dump(self.stats, f)
+
+    # region Properties
+    @property
+    def running(self) -> bool:
+        """Gets if the profiler is recording calls."""
+        return self._running and _active is self
+
+    @property
+    def calls(self) -> int:
+        """Gets the number of recorded calls."""
+        with self._lock:
+            return sum(value[0] for value in self._data.values())
+
+    @property
+    def total(self) -> float:
+        """Gets the seconds spent in profiled operations, nested calls counted once."""
+        with self._lock:
+            return sum(value[2] for value in self._data.values())
+
+    # endregion Properties
@@ -0,0 +1,38 @@
+from __future__ import annotations
+import asyncio
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio import AioLo
+from ooodev.loader.inst.doc_type import DocTypeStr
+from ooodev.loader.lo import Lo
+from ooodev.office.calc import Calc
+
+
+def test_aio_lo(loader, tmp_path_fn: Path) -> None:
+    async def main() -> None:
+        async with AioLo(Lo.current_lo, max_pending=4) as aio:
+            doc = await aio.create_doc(DocTypeStr.CALC, timeout=30)
+            try:
+                sheet = await aio.run(Calc.get_sheet, doc, 0)
+                await aio.set_array([[1, 2], [3, 4]], sheet, "A1:B2", timeout=10)
+                values = await asyncio.gather(*(aio.get_array(sheet, "A1:B2") for _ in range(10)))
+                assert all(value == ((1.0, 2.0), (3.0, 4.0)) for value in values)
+                fnm = Path(tmp_path_fn, "aio.ods")
+                assert await aio.save_doc(doc, fnm)
+                assert fnm.exists()
+            finally:
+                await aio.close_doc(doc)
+
+            doc = await aio.open_doc(fnm)
+            try:
+                sheet = await aio.run(Calc.get_sheet, doc, 0)
+                assert await aio.get_array(sheet, "A2:B2") == ((3.0, 4.0),)
+            finally:
+                await aio.close_doc(doc)
+        assert aio.bridge.closed
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, cast
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio.aio_lo import AioLo
+
+
+class _FakeLoInst:
+    pass
+
+
+def test_bridge_shared_per_lo_inst() -> None:
+    inst1 = cast(Any, _FakeLoInst())
+    inst2 = cast(Any, _FakeLoInst())
+    aio1 = AioLo(inst1)
+    aio2 = AioLo(inst1, max_pending=2)
+    aio3 = AioLo(inst2)
+    try:
+        assert aio1.bridge is aio2.bridge
+        assert aio1.bridge is not aio3.bridge
+        # max_pending of the first AioLo is used.
+        assert aio2.bridge.max_pending == 64
+
+        async def main() -> None:
+            assert await aio2.run(lambda: aio1.bridge.is_bridge_thread)
+
+        asyncio.run(main())
+
+        aio1.close()
+        aio1.close()
+        assert not aio2.bridge.closed
+        aio2.close()
+        assert aio1.bridge.closed
+
+        # a new AioLo gets a new bridge once the last one was closed.
+        aio4 = AioLo(inst1)
+        assert aio4.bridge is not aio1.bridge
+        aio4.close()
+    finally:
+        for aio in (aio1, aio2, aio3):
+            aio.close()
+    assert aio3.bridge.closed
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio.bridge_thread import BridgeThread
+
+
+def test_run_on_bridge_thread() -> None:
+    bridge = BridgeThread(name="test-bridge")
+
+    async def main() -> None:
+        name = await bridge.run(lambda: threading.current_thread().name)
+        assert name == "test-bridge"
+        assert await bridge.run(pow, 2, 10) == 1024
+        assert await bridge.run(int, "ff", base=16) == 255
+        with pytest.raises(ZeroDivisionError):
+            await bridge.run(lambda: 1 / 0)
+        # calls run in order
+        order = []
+        await asyncio.gather(*(bridge.run(order.append, i) for i in range(20)))
+        assert order == list(range(20))
+
+    try:
+        asyncio.run(main())
+        assert bridge.submit(lambda: 5).result() == 5
+    finally:
+        bridge.close()
+    assert bridge.closed
+    with pytest.raises(RuntimeError):
+        bridge.submit(lambda: 5)
+
+
+def test_loop_not_blocked() -> None:
+    bridge = BridgeThread()
+
+    async def main() -> None:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        await bridge.run(time.sleep, 0.3)
+        ticker.cancel()
+        assert ticks >= 10
+
+    try:
+        asyncio.run(main())
+    finally:
+        bridge.close()
+
+
+def test_timeout_and_cancel() -> None:
+    bridge = BridgeThread()
+    ran = []
+
+    async def main() -> None:
+        with pytest.raises(asyncio.TimeoutError):
+            await bridge.run(time.sleep, 0.3, timeout=0.05)
+        # queued behind the sleep, times out before it starts and is never run
+        with pytest.raises(asyncio.TimeoutError):
+            await bridge.run(ran.append, "timeout", timeout=0.05)
+        task = asyncio.ensure_future(bridge.run(ran.append, "cancel"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await bridge.run(ran.append, "run")
+
+    try:
+        asyncio.run(main())
+    finally:
+        bridge.close()
+    assert ran == ["run"]
+
+
+def test_backpressure() -> None:
+    bridge = BridgeThread(max_pending=2)
+    release = threading.Event()
+
+    async def main() -> None:
+        first = asyncio.ensure_future(bridge.run(release.wait))
+        second = asyncio.ensure_future(bridge.run(lambda: "second"))
+        third = asyncio.ensure_future(bridge.run(lambda: "third"))
+        await asyncio.sleep(0.05)
+        # third waits for a free place and is not queued yet
+        assert bridge._calls.qsize() == 1
+        assert not third.done()
+        with pytest.raises(asyncio.TimeoutError):
+            await bridge.run(lambda: "late", timeout=0.05)
+        release.set()
+        assert await asyncio.gather(first, second, third) == [True, "second", "third"]
+
+    try:
+        asyncio.run(main())
+    finally:
+        bridge.close()
+    with pytest.raises(ValueError):
+        BridgeThread(max_pending=0)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.office.calc import Calc
+
+
+def test_call_fun_many(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        rows = [(i / 7, 2) for i in range(300)]
+        batch = doc.call_fun_many("round", rows, min_batch=1)
+        single = doc.call_fun_many("round", rows, min_batch=0)
+        assert batch == pytest.approx(single)
+        assert batch[8] == pytest.approx(round(8 / 7, 2))
+
+        rows = [(0.1, 100.0, 200.0 + i, 300) for i in range(250)]
+        batch = Calc.call_fun_many("NPV", rows, min_batch=1)
+        single = Calc.call_fun_many("NPV", rows, min_batch=0)
+        assert batch == pytest.approx(single)
+        assert batch[0] == pytest.approx(Calc.call_fun("NPV", *rows[0]))
+
+        # errors are None in both methods
+        rows = [(4.0,), (-1.0,), (9,)]
+        assert Calc.call_fun_many("SQRT", rows, min_batch=1) == [2.0, None, 3.0]
+        assert Calc.call_fun_many("SQRT", rows, min_batch=0) == [2.0, None, 3.0]
+
+        # text arguments and results
+        rows = [("abc",), ("Hello",)]
+        assert Calc.call_fun_many("UPPER", rows, min_batch=1) == ["ABC", "HELLO"]
+
+        # rows of different length
+        assert Calc.call_fun_many("SUM", [(1, 2), (1, 2, 3)], min_batch=1) == [3.0, 6.0]
+
+        # arguments are values, results do not depend on min_batch
+        rows = [("3",), ("abc",), ('say "hi"',), ("",), (True,), (2.5e-7,)]
+        for fn in ("SUM", "COUNT", "ISBLANK", "ISREF", "LEN", "ROW"):
+            assert Calc.call_fun_many(fn, rows, min_batch=1) == Calc.call_fun_many(fn, rows, min_batch=0), fn
+
+        # blocks of rows
+        rows = [(float(i),) for i in range(25)]
+        assert Calc.call_fun_many("ABS", rows, min_batch=1, chunk_rows=10) == [float(i) for i in range(25)]
+        assert Calc.call_fun_many("ABS", []) == []
+    finally:
+        Calc.close_scratch_doc()
+        if doc is not None:
+            doc.close()
+
+
+def test_call_fun_many_crossover(loader, capsys):
+    # benchmark, compares one call per row with evaluating on the scratch sheet for growing batches.
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        # first use creates the scratch document.
+        Calc.call_fun_many("ROUND", [(1.5, 0)], min_batch=1)
+        lines = []
+        for count in (10, 50, 100, 200, 500, 1000, 5000):
+            rows = [(i / 3, 2) for i in range(count)]
+            start = time.perf_counter()
+            single = Calc.call_fun_many("ROUND", rows, min_batch=0)
+            single_time = time.perf_counter() - start
+            start = time.perf_counter()
+            batch = Calc.call_fun_many("ROUND", rows, min_batch=1)
+            batch_time = time.perf_counter() - start
+            assert batch == pytest.approx(single)
+            lines.append(f"{count:>6} rows: per call {single_time:.4f}s, scratch sheet {batch_time:.4f}s")
+        with capsys.disabled():
+            print("\nCalc.call_fun_many() crossover")
+            print("\n".join(lines))
+    finally:
+        Calc.close_scratch_doc()
+        if doc is not None:
+            doc.close()
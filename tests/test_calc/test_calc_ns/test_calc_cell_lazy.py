@@ -0,0 +1,137 @@
+from __future__ import annotations
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooo.dyn.i18n.number_format_index import NumberFormatIndexEnum
+
+from ooodev.calc import CalcDoc
+from ooodev.calc import calc_cell as mCalcCell
+from ooodev.calc.calc_cell import CalcCell
+from ooodev.utils.color import StandardColor
+
+
+def test_cell_lazy_partials(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        cell = sheet.get_cell(cell_name="A1")
+        assert cell._partials_initialized is False
+
+        cell.value = 12.5
+        assert cell.value == 12.5
+        assert cell.cell_obj == "A1"
+        assert cell._partials_initialized is False
+
+        style = cell.style_font(name="Liberation Serif", size=14)
+        assert style is not None
+        assert cell._partials_initialized is True
+        assert cell.component.CharHeight == pytest.approx(14.0)
+
+        cell.style_area_color(StandardColor.GREEN_LIGHT2)
+        assert cell.component.CellBackColor == StandardColor.GREEN_LIGHT2
+
+        style = cell.style_numbers_numbers(num_format_index=NumberFormatIndexEnum.CURRENCY_1000DEC2)
+        assert style is not None
+        assert cell.style_numbers_numbers_get() is not None
+
+        cell.style_by_name("Heading")
+        assert cell.style_by_name_get() == "Heading"
+        cell.style_by_name()
+        assert cell.style_by_name_get() != "Heading"
+
+        modified = []
+        cell.add_event_modified(lambda src, args: modified.append(args))
+        cell.value = 3.0
+        assert modified
+
+        with pytest.raises(AttributeError):
+            _ = cell._NotAPartial__value
+
+        # listeners are created by the first access too
+        cell = sheet.get_cell(cell_name="B1")
+        cell.add_event_modified(lambda src, args: modified.append(args))
+        assert cell._partials_initialized is True
+        with pytest.raises(AttributeError):
+            _ = cell.not_an_attribute
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_cell_partials_not_created(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        cells = [CalcCell(owner=sheet, cell=f"A{i + 1}") for i in range(50)]
+        for i, cell in enumerate(cells):
+            cell.value = float(i)
+        assert [cell.value for cell in cells] == [float(i) for i in range(50)]
+        assert not any(cell._partials_initialized for cell in cells)
+        # methods of partials are found on the class, they do not create the partials.
+        assert callable(cells[0].style_font)
+        assert cells[0]._partials_initialized is False
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_cell_partials_error(loader, monkeypatch):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        cell = sheet.get_cell(cell_name="C1")
+
+        def raise_error(*args, **kwargs) -> None:
+            raise RuntimeError("disposed")
+
+        monkeypatch.setattr(mCalcCell.CellProtectionPartial, "__init__", raise_error)
+        for _ in range(2):
+            # the error of the constructor is raised each time, not an AttributeError.
+            with pytest.raises(RuntimeError):
+                cell.add_event_modified(lambda src, args: None)
+            assert cell._partials_initialized is False
+
+        monkeypatch.undo()
+        cell.add_event_modified(lambda src, args: None)
+        assert cell._partials_initialized is True
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_cell_construction_time(loader, capsys):
+    # micro benchmark, constructing cells for values only compared with cells that create their partials.
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        count = 500
+
+        start = time.perf_counter()
+        for i in range(count):
+            cell = CalcCell(owner=sheet, cell=f"A{i + 1}")
+            _ = cell.value
+        lazy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(count):
+            cell = CalcCell(owner=sheet, cell=f"A{i + 1}")
+            _ = cell.value
+            cell._init_partials()
+        eager_time = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(
+                f"\nCalcCell construction per cell: values only {lazy_time / count * 1_000_000:.1f} us, "
+                f"with partials {eager_time / count * 1_000_000:.1f} us"
+            )
+        assert lazy_time < eager_time
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import Any, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from com.sun.star.sheet import XCalculatable
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.calc_named_event import CalcNamedEvent
+from ooodev.events.lo_events import Events
+from ooodev.loader.lo import Lo
+
+
+def test_calculation_suspended(loader):
+    recalculated: List[EventArgs] = []
+
+    def on_recalculated(source: Any, args: EventArgs) -> None:
+        recalculated.append(args)
+
+    events = Events()
+    events.on(CalcNamedEvent.RECALCULATED, on_recalculated)
+    Lo.current_lo.add_event_observers(events)
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        calculatable = doc.qi(XCalculatable, True)
+        assert calculatable.isAutomaticCalculationEnabled()
+        sheet.set_val(value="=B1*2", cell_name="A1")
+
+        with doc.calculation_suspended() as d:
+            assert d is doc
+            assert not calculatable.isAutomaticCalculationEnabled()
+            assert doc.component.hasControllersLocked()
+            with doc.calculation_suspended():
+                sheet.set_val(value=5, cell_name="B1")
+            # nested context does not restore or calculate
+            assert not calculatable.isAutomaticCalculationEnabled()
+            assert not recalculated
+            sheet.set_array(values=[[1, 2], [3, 4]], name="B2:C3")
+
+        assert calculatable.isAutomaticCalculationEnabled()
+        assert not doc.component.hasControllersLocked()
+        assert sheet.get_val(cell_name="A1") == 10
+        assert len(recalculated) == 1
+        data = recalculated[0].event_data
+        assert data["doc"] is doc
+        assert data["full"] is False
+        assert data["elapsed"] >= 0.0
+        assert data["suspended_elapsed"] >= 0.0
+
+        # state is restored when an error is raised
+        with pytest.raises(ValueError):
+            with doc.calculation_suspended(full=True):
+                raise ValueError("test")
+        assert calculatable.isAutomaticCalculationEnabled()
+        assert len(recalculated) == 2
+
+        # manual calculation stays manual and is not calculated
+        calculatable.enableAutomaticCalculation(False)
+        with doc.calculation_suspended():
+            pass
+        assert not calculatable.isAutomaticCalculationEnabled()
+        assert len(recalculated) == 2
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_calculation_suspended_setup_error(loader, monkeypatch):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        calculatable = doc.qi(XCalculatable, True)
+
+        def raise_error() -> bool:
+            raise RuntimeError("locking")
+
+        monkeypatch.setattr(doc, "_lock_controllers_with_events", raise_error)
+        with pytest.raises(RuntimeError):
+            with doc.calculation_suspended():
+                pass
+        monkeypatch.undo()
+        assert calculatable.isAutomaticCalculationEnabled()
+
+        # the next context is not taken as nested
+        with doc.calculation_suspended():
+            assert not calculatable.isAutomaticCalculationEnabled()
+        assert calculatable.isAutomaticCalculationEnabled()
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from com.sun.star.sheet import XCalculatable
+
+from ooodev.calc import CalcDoc
+from ooodev.calc.sheet.goal_seek_results import GoalSeekSpec
+from ooodev.conn.office_pool import OfficePool
+from ooodev.utils.data_type.cell_obj import CellObj
+
+
+def test_goal_seek_many(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        rows = 20
+        with sheet.batch():
+            for row in range(rows):
+                sheet.set_val(value=1, col=0, row=row)
+                sheet.set_val(value=f"=A{row + 1}*3+1", col=1, row=row)
+
+        specs = [(f"B{row + 1}", f"A{row + 1}", row * 3 + 1.0) for row in range(rows)]
+        results = sheet.goal_seek_many(specs)
+        assert len(results) == rows
+        assert results.get_failed() == []
+        for row in range(rows):
+            assert results.results[row] == pytest.approx(float(row))
+        # not applied, variable cells are unchanged
+        assert sheet.get_val(cell_name="A5") == 1.0
+        assert doc.qi(XCalculatable, True).isAutomaticCalculationEnabled()
+
+        results = sheet.goal_seek_many(
+            [GoalSeekSpec(CellObj.from_cell("B2"), CellObj.from_cell("A2"), 31), ("B3", "A3", 61)], apply=True
+        )
+        assert results.converged_count == 2
+        assert sheet.get_val(cell_name="A2") == pytest.approx(10.0)
+        assert sheet.get_val(cell_name="B3") == pytest.approx(61.0)
+
+        # formula cell without formula does not stop the other goal seeks
+        results = sheet.goal_seek_many([("D1", "A1", 5), ("B1", "A1", 7)], apply=True)
+        assert results.get_failed() == [0]
+        assert sheet.get_val(cell_name="A1") == pytest.approx(2.0)
+        assert sheet.get_val(cell_name="B1") == pytest.approx(7.0)
+
+        # compare with single goal seeks
+        count = 200
+        with sheet.batch():
+            for row in range(count):
+                sheet.set_val(value=1, col=2, row=row)
+                sheet.set_val(value=f"=C{row + 1}^2", col=3, row=row)
+        specs = [(f"D{row + 1}", f"C{row + 1}", float(row + 1)) for row in range(count)]
+        results = sheet.goal_seek_many(specs)
+        assert results.converged_count == count
+        assert results.results[3] == pytest.approx(2.0, rel=1e-3)
+        print(f"goal_seek_many: {count} goal seeks in {results.elapsed:.3f}s")
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_goal_seek_many_chained(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        rows = 10
+        # price in A, cost in B depends on A, margin in C depends on B
+        with sheet.batch():
+            for row in range(rows):
+                sheet.set_val(value=10, col=0, row=row)
+                sheet.set_val(value=f"=A{row + 1}*1.2+5", col=1, row=row)
+                sheet.set_val(value=f"=B{row + 1}*2-A{row + 1}", col=2, row=row)
+
+        # C = (A * 1.2 + 5) * 2 - A = 1.4 * A + 10
+        specs = [(f"C{row + 1}", f"A{row + 1}", 24.0 + row * 1.4) for row in range(rows)]
+        results = sheet.goal_seek_many(specs, apply=True)
+        assert results.get_failed() == []
+        for row in range(rows):
+            assert results.results[row] == pytest.approx(10.0 + row, rel=1e-6)
+            assert sheet.get_val(col=2, row=row) == pytest.approx(24.0 + row * 1.4, rel=1e-6)
+        assert doc.qi(XCalculatable, True).isAutomaticCalculationEnabled()
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_goal_seek_many_pool(loader, soffice_path, soffice_env):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        rows = 9
+        with sheet.batch():
+            for row in range(rows):
+                sheet.set_val(value=1, col=0, row=row)
+                sheet.set_val(value=f"=A{row + 1}*3+1", col=1, row=row)
+        # last spec has no formula cell
+        specs = [(f"B{row + 1}", f"A{row + 1}", row * 3 + 1.0) for row in range(rows)] + [("D1", "A1", 5)]
+        expected = sheet.goal_seek_many(specs)
+
+        with OfficePool(size=2, soffice=soffice_path, env_vars=soffice_env, profile_path="") as pool:
+            results = sheet.goal_seek_many(specs, apply=True, pool=pool)
+        assert len(results) == rows + 1
+        assert results.get_failed() == expected.get_failed() == [rows]
+        assert results.results[:rows] == pytest.approx(expected.results[:rows])
+        for row in range(rows):
+            assert sheet.get_val(col=0, row=row) == pytest.approx(float(row))
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.format.calc.direct.cell.background import Color as BgColor
+from ooodev.utils.color import StandardColor
+from ooodev.utils.data_type.range_obj import RangeObj
+from ooodev.utils.data_type.range_set import RangeSet
+
+
+def test_set_style_ranges(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        # checkerboard of 10 x 10 cells
+        cells = [f"{'ABCDEFGHIJ'[col]}{row + 1}" for row in range(10) for col in range(10) if (row + col) % 2 == 0]
+        sheet.set_style_ranges(cells, [BgColor(StandardColor.GREEN_LIGHT2)])
+        assert sheet.get_cell(cell_name="A1").component.CellBackColor == StandardColor.GREEN_LIGHT2
+        assert sheet.get_cell(cell_name="B2").component.CellBackColor == StandardColor.GREEN_LIGHT2
+        assert sheet.get_cell(cell_name="B1").component.CellBackColor != StandardColor.GREEN_LIGHT2
+
+        rs = RangeSet([RangeObj.from_range("D12:F14"), RangeObj.from_range("E13:H13")])
+        sheet.set_style_ranges(rs, [BgColor(StandardColor.BLUE_LIGHT2)])
+        for name in ("D12", "F14", "H13"):
+            assert sheet.get_cell(cell_name=name).component.CellBackColor == StandardColor.BLUE_LIGHT2
+        assert sheet.get_cell(cell_name="G12").component.CellBackColor != StandardColor.BLUE_LIGHT2
+
+        # nothing to style
+        sheet.set_style_ranges([], [BgColor(StandardColor.RED)])
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.office.calc import Calc
+from ooodev.utils.data_type.cell_obj import CellObj
+
+
+def test_calc_formula_array(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.set_array(values=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], name="A1")
+
+        formulas = [[f"=A{row}*B{row}"] for row in range(1, 4)]
+        Calc.set_formula_array(formulas, sheet.component, "C1")
+        assert Calc.get_formula_array(sheet.component, "C1:C3") == (("=A1*B1",), ("=A2*B2",), ("=A3*B3",))
+        assert sheet.get_array(range_name="C1:C3") == ((2.0,), (12.0,), (30.0,))
+
+        Calc.set_formula_array([["=SUM(A1:A3)", "=SUM(B1:B3)"]], sheet.component, 0, 4, 1, 4)
+        assert Calc.get_formula_array(sheet.component, 0, 4, 1, 4) == (("=SUM(A1:A3)", "=SUM(B1:B3)"),)
+
+        sheet.set_formula_array(formulas=[["=C1+1"]], cell_obj=CellObj.from_cell("D1"))
+        assert sheet.get_formula_array(range_name="D1") == (("=C1+1",),)
+
+        # non formula cells are returned as strings
+        assert Calc.get_formula_array(sheet.component, "A1:B1") == (("1", "2"),)
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_cell_range_formulas(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.set_array(values=[[1.0], [2.0]], name="A1")
+        rng = sheet.get_range(range_name="B1:B2")
+        rng.formulas = [["=A1*10"], ["=A2*10"]]
+        assert rng.formulas == (("=A1*10",), ("=A2*10",))
+        assert rng.get_array() == ((10.0,), (20.0,))
+    finally:
+        if doc is not None:
+            doc.close()
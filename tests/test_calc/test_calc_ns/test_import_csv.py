@@ -0,0 +1,84 @@
+from __future__ import annotations
+from typing import Any, List
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.cancel_event_args import CancelEventArgs
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.calc_named_event import CalcNamedEvent
+from ooodev.exceptions import ex as mEx
+
+
+def test_import_csv(loader, tmp_path: Path):
+    pth = tmp_path / "data.csv"
+    lines = ["Name,Qty,When"] + [f"item {i},{i},2024-01-{i + 1:02d}" for i in range(25)]
+    pth.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    progress: List[dict] = []
+
+    def on_progress(source: Any, args: EventArgs) -> None:
+        progress.append(dict(args.event_data))
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.subscribe_event(CalcNamedEvent.CSV_IMPORT_PROGRESS, on_progress)
+        rng = sheet.import_csv(pth, "B2", chunk_rows=10, max_workers=0)
+        assert rng is not None
+        assert str(rng.range_obj) == "B2:D27"
+        assert sheet.get_val(cell_name="B2") == "Name"
+        assert sheet.get_val(cell_name="C3") == 0.0
+        assert sheet.get_val(cell_name="B27") == "item 24"
+        assert sheet.get_val(cell_name="D3") == 45292.0
+
+        assert len(progress) == 3
+        assert progress[-1]["rows"] == 26
+        assert progress[-1]["bytes_read"] == progress[-1]["total_bytes"] == pth.stat().st_size
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_import_tsv_process_pool(loader, tmp_path: Path):
+    pth = tmp_path / "data.tsv"
+    pth.write_text("a\t1\nb\t2\n\nc\t3\td\n", encoding="utf-8")
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        rng = sheet.import_csv(pth, "A1", chunk_rows=2, max_workers=2)
+        assert rng is not None
+        assert str(rng.range_obj) == "A1:C4"
+        assert sheet.get_array(range_name="A1:C4") == (
+            ("a", 1.0, ""),
+            ("b", 2.0, ""),
+            ("", "", ""),
+            ("c", 3.0, "d"),
+        )
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_import_csv_cancel(loader, tmp_path: Path):
+    pth = tmp_path / "data.csv"
+    pth.write_text("1,2\n", encoding="utf-8")
+
+    def on_importing(source: Any, args: CancelEventArgs) -> None:
+        args.cancel = True
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.subscribe_event(CalcNamedEvent.CSV_IMPORTING, on_importing)
+        with pytest.raises(mEx.CancelEventError):
+            sheet.import_csv(pth, "A1")
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pd = pytest.importorskip("pandas")
+
+from ooodev.calc import CalcDoc
+
+
+def test_write_and_read_dataframe(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        df = pd.DataFrame(
+            {
+                "Name": ["a", "b", "c"],
+                "Qty": [1.0, None, 3.0],
+                "Price": [2.5, 3.5, 4.5],
+                "When": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            }
+        )
+        rng = sheet.write_dataframe(df, "B2")
+        assert str(rng.range_obj) == "B2:E5"
+        assert sheet.get_val(cell_name="B2") == "Name"
+        assert sheet.get_val(cell_name="C3") == 1.0
+
+        df2 = rng.to_dataframe()
+        assert list(df2.columns) == ["Name", "Qty", "Price", "When"]
+        assert list(df2["Name"]) == ["a", "b", "c"]
+        assert df2["Price"].tolist() == [2.5, 3.5, 4.5]
+        assert pd.isna(df2["Qty"][1])
+        assert df2["When"][0] == pd.Timestamp(2024, 1, 1)
+        assert pd.isna(df2["When"][2])
+
+        rng = sheet.write_dataframe(df, "H1", header=False, format_dates=False)
+        assert str(rng.range_obj) == "H1:K3"
+        df3 = rng.to_dataframe(header=False)
+        assert df3[3].tolist()[:2] == [45292.0, 45293.0]
+    finally:
+        if doc is not None:
+            doc.close()
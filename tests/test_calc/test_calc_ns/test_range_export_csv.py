@@ -0,0 +1,171 @@
+from __future__ import annotations
+import csv
+import time
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.office.calc import Calc
+from ooodev.utils.props import Props
+
+
+def _read_csv(pth: Path, delimiter: str = ",") -> list:
+    with open(pth, "r", encoding="utf-8", newline="") as f:
+        return list(csv.reader(f, delimiter=delimiter))
+
+
+def test_export_csv(loader, tmp_path: Path):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.set_array(
+            values=(("Name", "Qty", "Price"), ("a, b", 1.0, 2.5), ('say "hi"', 2.0, ""), ("c", 30.0, 4.25)),
+            name="A1",
+        )
+        rng = sheet.get_range(range_name="A1:C4")
+        pth = tmp_path / "range.csv"
+        rng.export_csv(pth, chunk_rows=2)
+        rows = _read_csv(pth)
+        assert rows == [["Name", "Qty", "Price"], ["a, b", "1", "2.5"], ['say "hi"', "2", ""], ["c", "30", "4.25"]]
+
+        # same values as the office csv filter for a sheet with default number formats
+        office_pth = tmp_path / "office.csv"
+        doc.save_doc(office_pth)
+        assert _read_csv(office_pth) == rows
+
+        pth = tmp_path / "range.tsv"
+        rng.export_csv(pth, delimiter="\t", quoting=csv.QUOTE_ALL, line_terminator="\n")
+        text = pth.read_text(encoding="utf-8")
+        assert text.splitlines()[0] == '"Name"\t"Qty"\t"Price"'
+        assert _read_csv(pth, delimiter="\t") == rows
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_export_csv_dates(loader, tmp_path: Path):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        pth = tmp_path / "data.csv"
+        pth.write_text("When,Qty\n2024-01-31,1\n2024-02-01 12:30:00,2\n", encoding="utf-8")
+        rng = sheet.import_csv(pth, "A1", max_workers=0)
+        assert rng is not None
+        out = tmp_path / "out.csv"
+        rng.export_csv(out)
+        assert _read_csv(out) == [["When", "Qty"], ["2024-01-31", "1"], ["2024-02-01 12:30:00", "2"]]
+
+        rng.export_csv(out, dates_as_iso=False)
+        assert _read_csv(out)[1] == ["45322", "1"]
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_export_parquet(loader, tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        values = [("Name", "Qty")] + [(f"item {i}", float(i)) for i in range(25)]
+        sheet.set_array(values=values, name="A1")
+        rng = sheet.get_range(range_name="A1:B26")
+        pth = tmp_path / "range.parquet"
+        rng.export_parquet(pth, chunk_rows=10)
+        pf = pq.ParquetFile(pth)
+        assert pf.metadata.num_rows == 25
+        assert pf.metadata.num_row_groups == 3
+        table = pf.read()
+        assert table.column_names == ["Name", "Qty"]
+        assert table.column("Name").to_pylist()[24] == "item 24"
+        assert table.column("Qty").to_pylist() == [float(i) for i in range(25)]
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_export_parquet_text_later(loader, tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        values = [("Name", "Qty")] + [(f"item {i}", float(i)) for i in range(25)]
+        values[22] = ("item 21", "n/a")
+        sheet.set_array(values=values, name="A1")
+        rng = sheet.get_range(range_name="A1:B26")
+        pth = tmp_path / "range.parquet"
+        rng.export_parquet(pth, chunk_rows=10)
+        table = pq.read_table(pth)
+        assert table.num_rows == 25
+        assert str(table.schema.field("Qty").type) == "string"
+        qty = table.column("Qty").to_pylist()
+        assert qty[0] == "0"
+        assert qty[21] == "n/a"
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_export_dates_first_data_row(loader, tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        # a totals row without a date format does not change the date columns.
+        sheet.set_array(values=(("When", "Qty"), (45322.0, 1.0), (45323.0, 2.0), (90645.0, 3.0)), name="A1")
+        date_key = Calc.get_date_format_key(doc.component)
+        Props.set(sheet.get_range(range_name="A2:A3").component, NumberFormat=date_key)
+        rng = sheet.get_range(range_name="A1:B4")
+
+        pth = tmp_path / "dates.csv"
+        rng.export_csv(pth)
+        assert _read_csv(pth)[1] == ["2024-01-31", "1"]
+
+        pth = tmp_path / "dates.parquet"
+        rng.export_parquet(pth)
+        table = pq.read_table(pth)
+        assert table.column("When").to_pylist()[0] == datetime(2024, 1, 31)
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_export_csv_time(loader, tmp_path: Path, capsys):
+    # compares export_csv() with storing the document with the office csv filter.
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        count = 20_000
+        values = [("Name", "A", "B", "C")] + [(f"item {i}", float(i), i / 4, float(i % 7)) for i in range(count)]
+        sheet.set_array(values=values, name="A1")
+        rng = sheet.get_range(range_name=f"A1:D{count + 1}")
+
+        pth = tmp_path / "range.csv"
+        start = time.perf_counter()
+        rng.export_csv(pth)
+        range_time = time.perf_counter() - start
+
+        office_pth = tmp_path / "office.csv"
+        start = time.perf_counter()
+        doc.save_doc(office_pth)
+        office_time = time.perf_counter() - start
+
+        assert _read_csv(pth) == _read_csv(office_pth)
+        with capsys.disabled():
+            print(
+                f"\nexport_csv() {count} rows: {range_time:.3f}s, office csv filter {office_time:.3f}s "
+                f"({count / range_time:,.0f} and {count / office_time:,.0f} rows/s)"
+            )
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.office.calc import Calc
+
+
+def _tbl_data(rows: int = 25, cols: int = 4):
+    return [[float(row * cols + col) for col in range(cols)] for row in range(rows)]
+
+
+def test_calc_iter_array(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data()
+        sheet.set_array(values=vals, name="B2")
+
+        chunks = list(Calc.iter_array(sheet.component, "B2:E26", chunk_rows=10))
+        assert len(chunks) == 3
+        assert [str(rng) for rng, _ in chunks] == ["B2:E11", "B12:E21", "B22:E26"]
+        assert [len(block) for _, block in chunks] == [10, 10, 5]
+
+        rows = [list(row) for _, block in chunks for row in block]
+        assert rows == vals
+
+        with pytest.raises(ValueError):
+            Calc.iter_array(sheet.component, "B2:E26", chunk_rows=0)
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_cell_range_iter_rows(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data()
+        sheet.set_array(values=vals, name="A1")
+
+        rng = sheet.get_range(range_name="A1:D25")
+        rows = [list(row) for row in rng.iter_rows(chunk_rows=7)]
+        assert rows == vals
+        assert rows == [list(row) for row in rng.get_array()]
+
+        blocks = list(sheet.iter_array(range_name="A1:D25", chunk_rows=25))
+        assert len(blocks) == 1
+        assert str(blocks[0][0]) == "A1:D25"
+    finally:
+        if doc is not None:
+            doc.close()
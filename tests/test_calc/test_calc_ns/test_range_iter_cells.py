@@ -0,0 +1,54 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.utils.data_type.range_obj import RangeObj
+
+
+def test_range_iter_cells(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        values = [[float(row * 3 + col) for col in range(3)] for row in range(25)]
+        sheet.set_array(values=values, name="B2")
+        sheet.set_val(value="=B2*2", cell_name="E2")
+
+        rng = sheet.get_range(range_name="B2:D26")
+        handles = list(rng.iter_cells(chunk_rows=10))
+        assert len(handles) == 75
+        assert [h.value for h in handles] == [v for row in values for v in row]
+        first = handles[0]
+        assert (first.col, first.row, first.sheet_idx) == (1, 1, 0)
+        assert str(first.cell_obj) == "B2"
+        last = handles[-1]
+        assert str(last.cell_obj) == "D26"
+        assert last.formula == "74"
+
+        # handles of a block share the same values
+        assert handles[0]._block is handles[29]._block
+        assert handles[0]._block is not handles[30]._block
+
+        cell = handles[4].get_cell()
+        assert str(cell.cell_obj) == "C3"
+        assert cell.value == handles[4].value
+
+        rng = sheet.get_range(range_name="E2:E2")
+        handle = next(rng.iter_cells())
+        assert handle.formula == "=B2*2"
+        assert handle.value == 0.0
+
+        handles = list(sheet.iter_cells(range_obj=RangeObj.from_range("B2:C3")))
+        assert [str(h.cell_obj) for h in handles] == ["B2", "C2", "B3", "C3"]
+        handles = list(sheet.iter_cells())
+        assert str(handles[0].cell_obj) == "B2"
+        assert str(handles[-1].cell_obj) == "E26"
+
+        with pytest.raises(ValueError):
+            next(rng.iter_cells(chunk_rows=0))
+    finally:
+        if doc is not None:
+            doc.close()
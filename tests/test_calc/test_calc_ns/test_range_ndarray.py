@@ -0,0 +1,55 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+np = pytest.importorskip("numpy")
+
+from ooodev.calc import CalcDoc
+from ooodev.office.calc import Calc
+
+
+def test_calc_get_ndarray(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.set_array(values=[[1.0, 2.0, 3.0], [4.0, "text", ""]], name="A1")
+
+        arr = Calc.get_ndarray(sheet.component, "A1:C2")
+        assert arr.shape == (2, 3)
+        assert arr[0].tolist() == [1.0, 2.0, 3.0]
+        assert np.isnan(arr[1, 1])
+        assert np.isnan(arr[1, 2])
+
+        arr, mask = sheet.get_ndarray(range_name="A1:C2", with_mask=True)
+        assert mask.tolist() == [[False, False, False], [False, True, True]]
+
+        arr = sheet.get_range(range_name="A1:C2").get_ndarray(dtype=np.int64)
+        assert arr.tolist() == [[1, 2, 3], [4, 0, 0]]
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_calc_set_ndarray(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        arr = np.arange(12, dtype=np.float64).reshape(4, 3)
+        arr[2, 1] = np.nan
+        Calc.set_ndarray(arr, sheet.component, "B2")
+        result = sheet.get_ndarray(range_name="B2:D5")
+        assert np.array_equal(result, arr, equal_nan=True)
+
+        rng = sheet.get_range(range_name="F1:G2")
+        rng.set_ndarray(np.array([[1, 2], [3, 4]]))
+        assert rng.get_array() == ((1.0, 2.0), (3.0, 4.0))
+
+        with pytest.raises(ValueError):
+            rng.set_ndarray(np.arange(3))
+    finally:
+        if doc is not None:
+            doc.close()
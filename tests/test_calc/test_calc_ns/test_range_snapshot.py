@@ -0,0 +1,37 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+
+
+def test_snapshot_apply_patch(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        values = [[float(row * 10 + col) for col in range(10)] for row in range(20)]
+        sheet.set_array(values=values, name="B2")
+        rng = sheet.get_range(range_name="B2:K21")
+        snapshot = rng.get_snapshot()
+        assert snapshot.values == tuple(tuple(row) for row in values)
+
+        new = [list(row) for row in values]
+        new[0][0] = "changed"
+        new[5][3] = -1.0
+        new[6][3] = -2.0
+        patches = snapshot.diff(new)
+        assert [str(p.range_obj) for p in patches] == ["B2:B2", "E7:E8"]
+
+        # a cell outside the patches that is changed on the sheet is not overwritten
+        sheet.set_val(value=999.0, cell_name="K21")
+        assert rng.apply_patch(patches) == 3
+        assert sheet.get_val(cell_name="B2") == "changed"
+        assert sheet.get_val(cell_name="E7") == -1.0
+        assert sheet.get_val(cell_name="E8") == -2.0
+        assert sheet.get_val(cell_name="K21") == 999.0
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.utils.data_type.range_obj import RangeObj
+
+
+def test_search_values(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        values = [[f"INV-{row:06d}" if col == 0 else float(row * col) for col in range(3)] for row in range(200)]
+        sheet.set_array(values=values, name="A1")
+
+        cells = sheet.search_values(r"^INV-0001\d\d$")
+        assert [str(c) for c in cells] == [f"A{row + 1}" for row in range(100, 200)]
+        assert all(c.sheet_idx == 0 for c in cells)
+
+        cells = sheet.search_values("inv-000005", regex=False, whole_cell=True)
+        assert [str(c) for c in cells] == ["A6"]
+
+        rng = RangeObj.from_range("B1:C10")
+        cells = sheet.search_values("^18$", range_obj=rng)
+        assert [str(c) for c in cells] == ["C10"]
+
+        cache = sheet.used_area_cache
+        snapshot = cache.get_snapshot()
+        assert cache.get_snapshot() is snapshot
+
+        # modifying the sheet invalidates the cached values
+        sheet.set_val(value="INV-999999", cell_name="A1")
+        assert [str(c) for c in sheet.search_values("INV-999999")] == ["A1"]
+        assert cache.get_snapshot() is not snapshot
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from typing import Any, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.events.args.event_args import EventArgs
+from ooodev.events.calc_named_event import CalcNamedEvent
+from ooodev.events.lo_events import LoEvents
+
+
+def _tbl_data(rows: int = 23, cols: int = 5):
+    return [[float(row * cols + col) for col in range(cols)] for row in range(rows)]
+
+
+def test_set_array_chunked(loader):
+    doc = None
+    chunks: List[dict] = []
+
+    def on_chunk(source: Any, args: EventArgs) -> None:
+        chunks.append(args.event_data)
+
+    LoEvents().on(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, on_chunk)
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data()
+        # 5 columns, 50 cells per block -> 10 rows per block
+        sheet.set_array(values=vals, name="B3", chunk_cells=50)
+
+        assert len(chunks) == 3
+        assert [str(c["range_obj"]) for c in chunks] == ["B3:F12", "B13:F22", "B23:F25"]
+        assert [c["rows"] for c in chunks] == [10, 10, 3]
+        assert [c["cells"] for c in chunks] == [50, 50, 15]
+        assert all(c["elapsed"] >= 0.0 for c in chunks)
+
+        result = [list(row) for row in sheet.get_array(range_name="B3:F25")]
+        assert result == vals
+        assert doc.lo_inst.has_controllers_locked() is False
+    finally:
+        LoEvents().remove(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, on_chunk)
+        if doc is not None:
+            doc.close()
+
+
+def test_set_array_chunked_min_one_row(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data(rows=4)
+        # budget smaller than a row still writes one row per block
+        rng = sheet.get_range(range_name="A1:E4")
+        rng.set_array(values=vals, chunk_cells=2)
+        assert [list(row) for row in rng.get_array()] == vals
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_set_array_chunked_other_doc(loader):
+    doc1 = None
+    doc2 = None
+    states: List[tuple] = []
+    try:
+        doc1 = CalcDoc.create_doc(loader=loader)
+        # doc2 is created last and is the current document, doc1 is written to.
+        doc2 = CalcDoc.create_doc(loader=loader)
+
+        def on_chunk(source: Any, args: EventArgs) -> None:
+            states.append(
+                (
+                    doc1.component.hasControllersLocked(),
+                    doc1.component.isAutomaticCalculationEnabled(),
+                    doc2.component.hasControllersLocked(),
+                    doc2.component.isAutomaticCalculationEnabled(),
+                )
+            )
+
+        LoEvents().on(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, on_chunk)
+        try:
+            doc1.sheets[0].set_array(values=_tbl_data(rows=4), name="A1", chunk_cells=10)
+        finally:
+            LoEvents().remove(CalcNamedEvent.ARRAY_CHUNK_WRITTEN, on_chunk)
+
+        assert states
+        assert all(state == (True, False, False, True) for state in states)
+        assert doc1.component.hasControllersLocked() is False
+        assert doc1.component.isAutomaticCalculationEnabled()
+    finally:
+        for doc in (doc2, doc1):
+            if doc is not None:
+                doc.close()
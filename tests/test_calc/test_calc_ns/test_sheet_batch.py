@@ -0,0 +1,46 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+from ooodev.format.calc.direct.cell.font import Font
+
+
+def test_sheet_batch(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        bold = Font(b=True)
+        with sheet.batch() as buf:
+            for row in range(10):
+                sheet.set_val(value=row, col=0, row=row)
+                sheet.set_val(value=row * 2, col=1, row=row)
+                sheet.set_val(value=f"=A{row + 1}+B{row + 1}", col=2, row=row)
+            sheet.set_row(values=["a", "b"], cell_name="E1")
+            buf.set_val(value="Total", cell_name="A12", styles=[bold])
+            # nothing written yet
+            assert sheet.get_val(cell_name="A1") is None
+            assert len(buf) == 33
+
+        assert sheet.get_array(range_name="A1:C2") == ((0.0, 0.0, 0.0), (1.0, 2.0, 3.0))
+        assert sheet.get_formula_array(range_name="C10") == (("=A10+B10",),)
+        assert sheet.get_array(range_name="E1:F1") == (("a", "b"),)
+        assert sheet.get_val(cell_name="A12") == "Total"
+        assert sheet.get_cell(cell_name="A12").component.CharWeight > 100.0
+
+        # exception discards recorded values
+        with pytest.raises(ValueError):
+            with sheet.batch():
+                sheet.set_val(value=99, cell_name="H1")
+                raise ValueError("stop")
+        assert sheet.get_val(cell_name="H1") is None
+
+        # outside of batch writes are immediate
+        sheet.set_val(value=1, cell_name="H2")
+        assert sheet.get_val(cell_name="H2") == 1.0
+    finally:
+        if doc is not None:
+            doc.close()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+
+
+def test_used_area_cache(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        sheet.set_array(values=[[1, 2], [3, 4]], name="B2")
+        cache = sheet.used_area_cache
+        cache.reset_stats()
+
+        rng = sheet.find_used_range_obj()
+        assert str(rng) == "B2:C3"
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        rng = sheet.find_used_range_obj()
+        assert str(rng) == "B2:C3"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # another wrapper of the same sheet shares the cache
+        sheet2 = doc.sheets[0]
+        assert sheet2.used_area_cache is cache
+        assert str(sheet2.find_used_range().range_obj) == "B2:C3"
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # modifying the sheet invalidates the cache
+        sheet.set_val(value=5, cell_name="E6")
+        assert not cache.is_valid
+        assert str(sheet.find_used_range_obj()) == "B2:E6"
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # opt out
+        assert str(sheet.find_used(use_cache=False).range_obj) == "B2:E6"
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        # passing a range does not use the cache
+        sheet.find_used_range_obj("A1:C3")
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        other = doc.sheets.insert_sheet("Other")
+        assert other.used_area_cache is not cache
+    finally:
+        if doc is not None:
+            doc.close()
@@ -1,5 +1,7 @@
 from unittest.mock import patch
+import os
 from pathlib import Path
+import shutil
 import pytest
 
 if __name__ == "__main__":
@@ -67,3 +69,91 @@ def test_copy_profile(tmp_path_fn: Path, fixture_path: Path) -> None:
 
     c.del_working_dir()
     assert working_dir.exists() is False
+
+
+def test_template_profile(tmp_path_fn: Path, fixture_path: Path) -> None:
+    template = Path(tmp_path_fn, "template")
+    working_dir = Path(tmp_path_fn, "LO1")
+    working_dir.mkdir()
+    c = Cache(working_dir=working_dir, profile_path=template, template=True)
+    assert c.template is True
+    # no template yet, office starts with a new profile
+    c.copy_cache_to_profile()
+    assert c._profile_cached is False
+    assert c.user_profile.is_dir()
+
+    # what office writes into the new profile
+    shutil.copytree(Path(fixture_path, "dummy_profile"), c.user_profile, dirs_exist_ok=True)
+    Path(c.user_profile, ".lock").write_text("lock")
+    Path(c.user_profile, "4/user/extensions").mkdir()
+    Path(c.user_profile, "4/user/extensions/ext.txt").write_text("ext")
+    Path(c.user_profile, "4/user/registrymodifications.xcu").write_text("<xml/>")
+    c.cache_profile()
+    assert Path(template, "4/user/data.txt").is_file()
+    assert Path(template, ".lock").exists() is False
+    assert Path(template, "4/user/extensions").exists() is False
+    assert list(tmp_path_fn.glob("*.tmp")) == []
+
+    for mode in ("auto", "hardlink", "copy"):
+        working_dir = Path(tmp_path_fn, f"LO_{mode}")
+        working_dir.mkdir()
+        c = Cache(working_dir=working_dir, profile_path=template, template=True, link_mode=mode)
+        c.copy_cache_to_profile()
+        assert c._profile_cached is True
+        assert c.provision_time >= 0.0
+        data = Path(c.user_profile, "4/user/data.txt")
+        registry = Path(c.user_profile, "4/user/registrymodifications.xcu")
+        assert data.read_text() == Path(template, "4/user/data.txt").read_text()
+        assert registry.read_text() == "<xml/>"
+        # registry is rewritten by office and must never be shared with the template
+        assert registry.stat().st_nlink == 1
+        if mode == "copy":
+            assert data.stat().st_nlink == 1
+        c.cache_profile()
+        c.del_working_dir()
+        assert working_dir.exists() is False
+
+
+def test_template_profile_keep_extensions(tmp_path_fn: Path) -> None:
+    template = Path(tmp_path_fn, "template")
+    working_dir = Path(tmp_path_fn, "LO1")
+    working_dir.mkdir()
+    c = Cache(working_dir=working_dir, profile_path=template, template=True, keep_extensions=True)
+    c.copy_cache_to_profile()
+    Path(c.user_profile, "user/extensions").mkdir(parents=True)
+    Path(c.user_profile, "user/extensions/ext.txt").write_text("ext")
+    c.cache_profile()
+    assert Path(template, "user/extensions/ext.txt").is_file()
+
+    with pytest.raises(ValueError):
+        Cache(link_mode="symlink")
+
+
+def test_template_profile_default_path(tmp_path_fn: Path) -> None:
+    soffice = Path(tmp_path_fn, "program/soffice")
+    soffice.parent.mkdir()
+    soffice.write_text("")
+    c1 = Cache(template=True, soffice=soffice)
+    c2 = Cache(template=True, soffice=soffice)
+    assert c1.profile_path == c2.profile_path
+    assert c1.profile_path is not None
+    assert c1.profile_path.parent.parent == Cache._get_user_cache_dir()
+    # updating office gives a new template
+    Path(soffice.parent, "versionrc").write_text("[Version]")
+    assert Cache(template=True, soffice=soffice).profile_path != c1.profile_path
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_template_profile_not_trusted(tmp_path_fn: Path, fixture_path: Path) -> None:
+    template = Path(tmp_path_fn, "template")
+    shutil.copytree(Path(fixture_path, "dummy_profile"), template)
+    template.chmod(0o777)
+    working_dir = Path(tmp_path_fn, "LO")
+    working_dir.mkdir()
+    c = Cache(working_dir=working_dir, profile_path=template, template=True)
+    c.copy_cache_to_profile()
+    # a template others can write to is not cloned
+    assert c.user_profile.is_dir()
+    assert list(c.user_profile.iterdir()) == []
+    c.cache_profile()
+    assert Path(template, "4/user/data.txt").is_file()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from concurrent.futures import CancelledError
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.office_pool import OfficePool
+from ooodev.loader.inst.lo_inst import LoInst
+
+
+def _get_pid(lo_inst: LoInst) -> int:
+    return lo_inst.bridge_connector.get_soffice_pid()  # type: ignore
+
+
+def _set_get_val(lo_inst: LoInst, value: float) -> float:
+    from ooodev.calc import CalcDoc
+
+    doc = CalcDoc.create_doc(lo_inst=lo_inst)
+    try:
+        sheet = doc.sheets[0]
+        sheet.set_val(value=value, cell_name="A1")
+        sheet.set_val(value="=A1*2", cell_name="B1")
+        return sheet.get_val(cell_name="B1")
+    finally:
+        doc.close()
+
+
+def test_office_pool(soffice_path, soffice_env) -> None:
+    with OfficePool(size=2, max_jobs=3, soffice=soffice_path, env_vars=soffice_env, profile_path="") as pool:
+        results = list(pool.map(_set_get_val, range(8)))
+        assert results == [float(i * 2) for i in range(8)]
+        assert pool.completed == 8
+        # each instance is recycled after 3 jobs
+        assert pool.restarts >= 2
+        assert pool.killed == 0
+        # two starts and at least two restarts
+        assert len(pool.startup_times) >= 4
+        assert all(startup.total > 0.0 for startup in pool.startup_times)
+        assert all(startup.report is not None for startup in pool.startup_times)
+
+        pids = {pool.submit(_get_pid).result() for _ in range(4)}
+        assert len(pids) >= 1
+        assert all(pid > 0 for pid in pids)
+
+        with pytest.raises(ZeroDivisionError):
+            pool.submit(lambda lo_inst: 1 / 0).result()
+        # a failed job does not stop the pool
+        assert pool.submit(_set_get_val, 4).result() == 8.0
+    with pytest.raises(RuntimeError):
+        pool.submit(_get_pid)
+
+
+def test_office_pool_timeout(soffice_path, soffice_env) -> None:
+    with OfficePool(size=1, job_timeout=2.0, soffice=soffice_path, env_vars=soffice_env, profile_path="") as pool:
+        pid = pool.submit(_get_pid).result()
+        with pytest.raises(TimeoutError):
+            pool.submit(lambda lo_inst: time.sleep(10)).result()
+        assert pool.killed == 1
+        # instance is replaced
+        assert pool.submit(_get_pid).result() != pid
+        assert pool.submit(_set_get_val, 2).result() == 4.0
+
+
+def test_office_pool_cancel(soffice_path, soffice_env) -> None:
+    pool = OfficePool(size=1, soffice=soffice_path, env_vars=soffice_env, profile_path="")
+    pool.start()
+    slow = pool.submit(lambda lo_inst: time.sleep(1))
+    waiting = [pool.submit(_get_pid) for _ in range(3)]
+    pool.shutdown(wait=True, cancel_jobs=True)
+    assert slow.result() is None
+    for future in waiting:
+        with pytest.raises(CancelledError):
+            future.result()
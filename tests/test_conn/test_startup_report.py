@@ -0,0 +1,44 @@
+from __future__ import annotations
+import itertools
+import json
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.startup_report import StartupReport
+
+
+def test_startup_report() -> None:
+    report = StartupReport(spawn=0.01, accept=1.5, resolve=0.2, desktop=0.05, attempts=2, probes=30)
+    assert report.total == pytest.approx(1.76)
+    d = report.to_dict()
+    assert d["accept"] == 1.5
+    assert d["attempts"] == 2
+    assert d["total"] == pytest.approx(1.76)
+    assert json.loads(json.dumps(d)) == d
+    assert "attempts 2" in str(report)
+    assert StartupReport().total == 0.0
+
+
+def test_connect_startup_report(loader) -> None:
+    from ooodev.conn.connect import LoBridgeCommon, LoPipeStart
+    from ooodev.loader.lo import Lo
+
+    conn = Lo.bridge_connector
+    if not isinstance(conn, LoBridgeCommon):
+        pytest.skip("Not a bridge connection")
+    report = conn.startup_report
+    assert report.attempts >= 1
+    assert report.resolve > 0.0
+    if report.spawn > 0.0:
+        # office was started by the loader
+        assert report.accept > 0.0
+
+    sleeps = list(itertools.islice(LoPipeStart()._get_try_sleeps(), 10))
+    assert sleeps[0] == pytest.approx(0.01)
+    assert sleeps[1] == pytest.approx(0.02)
+    assert sleeps[-1] == pytest.approx(0.5)
+    assert sleeps == sorted(sleeps)
+    probe_sleeps = list(itertools.islice(LoPipeStart()._get_try_sleeps(0.05), 10))
+    assert max(probe_sleeps) == pytest.approx(0.05)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import random
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc.sheet.cell_write_buffer import CellWriteBuffer
+from ooodev.utils.data_type.cell_obj import CellObj
+
+
+def _covered(rects):
+    cells = []
+    for col_start, row_start, col_end, row_end in rects:
+        cells.extend((col, row) for col in range(col_start, col_end + 1) for row in range(row_start, row_end + 1))
+    return cells
+
+
+def test_merge_cells() -> None:
+    assert CellWriteBuffer.merge_cells([]) == []
+    assert CellWriteBuffer.merge_cells([(2, 3)]) == [(2, 3, 2, 3)]
+    cells = [(0, 0), (1, 0), (0, 1), (1, 1), (3, 1)]
+    assert CellWriteBuffer.merge_cells(cells) == [(0, 0, 1, 1), (3, 1, 3, 1)]
+    # gap between rows is not merged
+    assert CellWriteBuffer.merge_cells([(0, 0), (0, 2)]) == [(0, 0, 0, 0), (0, 2, 0, 2)]
+    # full block
+    block = [(col, row) for col in range(10) for row in range(100)]
+    assert CellWriteBuffer.merge_cells(block) == [(0, 0, 9, 99)]
+
+
+def test_merge_cells_exact_cover() -> None:
+    rnd = random.Random(7)
+    for _ in range(500):
+        cells = {(rnd.randrange(10), rnd.randrange(10)) for _ in range(rnd.randrange(1, 60))}
+        covered = _covered(CellWriteBuffer.merge_cells(cells))
+        assert len(covered) == len(set(covered))
+        assert set(covered) == cells
+
+
+def test_get_blocks() -> None:
+    buf = CellWriteBuffer()
+    buf.set_val(value=1, cell_name="A1")
+    buf.set_val(value=2, cell_obj=CellObj.from_cell("B1"))
+    buf.set_row([3, 4], "A2")
+    buf.set_val(value=5, col=3, row=0)
+    assert len(buf) == 5
+
+    blocks = buf.get_blocks()
+    assert [(str(b.range_obj), b.values, b.formula) for b in blocks] == [
+        ("A1:B2", ((1.0, 2.0), (3, 4)), False),
+        ("D1:D1", ((5.0,),), False),
+    ]
+
+
+def test_get_blocks_formula_and_styles() -> None:
+    style1 = object()
+    style2 = object()
+    buf = CellWriteBuffer()
+    buf.set_col(["=1+1", "=2+2"], col_start=0, row_start=0)
+    buf.set_val(value=10, cell_name="B1", styles=[style1])
+    buf.set_val(value=11, cell_name="B2", styles=[style1])
+    buf.set_val(value=12, cell_name="C1", styles=[style2])
+
+    blocks = buf.get_blocks()
+    assert len(blocks) == 3
+    by_range = {str(b.range_obj): b for b in blocks}
+    assert by_range["A1:A2"].formula
+    assert by_range["A1:A2"].values == (("=1+1",), ("=2+2",))
+    assert by_range["A1:A2"].styles is None
+    assert by_range["B1:B2"].styles == (style1,)
+    assert by_range["C1:C1"].styles == (style2,)
+
+
+def test_last_write_wins() -> None:
+    buf = CellWriteBuffer()
+    buf.set_row([1, 2, 3], col_start=0, row_start=0)
+    buf.set_val(value="=A1*2", cell_name="B1")
+    blocks = buf.get_blocks()
+    assert {str(b.range_obj): b.values for b in blocks} == {
+        "A1:A1": ((1,),),
+        "C1:C1": ((3,),),
+        "B1:B1": (("=A1*2",),),
+    }
+    buf.clear()
+    assert len(buf) == 0
+    assert buf.get_blocks() == []
+
+
+def test_styles_without_value() -> None:
+    style1 = object()
+    style2 = object()
+    buf = CellWriteBuffer()
+    buf.set_val(value=1, cell_name="A1", styles=[style1])
+    buf.set_val(value=None, cell_name="B1", styles=[style1])
+    buf.set_val(value=None, cell_name="B2", styles=[style1])
+    buf.set_val(value=None, cell_name="C1")
+    assert len(buf) == 3
+
+    blocks = buf.get_blocks()
+    assert [(str(b.range_obj), b.values, b.styles) for b in blocks] == [
+        ("A1:A1", ((1.0,),), (style1,)),
+        ("B1:B2", None, (style1,)),
+    ]
+    # styles of the same cell add up, like calling Calc.set_val() twice.
+    buf.set_val(value=None, cell_name="B1", styles=[style2])
+    assert {str(b.range_obj): b.styles for b in buf.get_blocks() if b.values is None} == {
+        "B1:B1": (style1, style2),
+        "B2:B2": (style1,),
+    }
+    buf.clear()
+    assert buf.get_blocks() == []
+
+
+def test_invalid_args() -> None:
+    buf = CellWriteBuffer()
+    with pytest.raises(TypeError):
+        buf.set_val(value=1)
+    with pytest.raises(TypeError):
+        buf.set_row([1, 2])
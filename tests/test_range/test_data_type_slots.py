@@ -0,0 +1,115 @@
+from __future__ import annotations
+import copy
+import pickle
+import tracemalloc
+from dataclasses import FrozenInstanceError, fields, make_dataclass
+from typing import Any, Callable, List, Tuple
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_no_instance_dict() -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ooodev.utils.data_type.col_obj import ColObj
+    from ooodev.utils.data_type.range_obj import RangeObj
+    from ooodev.utils.data_type.row_obj import RowObj
+
+    for obj in (
+        CellObj("B", 3, sheet_idx=-2),
+        RangeObj.from_range("B3:D12"),
+        ColObj("C"),
+        RowObj(4),
+    ):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_frozen() -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ooodev.utils.data_type.col_obj import ColObj
+
+    cell = CellObj("B", 3, sheet_idx=-2)
+    with pytest.raises(FrozenInstanceError):
+        cell.row = 5  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        cell.other = 5  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        ColObj("C").value = "D"  # type: ignore
+
+
+def test_eq_hash_copy_pickle() -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ooodev.utils.data_type.col_obj import ColObj
+    from ooodev.utils.data_type.range_obj import RangeObj
+    from ooodev.utils.data_type.row_obj import RowObj
+
+    cell = CellObj("b", 3, sheet_idx=-2)
+    assert cell == CellObj("B", 3, sheet_idx=-2)
+    assert hash(cell) == hash(CellObj("B", 3, sheet_idx=-2))
+    assert cell.right == "C3"
+
+    rng = RangeObj.from_range("D12:B3")
+    assert str(rng) == "B3:D12"
+    assert hash(rng) == hash(RangeObj.from_range("B3:D12"))
+
+    row = RowObj(4)
+    assert row.next == 5
+    col = ColObj("c")
+    assert col.next == "D"
+
+    # cached next and previous values hold weak references and are not pickled.
+    for obj in (cell, rng, row, col):
+        assert copy.copy(obj) == obj
+        assert copy.deepcopy(obj) == obj
+        assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_interned() -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ooodev.utils.data_type.col_obj import ColObj
+    from ooodev.utils.data_type.range_obj import RangeObj
+
+    assert ColObj.from_int(3) is ColObj.from_int(3)
+    assert ColObj.from_str("c") is ColObj.from_int(3)
+    assert CellObj("a", 1, sheet_idx=-2).col is CellObj("A", 2, sheet_idx=-2).col
+    assert RangeObj.from_range("a1:b2").col_start is CellObj("A", 7, sheet_idx=-2).col
+
+
+def _get_traced_size(make: Callable[[str, int], Any], args: List[Tuple[str, int]]) -> float:
+    # traced bytes per object, arguments are created before tracing so only the objects are counted.
+    tracemalloc.start()
+    try:
+        objs = [make(col, row) for col, row in args]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(objs) == len(args)
+    return size / len(args)
+
+
+def test_memory_per_cell_obj(capsys) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    # same fields as CellObj, with an instance dict.
+    base_cls = make_dataclass("CellObjDict", [f.name for f in fields(CellObj)], frozen=True)
+
+    def make_base(col: str, row: int) -> Any:
+        obj = base_cls(col, row, -2, None)
+        # Python 3.11+ only creates the dict when it is first used, cached values of CellObj use it.
+        vars(obj)
+        return obj
+
+    count = 10_000
+    cols = ("A", "B", "C", "D", "E")
+    args = [(cols[i % 5], i + 1) for i in range(count)]
+    per_obj = _get_traced_size(lambda col, row: CellObj(col, row, sheet_idx=-2), args)
+    per_base = _get_traced_size(make_base, args)
+    with capsys.disabled():
+        print(
+            f"\nCellObj: {per_obj:.0f} bytes per object, {per_obj * 1_000_000 / 2**20:.1f} MiB per 1M objects, "
+            f"{per_base:.0f} bytes with an instance dict"
+        )
+    assert per_obj < per_base
+    # nothing but the object itself is allocated, 32 bytes for the GC header and allocator alignment.
+    assert per_obj <= CellObj.__basicsize__ + 32
@@ -0,0 +1,48 @@
+from __future__ import annotations
+import math
+import pickle
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc.sheet.goal_seek_results import GoalSeekResults, GoalSeekSpec
+from ooodev.utils.data_type.cell_obj import CellObj
+
+
+def test_spec_positions() -> None:
+    assert GoalSeekSpec("C1", "A1", 10).get_positions() == (2, 0, 0, 0)
+    assert GoalSeekSpec("$AB$12", "b3", 1.5).get_positions() == (27, 11, 1, 2)
+    assert GoalSeekSpec(CellObj.from_cell("D5"), "Sheet1.E7", 0).get_positions() == (3, 4, 4, 6)
+    spec = GoalSeekSpec(*("C1", "A1", 10))
+    assert spec.target == 10
+
+
+def test_results() -> None:
+    results = GoalSeekResults(results=[1.0, 2.0, math.nan, 4.0], divergences=[0.0, 0.5, math.inf, 0.01], elapsed=1.25)
+    assert len(results) == 4
+    assert results.results.typecode == "d"
+    assert results.results.tolist()[:2] == [1.0, 2.0]
+    assert results.get_failed() == [1, 2]
+    assert results.converged_count == 2
+    assert results.is_converged(0)
+    assert not results.is_converged(2)
+    assert results.max_found_divergence == math.inf
+    assert results.elapsed == 1.25
+    assert [converged for _, _, converged in results] == [True, False, False, True]
+
+    strict = GoalSeekResults(results=results.results, divergences=results.divergences, max_divergence=0.001)
+    assert strict.get_failed() == [1, 2, 3]
+
+    restored = pickle.loads(pickle.dumps(results))
+    assert restored.results[:2] == results.results[:2]
+    assert restored.get_failed() == [1, 2]
+
+
+def test_results_empty() -> None:
+    results = GoalSeekResults(results=[], divergences=[])
+    assert len(results) == 0
+    assert results.get_failed() == []
+    assert results.max_found_divergence == 0.0
+    with pytest.raises(ValueError):
+        GoalSeekResults(results=[1.0], divergences=[])
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import random
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.data_type.range_obj import RangeObj
+from ooodev.utils.data_type.range_set import RangeSet
+
+
+def _cells(rects) -> set:
+    return {(c, r) for c0, r0, c1, r1 in rects for c in range(c0, c1 + 1) for r in range(r0, r1 + 1)}
+
+
+def _set_cells(rs: RangeSet) -> set:
+    return _cells([rect[1:] for rect in rs.get_indexes()])
+
+
+def _random_rects(rnd: random.Random, count: int, size: int = 30):
+    rects = []
+    for _ in range(count):
+        c0 = rnd.randint(0, size)
+        r0 = rnd.randint(0, size)
+        rects.append((c0, r0, c0 + rnd.randint(0, 6), r0 + rnd.randint(0, 6)))
+    return rects
+
+
+def test_basic() -> None:
+    rs = RangeSet(["A1:C3", "B2:D4"])
+    assert [str(rng) for rng in rs.coalesce()] == ["A1:C1", "A2:D3", "B4:D4"]
+    assert rs.cell_count == 14
+    assert (rs - RangeSet(["B2:C3"])).cell_count == 10
+    assert "D4" in rs
+    assert "A4" not in rs
+    assert "B2:C3" in rs
+    assert "C3:E3" not in rs
+    assert RangeObj.from_range("A1:C3") in rs
+    assert repr(RangeSet(["A1:B2"])) == "RangeSet(['A1:B2'])"
+    assert not RangeSet()
+    assert RangeSet(["A1:A2", "A3"]) == RangeSet(["A1:A3"])
+    assert hash(RangeSet(["B2", "A1:A2", "B1"])) == hash(RangeSet(["A1:B2"]))
+
+
+def test_cover_columns() -> None:
+    # two tall columns joined by a row are covered by three ranges.
+    rs = RangeSet(["A1:A100", "C1:C100", "A50:C50"])
+    assert len(rs.coalesce()) == 3
+    assert rs.cell_count == 201
+
+
+def test_sheets_are_separate() -> None:
+    rs1 = RangeSet.from_indexes([(0, 0, 1, 1)], sheet_idx=0)
+    rs2 = RangeSet.from_indexes([(0, 0, 1, 1)], sheet_idx=1)
+    assert (rs1 & rs2).cell_count == 0
+    assert (rs1 | rs2).sheet_indexes == (0, 1)
+    assert (rs1 | rs2).get_indexes() == [(0, 0, 0, 1, 1), (1, 0, 0, 1, 1)]
+    assert rs1.isdisjoint(rs2)
+
+
+def test_against_cell_sets() -> None:
+    rnd = random.Random(11)
+    for _ in range(40):
+        a_rects = _random_rects(rnd, rnd.randint(0, 12))
+        b_rects = _random_rects(rnd, rnd.randint(0, 12))
+        a = RangeSet.from_indexes(a_rects)
+        b = RangeSet.from_indexes(b_rects)
+        a_cells = _cells(a_rects)
+        b_cells = _cells(b_rects)
+        assert _set_cells(a) == a_cells
+        assert a.cell_count == len(a_cells)
+        assert _set_cells(a | b) == a_cells | b_cells
+        assert _set_cells(a & b) == a_cells & b_cells
+        assert _set_cells(a - b) == a_cells - b_cells
+        assert _set_cells(a ^ b) == a_cells ^ b_cells
+        assert (a <= b) == (a_cells <= b_cells)
+        assert (a | b) >= a
+        assert a.isdisjoint(b) == a_cells.isdisjoint(b_cells)
+        # cover has no overlapping ranges
+        assert sum((c1 - c0 + 1) * (r1 - r0 + 1) for _, c0, r0, c1, r1 in a.get_indexes()) == len(a_cells)
+        for cell in list(a_cells)[:20]:
+            assert a._contains_cell(-2, *cell)
+        # the set is canonical, built from its own cover it is equal
+        assert RangeSet.from_indexes([rect[1:] for rect in a.get_indexes()]) == a
+
+
+def test_union_many(capsys) -> None:
+    rnd = random.Random(3)
+    rects = _random_rects(rnd, 5000, size=2000)
+    start = time.perf_counter()
+    rs = RangeSet.from_indexes(rects)
+    other = RangeSet.from_indexes(_random_rects(rnd, 5000, size=2000))
+    result = (rs & other) | (rs - other)
+    cover = result.get_indexes()
+    elapsed = time.perf_counter() - start
+    assert result == rs
+    with capsys.disabled():
+        print(f"\n5,000 ranges: union, intersection and difference in {elapsed:.2f}s, {len(cover)} ranges in cover")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import random
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc.sheet.range_snapshot import RangeSnapshot
+from ooodev.utils.data_type.range_obj import RangeObj
+
+
+def test_diff_no_change() -> None:
+    values = ((1.0, "a"), (2.0, "b"))
+    snapshot = RangeSnapshot(values)
+    assert snapshot.diff([[1.0, "a"], [2.0, "b"]]) == []
+    assert snapshot.row_count == 2
+    assert snapshot.col_count == 2
+
+
+def test_diff_merges_rectangles() -> None:
+    values = [[0.0] * 5 for _ in range(5)]
+    snapshot = RangeSnapshot(values)
+    new = [list(row) for row in values]
+    for row in (1, 2):
+        for col in (1, 2, 3):
+            new[row][col] = 9.0
+    new[4][0] = "x"
+    patches = snapshot.diff(new)
+    assert len(patches) == 2
+    assert str(patches[0].range_obj) == "B2:D3"
+    assert patches[0].values == ((9.0, 9.0, 9.0), (9.0, 9.0, 9.0))
+    assert str(patches[1].range_obj) == "A5:A5"
+    assert patches[1].values == (("x",),)
+
+
+def test_diff_offset_and_size_change() -> None:
+    rng = RangeObj.from_range("C3:D4")
+    snapshot = RangeSnapshot(((1.0, 2.0), (3.0, 4.0)), rng)
+    patches = snapshot.diff(((1.0, 9.0, 5.0),))
+    assert [str(p.range_obj) for p in patches] == ["D3:E3", "C4:D4"]
+    assert patches[0].values == ((9.0, 5.0),)
+    # cells missing from the new values are cleared
+    assert patches[1].values == (("", ""),)
+
+    updated = snapshot.patch(patches)
+    assert updated.values == ((1.0, 9.0, 5.0), ("", "", ""))
+    assert str(updated.range_obj) == "C3:E4"
+
+
+def test_patch_round_trip() -> None:
+    rnd = random.Random(7)
+    values = [[float(rnd.randint(0, 3)) for _ in range(20)] for _ in range(30)]
+    snapshot = RangeSnapshot(values)
+    for _ in range(5):
+        new = [[float(rnd.randint(0, 3)) if rnd.random() < 0.1 else v for v in row] for row in values]
+        patches = snapshot.diff(new)
+        assert snapshot.patch(patches).values == tuple(tuple(row) for row in new)
+        covered = sum(p.range_obj.cell_count for p in patches)
+        assert covered == len(snapshot.diff_cells(new))
+
+
+def test_diff_1m_cells() -> None:
+    # 1000 x 1000 cells with a few hundred changes; equal rows are skipped in one comparison.
+    values = [[float(row * 1000 + col) for col in range(1000)] for row in range(1000)]
+    snapshot = RangeSnapshot(values)
+    rnd = random.Random(1)
+    new = [list(row) for row in values]
+    changed = set()
+    while len(changed) < 300:
+        pos = (rnd.randrange(1000), rnd.randrange(1000))
+        changed.add(pos)
+        new[pos[1]][pos[0]] = -1.0
+
+    start = time.perf_counter()
+    patches = snapshot.diff(new)
+    elapsed = time.perf_counter() - start
+    assert sum(p.range_obj.cell_count for p in patches) == len(changed)
+    assert snapshot.patch(patches).values == tuple(tuple(row) for row in new)
+    print(f"diff of 1M cells with {len(changed)} changes: {elapsed:.3f}s, {len(patches)} patches")
+
+
+def test_search() -> None:
+    rng = RangeObj.from_range("B2:D3")
+    snapshot = RangeSnapshot((("Apple", 3.0, ""), ("pineapple", 2.5, "APPLE pie")), rng)
+    assert snapshot.search("apple") == [(1, 1), (1, 2), (3, 2)]
+    assert snapshot.search("apple", match_case=True) == [(1, 2)]
+    assert snapshot.search("apple", whole_cell=True) == [(1, 1)]
+    assert snapshot.search("^3$") == [(2, 1)]
+    assert snapshot.search("2.5", regex=False) == [(2, 2)]
+    assert snapshot.search("2.5") == [(2, 2)]
+    assert snapshot.search("^$") == []
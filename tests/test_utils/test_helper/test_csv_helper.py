@@ -0,0 +1,89 @@
+from __future__ import annotations
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.helper.csv_helper import CsvHelper, CsvOptions
+
+
+def _write(tmp_path: Path, name: str, text: str) -> Path:
+    pth = tmp_path / name
+    with open(pth, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return pth
+
+
+def test_parse_block() -> None:
+    data = b'name,qty,when\r\n"a, b",1.5,2024-01-31\r\nc,-2e3,2024-01-31 12:00:00\r\nshort\r\n'
+    block = CsvHelper.parse_block(data)
+    assert block.values == (
+        ("name", "qty", "when"),
+        ("a, b", 1.5, 45322.0),
+        ("c", -2000.0, 45322.5),
+        ("short", "", ""),
+    )
+    assert block.date_columns == frozenset({2})
+    assert block.time_columns == frozenset({2})
+    assert block.row_count == 4
+    assert block.col_count == 3
+
+
+def test_parse_block_options() -> None:
+    data = b"1,5;2024-01-31;nan;007\n"
+    block = CsvHelper.parse_block(data, CsvOptions(delimiter=";", decimal=",", convert_dates=False))
+    assert block.values == ((1.5, "2024-01-31", "nan", 7.0),)
+    assert not block.date_columns
+
+    block = CsvHelper.parse_block(data, CsvOptions(delimiter=";", convert_numbers=False))
+    assert block.values == (("1,5", 45322.0, "nan", "007"),)
+
+
+def test_iter_raw_blocks_quoted_line_breaks(tmp_path: Path) -> None:
+    pth = _write(tmp_path, "data.csv", '﻿h1,h2\r\n"multi\r\nline",1\r\n"say ""hi""",2\r\nx,3\r\n')
+    blocks = list(CsvHelper.iter_raw_blocks(pth, chunk_rows=2))
+    assert [records for _, records, _ in blocks] == [2, 2]
+    assert sum(byte_count for _, _, byte_count in blocks) == pth.stat().st_size
+    assert not blocks[0][0].startswith(b"\xef\xbb\xbf")
+
+    blocks = list(CsvHelper.iter_raw_blocks(pth, chunk_rows=10, skip_rows=2))
+    assert len(blocks) == 1
+    assert blocks[0][1] == 2
+    assert blocks[0][0].startswith(b'"say')
+
+    with pytest.raises(ValueError):
+        list(CsvHelper.iter_raw_blocks(pth, chunk_rows=0))
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_iter_blocks(tmp_path: Path, max_workers: int) -> None:
+    rows = [f"{i},name {i},2024-01-{(i % 28) + 1:02d}" for i in range(25)]
+    pth = _write(tmp_path, "data.csv", "\n".join(rows) + "\n")
+    blocks = list(CsvHelper.iter_blocks(pth, chunk_rows=10, max_workers=max_workers))
+    assert [b.index for b in blocks] == [0, 1, 2]
+    assert [b.row_offset for b in blocks] == [0, 10, 20]
+    assert [b.row_count for b in blocks] == [10, 10, 5]
+    values = [row for b in blocks for row in b.values]
+    assert [row[0] for row in values] == [float(i) for i in range(25)]
+    assert values[24][1] == "name 24"
+    assert all(b.date_columns == frozenset({2}) for b in blocks)
+
+
+def test_get_delimiter() -> None:
+    assert CsvHelper.get_delimiter("data.tsv") == "\t"
+    assert CsvHelper.get_delimiter("data.TAB") == "\t"
+    assert CsvHelper.get_delimiter("data.csv") == ","
+
+
+def test_format_row() -> None:
+    row = (3.0, 2.5, "text", "", 45322.0, 45322.5)
+    assert CsvHelper.format_row(row) == [3, 2.5, "text", "", 45322, 45322.5]
+    assert CsvHelper.format_row(row, date_columns=(4, 5)) == [3, 2.5, "text", "", "2024-01-31", "2024-01-31 12:00:00"]
+
+
+def test_serial_to_datetime() -> None:
+    assert CsvHelper.serial_to_datetime(0.0) == datetime(1899, 12, 30)
+    assert CsvHelper.serial_to_datetime(45322.75) == datetime(2024, 1, 31, 18, 0, 0)
+    assert CsvHelper.serial_to_datetime(1.0, datetime(1904, 1, 1)) == datetime(1904, 1, 2)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from datetime import datetime
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from ooodev.utils.helper.dataframe_helper import DataFrameHelper
+
+
+def test_table_to_dataframe() -> None:
+    tbl = (("Name", "Qty", "When", ""), ("a", 1.0, 45000.5, ""), ("b", "", 45001.0, 2.0))
+    df = DataFrameHelper.table_to_dataframe(tbl, date_columns=[2])
+    assert list(df.columns) == ["Name", "Qty", "When", "Unnamed: 3"]
+    assert df["Qty"].dtype == np.float64
+    assert np.isnan(df["Qty"][1])
+    assert df["When"][0] == pd.Timestamp(2023, 3, 15, 12)
+    assert df["When"][1] == pd.Timestamp(2023, 3, 16)
+    assert list(df["Name"]) == ["a", "b"]
+
+
+def test_table_to_dataframe_no_header() -> None:
+    df = DataFrameHelper.table_to_dataframe(((1.0, "x"), (2.0, "")), header=False)
+    assert list(df.columns) == [0, 1]
+    assert df[0].tolist() == [1.0, 2.0]
+    assert pd.isna(df[1][1])
+
+
+def test_table_to_dataframe_null_date() -> None:
+    df = DataFrameHelper.table_to_dataframe((("d",), (1.0,)), date_columns=[0], null_date=datetime(1904, 1, 1))
+    assert df["d"][0] == pd.Timestamp(1904, 1, 2)
+
+
+def test_table_to_dataframe_header_only() -> None:
+    df = DataFrameHelper.table_to_dataframe((("a", "b"),))
+    assert list(df.columns) == ["a", "b"]
+    assert len(df) == 0
+
+
+def test_dataframe_to_blocks() -> None:
+    df = pd.DataFrame(
+        {
+            "i": [1, 2],
+            "f": [1.5, np.nan],
+            "s": ["x", None],
+            "d": pd.to_datetime(["2023-03-15 12:00", None]),
+            "n": [True, False],
+        }
+    )
+    blocks = DataFrameHelper.dataframe_to_blocks(df)
+    assert [(b.col, b.kind, b.col_count) for b in blocks] == [
+        (0, "number", 2),
+        (2, "text", 1),
+        (3, "date", 1),
+        (4, "number", 1),
+    ]
+    assert blocks[0].values == ((1.0, 1.5), (2.0, ""))
+    assert blocks[1].values == (("x",), ("",))
+    assert blocks[2].values == ((45000.5,), ("",))
+    assert blocks[2].has_time
+    assert blocks[3].values == ((1.0,), (0.0,))
+    assert DataFrameHelper.get_header_row(df) == (("i", "f", "s", "d", "n"),)
+
+
+def test_dataframe_round_trip() -> None:
+    df = pd.DataFrame({"a": [1.0, 2.0], "d": pd.to_datetime(["2024-01-01", "2024-02-01"])})
+    blocks = DataFrameHelper.dataframe_to_blocks(df)
+    tbl = DataFrameHelper.get_header_row(df) + tuple(
+        tuple(v for b in blocks for v in b.values[i]) for i in range(len(df))
+    )
+    df2 = DataFrameHelper.table_to_dataframe(tbl, date_columns=[1])
+    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+np = pytest.importorskip("numpy")
+
+from ooodev.utils.helper.ndarray_helper import NdArrayHelper
+
+
+def test_table_to_ndarray() -> None:
+    tbl = ((1.0, 2.0, 3.0), (4.0, "", "text"), (7.0, 8.0, 9.0))
+    arr = NdArrayHelper.table_to_ndarray(tbl)
+    assert arr.shape == (3, 3)
+    assert arr.dtype == np.float64
+    assert arr[0].tolist() == [1.0, 2.0, 3.0]
+    assert arr[1, 0] == 4.0
+    assert np.isnan(arr[1, 1])
+    assert np.isnan(arr[1, 2])
+
+
+def test_table_to_ndarray_mask() -> None:
+    tbl = ((1.0, "a"), ("", 4.0))
+    arr, mask = NdArrayHelper.table_to_ndarray(tbl, with_mask=True)
+    assert mask.tolist() == [[False, True], [True, False]]
+    assert arr[0, 0] == 1.0
+    assert arr[1, 1] == 4.0
+
+
+def test_table_to_ndarray_dtype() -> None:
+    tbl = ((1.0, "a"), (3.0, 4.0))
+    arr = NdArrayHelper.table_to_ndarray(tbl, dtype=np.int32)
+    assert arr.dtype == np.int32
+    assert arr.tolist() == [[1, 0], [3, 4]]
+
+    arr = NdArrayHelper.table_to_ndarray(tbl, dtype="float32")
+    assert arr.dtype == np.float32
+    assert np.isnan(arr[0, 1])
+
+
+def test_table_to_ndarray_numeric_text() -> None:
+    # text that looks like a number is still text in a cell.
+    arr = NdArrayHelper.table_to_ndarray((("1.5", 2.0),))
+    assert np.isnan(arr[0, 0])
+    assert arr[0, 1] == 2.0
+
+
+def test_table_to_ndarray_empty() -> None:
+    arr = NdArrayHelper.table_to_ndarray(())
+    assert arr.shape == (0, 0)
+
+
+def test_ndarray_to_table() -> None:
+    arr = np.array([[1.0, np.nan], [3.0, 4.0]])
+    tbl = NdArrayHelper.ndarray_to_table(arr)
+    assert tbl == ((1.0, ""), (3.0, 4.0))
+    assert type(tbl[1][1]) is float
+
+    tbl = NdArrayHelper.ndarray_to_table(np.arange(4, dtype=np.int64).reshape(2, 2))
+    assert tbl == ((0, 1), (2, 3))
+    assert type(tbl[0][0]) is int
+
+    tbl = NdArrayHelper.ndarray_to_table(np.array([[True, False]]))
+    assert tbl == ((1.0, 0.0),)
+
+
+def test_ndarray_to_table_ndim() -> None:
+    with pytest.raises(ValueError):
+        NdArrayHelper.ndarray_to_table(np.arange(4))
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from datetime import datetime
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pa = pytest.importorskip("pyarrow")
+
+from ooodev.utils.helper.parquet_helper import ParquetHelper
+
+
+def test_get_column_names() -> None:
+    assert ParquetHelper.get_column_names(("a", "", 2.0, "a", "a")) == ["a", "Unnamed: 1", "2", "a.1", "a.2"]
+
+
+def test_get_column_kinds() -> None:
+    tbl = ((1.0, "x", 45322.0, ""), ("", 2.0, 45323.0, ""))
+    assert ParquetHelper.get_column_kinds(tbl, date_columns=(2,)) == ["number", "text", "date", "text"]
+    assert ParquetHelper.get_column_kinds(()) == []
+
+
+def test_table_to_arrow() -> None:
+    tbl = ((1.0, "x", 45322.5), ("", 2.0, "bad"))
+    kinds = ParquetHelper.get_column_kinds(tbl[:1], date_columns=(2,))
+    schema = ParquetHelper.get_schema(["n", "t", "d"], kinds)
+    table = ParquetHelper.table_to_arrow(tbl, schema, kinds)
+    assert table.schema == schema
+    assert table.column("n").to_pylist() == [1.0, None]
+    assert table.column("t").to_pylist() == ["x", "2"]
+    assert table.column("d").to_pylist() == [datetime(2024, 1, 31, 12), None]
+    assert ParquetHelper.table_to_arrow((), schema, kinds).num_rows == 0
+
+
+def test_get_text_columns() -> None:
+    tbl = ((1.0, "x", 45322.0, ""), ("a", 2.0, "", 3.0))
+    kinds = ["number", "text", "date", "number"]
+    assert ParquetHelper.get_text_columns(tbl, kinds) == [0]
+    assert ParquetHelper.get_text_columns(tbl[1:], ["number", "number", "date", "number"]) == [0]
+    assert ParquetHelper.get_text_columns((), kinds) == []
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.table_helper import TableHelper
+
+
+def _col_name(col: int) -> str:
+    # reference implementation, col is one based.
+    name = ""
+    while col:
+        col, mod = divmod(col - 1, 26)
+        name = chr(mod + 65) + name
+    return name
+
+
+def test_column_tables() -> None:
+    for col in (1, 26, 27, 52, 702, 703, 16383, 16384):
+        name = _col_name(col)
+        assert TableHelper.make_column_name(col) == name
+        assert TableHelper.make_column_name(col - 1, True) == name
+        assert TableHelper.col_name_to_int(name) == col
+        assert TableHelper.col_name_to_int(name.lower(), True) == col - 1
+    assert TableHelper.make_column_name(16384) == "XFD"
+    # columns past the last Calc column are still calculated.
+    assert TableHelper.make_column_name(16385) == "XFE"
+    assert TableHelper.col_name_to_int("XFE") == 16385
+    assert TableHelper.col_name_to_int("AB12") == 28
+    with pytest.raises(ValueError):
+        TableHelper.make_column_name(0)
+    with pytest.raises(ValueError):
+        TableHelper.col_name_to_int("A-")
+    with pytest.raises(ValueError):
+        TableHelper.col_name_to_int("ABCDEF")
+
+
+def test_parse_cache() -> None:
+    parts = TableHelper.get_range_parts("Sheet1.$D$12:B3")
+    assert str(parts) == "Sheet1.B3:D12"
+    assert TableHelper.get_range_parts("Sheet1.$D$12:B3") is parts
+    cell = TableHelper.get_cell_parts("sheet2.b4:Z900")
+    assert (cell.sheet, cell.col, cell.row) == ("sheet2", "B", 4)
+    assert TableHelper.get_cell_parts("sheet2.b4:Z900") is cell
+    # errors are not cached
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            TableHelper.get_cell_parts("Sheet1.B")
+        with pytest.raises(ValueError):
+            TableHelper.get_range_parts("")
+
+
+def test_parse_cache_threads() -> None:
+    names = [
+        f"Sheet1.{_col_name(i % 500 + 1)}{i % 900 + 1}:{_col_name(i % 700 + 501)}{i % 900 + 901}" for i in range(5000)
+    ]
+    expected = [str(TableHelper.get_range_parts(name)) for name in names]
+    errors = []
+
+    def run() -> None:
+        try:
+            for name, exp in zip(names, expected):
+                if str(TableHelper.get_range_parts(name)) != exp:
+                    errors.append(name)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_parse_benchmark() -> None:
+    # one million mixed cell and range names, most of them repeated like in a loop of set_val() calls.
+    names = []
+    for i in range(1000):
+        col = _col_name(i % 60 + 1)
+        names.append(f"{col}{i + 1}")
+        names.append(f"Sheet1.{col}{i + 1}:Z{i + 900}")
+    count = 1_000_000
+    start = time.perf_counter()
+    for i in range(count // len(names)):
+        for name in names:
+            if ":" in name:
+                TableHelper.get_range_parts(name)
+            else:
+                TableHelper.get_cell_parts(name)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for col in range(count):
+        TableHelper.make_column_name(col % 16384, True)
+    col_elapsed = time.perf_counter() - start
+    print(f"\n{count:,} names parsed in {elapsed:.3f}s, {count:,} column names made in {col_elapsed:.3f}s")
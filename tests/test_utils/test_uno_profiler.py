@@ -0,0 +1,133 @@
+from __future__ import annotations
+import json
+import pstats
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils import uno_profiler
+from ooodev.utils.uno_profiler import UnoProfiler, profiled
+
+
+@profiled("Test.inner")
+def _inner(value: int) -> int:
+    if value < 0:
+        raise ValueError("negative")
+    return value * 2
+
+
+@profiled("Test.outer")
+def _outer(value: int) -> int:
+    return _inner(value) + _inner(value)
+
+
+def _site_a() -> int:
+    return _inner(1)
+
+
+def _site_b() -> int:
+    return _inner(2) + _inner(3)
+
+
+def test_not_running() -> None:
+    assert uno_profiler._active is None
+    prof = UnoProfiler()
+    assert _inner(2) == 4
+    assert prof.calls == 0
+    assert prof.get_stats() == []
+
+
+def test_by_site() -> None:
+    with UnoProfiler() as prof:
+        assert prof.running
+        _site_a()
+        _site_b()
+        with pytest.raises(ValueError):
+            _inner(-1)
+    assert not prof.running
+    assert uno_profiler._active is None
+    _site_a()
+    assert prof.calls == 4
+    stats = {stat.site[2]: stat for stat in prof.get_stats()}
+    assert stats["_site_a"].calls == 1
+    assert stats["_site_b"].calls == 2
+    assert stats["test_by_site"].errors == 1
+    assert all(stat.name == "Test.inner" for stat in stats.values())
+
+    data = json.loads(prof.to_json())
+    assert data["calls"] == 4
+    assert {stat["site"].rsplit("(", 1)[1] for stat in data["stats"]} == {
+        "_site_a)",
+        "_site_b)",
+        "test_by_site)",
+    }
+    prof.reset()
+    assert prof.calls == 0
+
+
+def test_nested_own_time() -> None:
+    with UnoProfiler() as prof:
+        _outer(1)
+    stats = {stat.name: stat for stat in prof.get_stats()}
+    assert stats["Test.inner"].calls == 2
+    assert stats["Test.outer"].calls == 1
+    assert stats["Test.inner"].site[2] == "_outer"
+    assert stats["Test.outer"].site[2] == "test_nested_own_time"
+    outer = stats["Test.outer"]
+    assert outer.own == pytest.approx(outer.total - stats["Test.inner"].total)
+    assert prof.total == pytest.approx(outer.total)
+
+
+def test_nested_profilers() -> None:
+    with UnoProfiler() as outer:
+        _inner(1)
+        with UnoProfiler() as inner:
+            _inner(1)
+        _inner(1)
+    assert outer.calls == 2
+    assert inner.calls == 1
+    with pytest.raises(RuntimeError):
+        with outer:
+            outer.start()
+
+
+def test_pstats(tmp_path_fn) -> None:
+    with UnoProfiler() as prof:
+        _site_a()
+        _site_b()
+        _outer(1)
+    stats = pstats.Stats(prof)
+    assert stats.total_calls == prof.calls  # type: ignore
+    func = ("~", 0, "<ooodev Test.inner>")
+    cc, nc, tt, ct, callers = stats.stats[func]  # type: ignore
+    assert nc == 5
+    assert len(callers) == 3
+
+    fnm = tmp_path_fn / "uno.prof"
+    prof.dump_stats(str(fnm))
+    loaded = pstats.Stats(str(fnm))
+    assert loaded.stats[func][1] == 5  # type: ignore
+
+
+def test_stop_out_of_order() -> None:
+    first = UnoProfiler()
+    second = UnoProfiler()
+    first.start()
+    second.start()
+    first.stop()
+    assert uno_profiler._active is second
+    _inner(1)
+    second.stop()
+    assert uno_profiler._active is None
+    _inner(1)
+    assert first.calls == 0
+    assert second.calls == 1
+
+    with UnoProfiler() as outer:
+        first.start()
+        second.start()
+        first.stop()
+        second.stop()
+        assert uno_profiler._active is outer
+    assert uno_profiler._active is None